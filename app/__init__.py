@@ -5,7 +5,7 @@ from dotenv import load_dotenv
 
 # import secrets
 from app.extensions import init_extensions
-from app.extensions.db import db
+from app.extensions.db import engine_options
 from app.modules import init_modules
 from app.modules.user.models import UserModel
 from app.modules.task.models import TaskModel, CategoryModel
@@ -19,11 +19,47 @@ def create_app(db_url=None):
         "DATABASE_URL", "sqlite:///data.db"
     )
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(
+        app.config["SQLALCHEMY_DATABASE_URI"]
+    )
     app.config["JWT_SECRET_KEY"] = os.getenv("JWT_SECRET_KEY")
+    app.config["PASSWORD_HASH_METHOD"] = (
+        os.getenv("PASSWORD_HASH_METHOD") or "pbkdf2:sha256"
+    )
+    app.config["PASSWORD_HASH_WORKERS"] = int(os.getenv("PASSWORD_HASH_WORKERS") or 4)
+    app.config["SQLITE_TUNING"] = os.getenv("SQLITE_TUNING", "1") != "0"
+    app.config["SQLITE_SINGLE_WRITER"] = (
+        os.getenv("SQLITE_SINGLE_WRITER") or "0"
+    ) != "0"
+    app.config["SQLITE_BUSY_TIMEOUT_MS"] = int(
+        os.getenv("SQLITE_BUSY_TIMEOUT_MS") or 5000
+    )
+    app.config["SQLITE_MMAP_SIZE"] = int(os.getenv("SQLITE_MMAP_SIZE") or 268435456)
+    app.config["SQLITE_CACHE_SIZE"] = int(os.getenv("SQLITE_CACHE_SIZE") or -64000)
+    app.config["CACHE_TYPE"] = os.getenv("CACHE_TYPE") or "memory"
+    app.config["CACHE_REDIS_URL"] = os.getenv("CACHE_REDIS_URL")
+    app.config["CACHE_MAXSIZE"] = int(os.getenv("CACHE_MAXSIZE") or 1024)
+    app.config["CACHE_DEFAULT_TIMEOUT"] = int(os.getenv("CACHE_DEFAULT_TIMEOUT") or 300)
+    app.config["CACHE_KEY_PREFIX"] = os.getenv("CACHE_KEY_PREFIX") or "todo:"
+    app.config["TASK_STATS_SUMMARY"] = (os.getenv("TASK_STATS_SUMMARY") or "0") != "0"
+    app.config["TASK_STREAM_BUFFER"] = int(os.getenv("TASK_STREAM_BUFFER") or 100)
+    app.config["TASK_STREAM_HEARTBEAT"] = float(
+        os.getenv("TASK_STREAM_HEARTBEAT") or 15
+    )
+    app.config["INSTRUMENTATION"] = (os.getenv("INSTRUMENTATION") or "0") != "0"
+    app.config["PROFILE_SAMPLE_RATE"] = float(os.getenv("PROFILE_SAMPLE_RATE") or 0)
+    app.config["PROFILE_SLOW_MS"] = int(os.getenv("PROFILE_SLOW_MS") or 500)
+    app.config["PROFILE_DIR"] = os.getenv("PROFILE_DIR") or "profiles"
+    app.config["API_DOCS_PATH"] = os.getenv("API_DOCS_PATH")
+    app.config["PURGE_INLINE_LIMIT"] = int(os.getenv("PURGE_INLINE_LIMIT") or 1000)
+    app.config["PURGE_CHUNK_SIZE"] = int(os.getenv("PURGE_CHUNK_SIZE") or 1000)
+    app.config["JOB_WORKER_CONCURRENCY"] = int(
+        os.getenv("JOB_WORKER_CONCURRENCY") or os.cpu_count()
+    )
+    app.config["JOB_POLL_INTERVAL"] = float(os.getenv("JOB_POLL_INTERVAL") or 1)
+    app.config["JOB_LEASE_SECONDS"] = int(os.getenv("JOB_LEASE_SECONDS") or 60)
+    app.config["JOB_RETRY_DELAY"] = float(os.getenv("JOB_RETRY_DELAY") or 10)
     init_extensions(app)
     init_modules(app)
 
-    with app.app_context():
-        db.create_all()
-
     return app
@@ -0,0 +1,48 @@
+import contextlib
+
+from marshmallow import ValidationError
+from starlette.applications import Starlette
+from starlette.middleware.wsgi import WSGIMiddleware
+from starlette.routing import Mount
+
+from app import create_app
+from app.asgi.db import create_sessionmaker
+from app.asgi.routes import routes
+from app.asgi.utils import validation_error_handler
+
+
+def create_asgi_app(db_url=None):
+    """
+    Create the ASGI application.
+
+    The JSON API routes are served by coroutines running on SQLAlchemy's
+    asyncio engine, so a worker keeps serving other requests while one waits
+    on the database or on password hashing. They share models, schemas,
+    query helpers, JWT settings and cache invalidation with the Flask app.
+    Every other path (API docs, health check, CLI-only features) is passed
+    to the Flask app unchanged.
+
+    Run with `uvicorn --factory app.asgi:create_asgi_app`.
+
+    Args:
+        db_url (str): Database URL, as for `create_app` (optional).
+
+    Returns:
+        Starlette: The ASGI application.
+    """
+    flask_app = create_app(db_url)
+    sessionmaker = create_sessionmaker(flask_app.config)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
+        yield
+        await sessionmaker.kw["bind"].dispose()
+
+    app = Starlette(
+        routes=[*routes, Mount("/", app=WSGIMiddleware(flask_app))],
+        exception_handlers={ValidationError: validation_error_handler},
+        lifespan=lifespan,
+    )
+    app.state.flask_app = flask_app
+    app.state.sessionmaker = sessionmaker
+    return app
@@ -0,0 +1,60 @@
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.extensions.db import engine_options
+from app.extensions.sqlite import (
+    enforce_foreign_keys,
+    is_file_database,
+    is_sqlite,
+    tune_engine,
+)
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def async_database_url(database_uri):
+    """
+    Translate a database URL to the matching asyncio driver.
+
+    Args:
+        database_uri (str): The URL used by the WSGI app.
+
+    Returns:
+        URL: The same database, reached through aiosqlite or asyncpg.
+
+    Raises:
+        ValueError: If there is no asyncio driver for the database.
+    """
+    url = make_url(database_uri)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No asyncio driver for '{backend}' databases.")
+    return url.set(drivername=ASYNC_DRIVERS[backend])
+
+
+def create_sessionmaker(config):
+    """
+    Build the asyncio engine and session factory for the app configuration.
+
+    The engine gets the same pool settings and SQLite profile as the WSGI
+    engine.
+
+    Args:
+        config (dict): The Flask app configuration.
+
+    Returns:
+        async_sessionmaker: Factory of `AsyncSession` objects.
+    """
+    database_uri = config["SQLALCHEMY_DATABASE_URI"]
+    engine = create_async_engine(
+        async_database_url(database_uri),
+        **engine_options(database_uri, asyncio=True),
+    )
+    if is_sqlite(database_uri):
+        enforce_foreign_keys(engine.sync_engine)
+    if is_file_database(database_uri):
+        tune_engine(engine.sync_engine, config, single_writer=False)
+    return async_sessionmaker(engine, expire_on_commit=False)
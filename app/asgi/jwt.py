@@ -0,0 +1,70 @@
+import functools
+
+from flask_jwt_extended import create_access_token, decode_token
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt import ExpiredSignatureError, InvalidTokenError
+from starlette.responses import JSONResponse
+
+from app.extensions.jwt.jwt import (
+    expired_token_callback,
+    invalid_token_callback,
+    missing_token_callback,
+)
+
+
+def _to_response(result):
+    # The JWT error callbacks return `(flask_response, status)`.
+    response, status = result
+    return JSONResponse(response.get_json(), status_code=status)
+
+
+def jwt_required(handler):
+    """
+    Require a valid access token, with the same rules and error payloads as
+    `flask_jwt_extended.jwt_required()`.
+
+    Tokens are decoded by flask-jwt-extended inside the Flask app context, so
+    both serving paths accept exactly the same tokens. The decoded claims are
+    stored on `request.state.jwt`.
+    """
+
+    @functools.wraps(handler)
+    async def wrapper(request):
+        flask_app = request.app.state.flask_app
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+
+        with flask_app.app_context():
+            if scheme != "Bearer" or not token:
+                return _to_response(
+                    missing_token_callback("Missing Authorization Header")
+                )
+            try:
+                claims = decode_token(token)
+            except ExpiredSignatureError:
+                return _to_response(expired_token_callback({}, {}))
+            except (InvalidTokenError, JWTExtendedException) as e:
+                return _to_response(invalid_token_callback(str(e)))
+
+        if claims.get("type") != "access":
+            return JSONResponse({"msg": "Only non-refresh tokens are allowed"}, 422)
+
+        request.state.jwt = claims
+        return await handler(request)
+
+    return wrapper
+
+
+def get_jwt(request):
+    """Return the claims of the token of the current request."""
+    return request.state.jwt
+
+
+def get_jwt_identity(request):
+    """Return the identity (user ID) of the token of the current request."""
+    return request.state.jwt["sub"]
+
+
+def issue_access_token(request, user):
+    """Create an access token for `user`, as `LoginView` does."""
+    with request.app.state.flask_app.app_context():
+        return create_access_token(identity=user)
@@ -0,0 +1,34 @@
+from starlette.routing import Route
+
+from app.asgi.views import auth, job, task, user
+
+routes = [
+    Route("/auth/sign-up/", auth.sign_up, methods=["POST"]),
+    Route("/auth/login/", auth.login, methods=["POST"]),
+    Route("/user/", user.list_users, methods=["GET"]),
+    Route("/user/{user_id:int}/", user.get_user, methods=["GET"]),
+    Route("/user/{user_id:int}/", user.update_user, methods=["PUT"]),
+    Route("/user/{user_id:int}/", user.delete_user, methods=["DELETE"]),
+    Route("/user/{user_id:int}/purge/", user.get_user_purge, methods=["GET"]),
+    Route("/category/", task.list_categories, methods=["GET"]),
+    Route("/category/", task.create_category, methods=["POST"]),
+    Route("/category/{category_id:int}/", task.get_category, methods=["GET"]),
+    Route("/category/{category_id:int}/", task.delete_category, methods=["DELETE"]),
+    Route(
+        "/category/{category_id:int}/purge/",
+        task.get_category_purge,
+        methods=["GET"],
+    ),
+    Route("/task/", task.list_tasks, methods=["GET"]),
+    Route("/task/", task.create_task, methods=["POST"]),
+    Route("/task/batch/", task.batch_tasks, methods=["POST"]),
+    Route("/task/stream/", task.stream_tasks, methods=["GET"]),
+    Route("/task/changes/", task.list_changes, methods=["GET"]),
+    Route("/task/search/", task.search, methods=["GET"]),
+    Route("/task/stats/", task.stats, methods=["GET"]),
+    Route("/task/export/", task.export, methods=["GET"]),
+    Route("/task/{task_id:int}/", task.get_task, methods=["GET"]),
+    Route("/task/{task_id:int}/", task.update_task, methods=["PUT"]),
+    Route("/task/{task_id:int}/", task.delete_task, methods=["DELETE"]),
+    Route("/job/{job_id:int}/", job.get_job, methods=["GET"]),
+]
@@ -0,0 +1,47 @@
+import json
+
+from marshmallow import EXCLUDE, ValidationError
+from starlette.responses import JSONResponse, Response
+from werkzeug.http import generate_etag, parse_etags, quote_etag
+
+
+def message(text, status_code):
+    """Return a `MessageSchema` shaped response."""
+    return JSONResponse({"message": text}, status_code=status_code)
+
+
+async def load_json(request, schema):
+    """
+    Load the JSON body of `request` with `schema`.
+
+    Raises:
+        ValidationError: If the body is not JSON or does not validate.
+    """
+    try:
+        data = await request.json()
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        raise ValidationError(["Invalid JSON body."], "json")
+    return schema.load(data)
+
+
+def load_query(request, schema):
+    """Load the query string of `request` with `schema`, ignoring unknown keys."""
+    return schema.load(dict(request.query_params), unknown=EXCLUDE)
+
+
+def conditional_json(request, data):
+    """
+    Return `data` as JSON with an ETag, or 304 if the client already has it.
+    """
+    response = JSONResponse(data)
+    etag = generate_etag(response.body)
+    if parse_etags(request.headers.get("If-None-Match")).contains(etag):
+        return Response(status_code=304, headers={"ETag": quote_etag(etag)})
+    response.headers["ETag"] = quote_etag(etag)
+    return response
+
+
+async def validation_error_handler(request, exc):
+    return JSONResponse(
+        {"message": "Unprocessable Entity", "errors": exc.messages}, status_code=422
+    )
@@ -0,0 +1,67 @@
+from sqlalchemy import or_, select
+from starlette.responses import JSONResponse
+
+from app.asgi.jwt import issue_access_token
+from app.asgi.utils import load_json, message
+from app.extensions.hashing import hasher
+from app.modules.auth.schemas import LoginViewRequestSchema, SignUpRequestSchema
+from app.modules.user.models import UserModel
+
+
+async def sign_up(request):
+    """
+    Sign up a new user, as `SignUpView.post`.
+
+    Returns:
+        201: If the user is created successfully.
+        409: If the user with the provided username or email already exists.
+    """
+    data = await load_json(request, SignUpRequestSchema())
+
+    async with request.app.state.sessionmaker() as session:
+        existing = await session.scalar(
+            select(UserModel.id)
+            .where(
+                or_(
+                    UserModel.username == data["username"],
+                    UserModel.email == data["email"],
+                )
+            )
+            .limit(1)
+        )
+        if existing is not None:
+            return message("User already exists", 409)
+
+        session.add(
+            UserModel(
+                username=data["username"],
+                email=data["email"],
+                password=await hasher.hash_async(data["password"]),
+            )
+        )
+        await session.commit()
+    return message("User created successfully", 201)
+
+
+async def login(request):
+    """
+    Log in a user and return an access token, as `LoginView.post`.
+
+    Returns:
+        200: If the login is successful, with an access token.
+        401: If the credentials are invalid.
+    """
+    data = await load_json(request, LoginViewRequestSchema())
+
+    async with request.app.state.sessionmaker() as session:
+        user = await session.scalar(
+            select(UserModel).where(UserModel.username == data["username"])
+        )
+        if not user or not await hasher.verify_async(user.password, data["password"]):
+            return message("Invalid credentials", 401)
+
+        if hasher.needs_rehash(user.password):
+            user.password = await hasher.hash_async(data["password"])
+            await session.commit()
+
+    return JSONResponse({"access_token": issue_access_token(request, user)})
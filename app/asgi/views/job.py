@@ -0,0 +1,20 @@
+from starlette.responses import JSONResponse
+
+from app.asgi.jwt import get_jwt, get_jwt_identity, jwt_required
+from app.asgi.utils import message
+from app.modules.job.models import JobModel
+from app.modules.job.schemas import JobSchema
+
+job_schema = JobSchema()
+
+
+@jwt_required
+async def get_job(request):
+    """Retrieve a background job, as `JobView.get`."""
+    async with request.app.state.sessionmaker() as session:
+        job = await session.get(JobModel, request.path_params["job_id"])
+    if not job:
+        return message("Job not found", 404)
+    if get_jwt(request)["role"] != "admin" and job.user_id != get_jwt_identity(request):
+        return message("Access denied", 403)
+    return JSONResponse(job_schema.dump(job))
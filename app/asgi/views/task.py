@@ -0,0 +1,446 @@
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
+from starlette.responses import JSONResponse, StreamingResponse
+
+from app.asgi.jwt import get_jwt, get_jwt_identity, jwt_required
+from app.asgi.utils import conditional_json, load_json, load_query, message
+from app.common.pagination import seek, split_page
+from app.common.signals import category_changed, tasks_changed
+from app.modules.job.schemas import JobSchema
+from app.modules.task.batch import plan_batch
+from app.modules.task.export import EXPORT_FORMATS, export_tasks_async
+from app.modules.task.models import CategoryModel, TaskModel
+from app.modules.task.purge import (
+    count_tasks,
+    delete_entity,
+    latest_purge,
+    send_delete_signals,
+    start_purge,
+)
+from app.modules.task.queries import TASK_SORT_COLUMNS, filter_tasks
+from app.modules.task.search import search_tasks, split_search_page
+from app.modules.task.stats import live_stats, summary_stats
+from app.modules.task.stream import AsyncSubscription, change_feed
+from app.modules.task.sync import changes_since
+from app.modules.task.writes import (
+    delete_owned_task,
+    find_owned_task,
+    miss_status,
+    update_owned_task,
+)
+from app.modules.task.schemas import (
+    CategorySchema,
+    TaskBatchRequestSchema,
+    TaskChangesQuerySchema,
+    TaskChangesResponseSchema,
+    TaskExportQuerySchema,
+    TaskListQuerySchema,
+    TaskListResponseSchema,
+    TaskSearchQuerySchema,
+    TaskStatsSchema,
+    TaskViewPostRequestSchema,
+    TaskViewPutRequestSchema,
+    TaskViewResponseSchema,
+)
+
+category_schema = CategorySchema()
+category_list_schema = CategorySchema(many=True)
+job_schema = JobSchema()
+task_schema = TaskViewResponseSchema()
+task_list_schema = TaskListResponseSchema()
+task_changes_schema = TaskChangesResponseSchema()
+task_stats_schema = TaskStatsSchema()
+
+
+@jwt_required
+async def list_categories(request):
+    """Retrieve all categories, as `CategoryListView.get`."""
+    async with request.app.state.sessionmaker() as session:
+        categories = (await session.scalars(select(CategoryModel))).all()
+    return conditional_json(request, category_list_schema.dump(categories))
+
+
+@jwt_required
+async def get_category(request):
+    """Retrieve category information, as `CategoryView.get`."""
+    async with request.app.state.sessionmaker() as session:
+        category = await session.get(CategoryModel, request.path_params["category_id"])
+    if not category:
+        return message("Category not found", 404)
+    return conditional_json(request, category_schema.dump(category))
+
+
+@jwt_required
+async def create_category(request):
+    """Create a new category, as `CategoryView.post`."""
+    data = await load_json(request, CategorySchema())
+    if get_jwt(request)["role"] != "admin":
+        return message("Admin access required", 403)
+
+    new_category = CategoryModel(**data)
+    async with request.app.state.sessionmaker() as session:
+        try:
+            session.add(new_category)
+            await session.commit()
+        except Exception as e:
+            return message(f"An error occurred: {str(e)}", 500)
+
+    category_changed.send(
+        request.app.state.flask_app, action="create", category_id=new_category.id
+    )
+    return message(f"Category created successfully, task_id: {new_category.id}", 201)
+
+
+@jwt_required
+async def delete_category(request):
+    """Delete a category, as `CategoryView.delete`."""
+    category_id = request.path_params["category_id"]
+    if get_jwt(request)["role"] != "admin":
+        return message("Admin access required", 403)
+
+    flask_app = request.app.state.flask_app
+    async with request.app.state.sessionmaker() as session:
+        total = await session.run_sync(count_tasks, "category", category_id)
+        if total > flask_app.config["PURGE_INLINE_LIMIT"]:
+            job = await session.run_sync(
+                start_purge,
+                "category",
+                category_id,
+                total,
+                flask_app.config["PURGE_CHUNK_SIZE"],
+                get_jwt_identity(request),
+            )
+            return JSONResponse(job_schema.dump(job), 202)
+
+        try:
+            changes = await session.run_sync(delete_entity, "category", category_id)
+            if changes is None:
+                return message("Category not found", 404)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            return message(f"An error occurred: {str(e)}", 500)
+
+    send_delete_signals(flask_app, "category", category_id, changes)
+    return message("Category deleted successfully", 200)
+
+
+@jwt_required
+async def get_category_purge(request):
+    """Retrieve the latest purge job of a category, as `CategoryPurgeView.get`."""
+    category_id = request.path_params["category_id"]
+    if get_jwt(request)["role"] != "admin":
+        return message("Admin access required", 403)
+
+    async with request.app.state.sessionmaker() as session:
+        job = await session.run_sync(latest_purge, "category", category_id)
+    if job is None:
+        return message("No purge job found", 404)
+    return JSONResponse(job_schema.dump(job))
+
+
+@jwt_required
+async def list_tasks(request):
+    """Retrieve a page of tasks, as `TaskListView.get`."""
+    args = load_query(request, TaskListQuerySchema())
+    current_user_id = get_jwt_identity(request)
+    user_role = get_jwt(request)["role"]
+
+    stmt = filter_tasks(
+        select(TaskModel).options(joinedload(TaskModel.category)),
+        user_role,
+        current_user_id,
+        completed=args.get("completed"),
+        due_after=args.get("due_after"),
+        due_before=args.get("due_before"),
+    )
+    columns = TASK_SORT_COLUMNS[args["sort"]]
+    try:
+        stmt = seek(stmt, columns, args["limit"], args.get("cursor"))
+    except ValueError as e:
+        return message(str(e), 400)
+
+    async with request.app.state.sessionmaker() as session:
+        rows = (await session.scalars(stmt)).all()
+    tasks, next_cursor = split_page(rows, columns, args["limit"])
+    return conditional_json(
+        request, task_list_schema.dump({"items": tasks, "next_cursor": next_cursor})
+    )
+
+
+@jwt_required
+async def search(request):
+    """Search tasks by title and description, as `TaskSearchView.get`."""
+    args = load_query(request, TaskSearchQuerySchema())
+    current_user_id = get_jwt_identity(request)
+    user_role = get_jwt(request)["role"]
+
+    sessionmaker = request.app.state.sessionmaker
+    try:
+        stmt = search_tasks(
+            sessionmaker.kw["bind"].dialect.name,
+            args["q"],
+            user_role,
+            current_user_id,
+            args["limit"],
+            args.get("cursor"),
+        )
+    except ValueError as e:
+        return message(str(e), 400)
+
+    async with sessionmaker() as session:
+        rows = (await session.execute(stmt)).all()
+    tasks, next_cursor = split_search_page(rows, args["limit"])
+    return conditional_json(
+        request, task_list_schema.dump({"items": tasks, "next_cursor": next_cursor})
+    )
+
+
+@jwt_required
+async def stats(request):
+    """Get task statistics, as `TaskStatsView.get`."""
+    current_user_id = get_jwt_identity(request)
+    user_role = get_jwt(request)["role"]
+    use_summary = request.app.state.flask_app.config["TASK_STATS_SUMMARY"]
+
+    async with request.app.state.sessionmaker() as session:
+        result = None
+        if user_role == "admin" and use_summary:
+            result = await session.run_sync(summary_stats)
+        if result is None:
+            result = await session.run_sync(live_stats, user_role, current_user_id)
+    return conditional_json(request, task_stats_schema.dump(result))
+
+
+@jwt_required
+async def export(request):
+    """Stream an NDJSON or CSV export of tasks, as `TaskExportView.get`."""
+    fmt = load_query(request, TaskExportQuerySchema())["format"]
+    current_user_id = get_jwt_identity(request)
+    user_role = get_jwt(request)["role"]
+
+    async def chunks():
+        async with request.app.state.sessionmaker() as session:
+            async for chunk in export_tasks_async(
+                session, fmt, user_role, current_user_id
+            ):
+                yield chunk
+
+    return StreamingResponse(
+        chunks(),
+        media_type=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f"attachment; filename=tasks.{fmt}"},
+    )
+
+
+@jwt_required
+async def get_task(request):
+    """Retrieve task information, as `TasksView.get`."""
+    current_user_id = get_jwt_identity(request)
+    user_role = get_jwt(request)["role"]
+
+    async with request.app.state.sessionmaker() as session:
+        task = await session.get(
+            TaskModel,
+            request.path_params["task_id"],
+            options=[joinedload(TaskModel.category)],
+        )
+    if not task:
+        return message("Task not found", 404)
+    if user_role != "admin" and task.user_id != current_user_id:
+        return message("Access denied", 403)
+    return conditional_json(request, task_schema.dump(task))
+
+
+@jwt_required
+async def create_task(request):
+    """Create a new task, as `TasksView.post`."""
+    data = await load_json(request, TaskViewPostRequestSchema())
+    current_user_id = get_jwt_identity(request)
+
+    new_task = TaskModel(
+        title=data.get("title"),
+        description=data.get("description"),
+        due_date=data.get("due_date"),
+        category_id=data.get("category_id"),
+        user_id=current_user_id,
+    )
+    async with request.app.state.sessionmaker() as session:
+        try:
+            session.add(new_task)
+            await session.commit()
+        except IntegrityError:
+            await session.rollback()
+            return message("Category not found", 400)
+        except Exception as e:
+            return message(f"An error occurred: {str(e)}", 500)
+
+    tasks_changed.send(
+        request.app.state.flask_app,
+        changes=[
+            {"action": "create", "task_id": new_task.id, "user_id": current_user_id}
+        ],
+    )
+    return message(f"Task created successfully, task_id: {new_task.id}", 201)
+
+
+async def _miss(session, task_id):
+    # A conditional write matched nothing: the task is missing or not ours.
+    if await session.run_sync(miss_status, task_id) == 404:
+        return message("Task not found", 404)
+    return message("Access denied", 403)
+
+
+@jwt_required
+async def update_task(request):
+    """Update task information, as `TasksView.put`."""
+    task_id = request.path_params["task_id"]
+    data = await load_json(request, TaskViewPutRequestSchema())
+    current_user_id = get_jwt_identity(request)
+    user_role = get_jwt(request)["role"]
+
+    async with request.app.state.sessionmaker() as session:
+        try:
+            if data:
+                owner = await session.run_sync(
+                    update_owned_task, task_id, data, user_role, current_user_id
+                )
+            else:
+                owner = await session.run_sync(
+                    find_owned_task, task_id, user_role, current_user_id
+                )
+            if owner is None:
+                await session.rollback()
+                return await _miss(session, task_id)
+            await session.commit()
+        except IntegrityError:
+            # The only foreign key a task update can break.
+            await session.rollback()
+            return message("Category not found", 400)
+
+    tasks_changed.send(
+        request.app.state.flask_app,
+        changes=[{"action": "update", "task_id": task_id, "user_id": owner}],
+    )
+    return message("Task updated successfully", 200)
+
+
+@jwt_required
+async def delete_task(request):
+    """Delete a task, as `TasksView.delete`."""
+    task_id = request.path_params["task_id"]
+    current_user_id = get_jwt_identity(request)
+    user_role = get_jwt(request)["role"]
+
+    async with request.app.state.sessionmaker() as session:
+        try:
+            owner = await session.run_sync(
+                delete_owned_task, task_id, user_role, current_user_id
+            )
+            if owner is None:
+                await session.rollback()
+                return await _miss(session, task_id)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            return message(f"An error occurred: {str(e)}", 500)
+
+    tasks_changed.send(
+        request.app.state.flask_app,
+        changes=[{"action": "delete", "task_id": task_id, "user_id": owner}],
+    )
+    return message("Task deleted successfully", 200)
+
+
+@jwt_required
+async def batch_tasks(request):
+    """Apply a batch of task operations, as `TaskBatchView.post`."""
+    operations = (await load_json(request, TaskBatchRequestSchema()))["operations"]
+    current_user_id = get_jwt_identity(request)
+    user_role = get_jwt(request)["role"]
+
+    task_ids = {item["task_id"] for item in operations if "task_id" in item}
+    category_ids = {
+        item["data"]["category_id"]
+        for item in operations
+        if "category_id" in item["data"]
+    }
+
+    async with request.app.state.sessionmaker() as session:
+        tasks = {}
+        if task_ids:
+            tasks = {
+                task.id: task
+                for task in await session.scalars(
+                    select(TaskModel).where(TaskModel.id.in_(task_ids))
+                )
+            }
+        known_categories = set()
+        if category_ids:
+            known_categories = set(
+                await session.scalars(
+                    select(CategoryModel.id).where(CategoryModel.id.in_(category_ids))
+                )
+            )
+
+        results, changes, creates, updates, deletes = plan_batch(
+            operations, tasks, known_categories, current_user_id, user_role
+        )
+        try:
+            created = []
+            for result, change, data in creates:
+                task = TaskModel(**data, user_id=current_user_id)
+                session.add(task)
+                created.append((result, change, task))
+            for task, data in updates:
+                for key, value in data.items():
+                    setattr(task, key, value)
+            for task in deletes:
+                await session.delete(task)
+
+            await session.flush()
+            for result, change, task in created:
+                result["task_id"] = change["task_id"] = task.id
+            await session.commit()
+        except IntegrityError:
+            # A category was deleted after the batch was checked.
+            await session.rollback()
+            return message("Category not found", 400)
+        except Exception as e:
+            await session.rollback()
+            return message(f"An error occurred: {str(e)}", 500)
+
+    if changes:
+        tasks_changed.send(request.app.state.flask_app, changes=changes)
+    return JSONResponse({"results": results})
+
+
+@jwt_required
+async def stream_tasks(request):
+    """Stream task changes as Server-Sent Events, as `TaskStreamView.get`."""
+    config = request.app.state.flask_app.config
+    subscription = AsyncSubscription(
+        get_jwt_identity(request),
+        get_jwt(request)["role"] == "admin",
+        config["TASK_STREAM_BUFFER"],
+    )
+    return StreamingResponse(
+        change_feed.stream_async(subscription, config["TASK_STREAM_HEARTBEAT"]),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@jwt_required
+async def list_changes(request):
+    """List changes after a version, as `TaskChangesView.get`."""
+    args = load_query(request, TaskChangesQuerySchema())
+    current_user_id = get_jwt_identity(request)
+    user_role = get_jwt(request)["role"]
+
+    async with request.app.state.sessionmaker() as session:
+        changes = await session.run_sync(
+            changes_since, user_role, current_user_id, args["since"], args["limit"]
+        )
+    return conditional_json(request, task_changes_schema.dump(changes))
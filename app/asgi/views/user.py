@@ -0,0 +1,157 @@
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from starlette.responses import JSONResponse
+
+from app.asgi.jwt import get_jwt, get_jwt_identity, jwt_required
+from app.asgi.utils import conditional_json, load_json, load_query, message
+from app.common.pagination import seek, split_page
+from app.common.signals import user_changed
+from app.extensions.hashing import hasher
+from app.modules.task.models import TaskModel
+from app.modules.task.purge import (
+    count_tasks,
+    delete_entity,
+    latest_purge,
+    send_delete_signals,
+    start_purge,
+)
+from app.modules.job.schemas import JobSchema
+from app.modules.user.models import UserModel
+from app.modules.user.queries import USER_SORT_COLUMNS
+from app.modules.user.schemas import (
+    UserListQuerySchema,
+    UserListResponseSchema,
+    UserViewPutRequestSchema,
+    UserViewResponseSchema,
+)
+
+user_schema = UserViewResponseSchema()
+user_list_schema = UserListResponseSchema()
+job_schema = JobSchema()
+
+
+def _with_tasks():
+    # Users are serialized with their tasks and the category of every task;
+    # lazy loads are not allowed on an asyncio session.
+    return selectinload(UserModel.tasks).joinedload(TaskModel.category)
+
+
+@jwt_required
+async def list_users(request):
+    """List users page by page, as `UserListView.get`."""
+    args = load_query(request, UserListQuerySchema())
+    current_user_id = get_jwt_identity(request)
+    user_role = get_jwt(request)["role"]
+
+    stmt = select(UserModel)
+    if user_role != "admin":
+        stmt = stmt.filter_by(id=current_user_id)
+
+    columns = USER_SORT_COLUMNS[args["sort"]]
+    try:
+        stmt = seek(stmt, columns, args["limit"], args.get("cursor"))
+    except ValueError as e:
+        return message(str(e), 400)
+
+    async with request.app.state.sessionmaker() as session:
+        rows = (await session.scalars(stmt)).all()
+    users, next_cursor = split_page(rows, columns, args["limit"])
+    return conditional_json(
+        request, user_list_schema.dump({"items": users, "next_cursor": next_cursor})
+    )
+
+
+@jwt_required
+async def get_user(request):
+    """Retrieve user information, as `UsersView.get`."""
+    user_id = request.path_params["user_id"]
+    current_user_id = get_jwt_identity(request)
+    user_role = get_jwt(request)["role"]
+
+    async with request.app.state.sessionmaker() as session:
+        user = await session.get(UserModel, user_id, options=[_with_tasks()])
+    if not user:
+        return message("User not found", 404)
+    elif user_role != "admin" or user_id != current_user_id:
+        return message("Access denied", 403)
+    return conditional_json(request, user_schema.dump(user))
+
+
+@jwt_required
+async def update_user(request):
+    """Update user information, as `UsersView.put`."""
+    user_id = request.path_params["user_id"]
+    current_user_id = get_jwt_identity(request)
+    user_role = get_jwt(request)["role"]
+
+    data = await load_json(request, UserViewPutRequestSchema())
+    if user_role != "admin" and user_id != current_user_id:
+        return message("Access denied", 403)
+
+    async with request.app.state.sessionmaker() as session:
+        user = await session.get(UserModel, user_id, options=[_with_tasks()])
+        if not user:
+            return message("User not found", 404)
+        try:
+            for key, value in data.items():
+                if key == "password":
+                    value = await hasher.hash_async(value)
+                setattr(user, key, value)
+            await session.commit()
+        except Exception as e:
+            return message(f"An error occurred: {str(e)}", 500)
+
+    user_changed.send(request.app.state.flask_app, action="update", user_id=user_id)
+    return JSONResponse(user_schema.dump(user), status_code=201)
+
+
+@jwt_required
+async def delete_user(request):
+    """Delete a user, as `UsersView.delete`."""
+    user_id = request.path_params["user_id"]
+    current_user_id = get_jwt_identity(request)
+    user_role = get_jwt(request)["role"]
+
+    if user_role != "admin" and user_id != current_user_id:
+        return message("Access denied", 403)
+
+    flask_app = request.app.state.flask_app
+    async with request.app.state.sessionmaker() as session:
+        total = await session.run_sync(count_tasks, "user", user_id)
+        if total > flask_app.config["PURGE_INLINE_LIMIT"]:
+            job = await session.run_sync(
+                start_purge,
+                "user",
+                user_id,
+                total,
+                flask_app.config["PURGE_CHUNK_SIZE"],
+                current_user_id,
+            )
+            return JSONResponse(job_schema.dump(job), 202)
+
+        try:
+            changes = await session.run_sync(delete_entity, "user", user_id)
+            if changes is None:
+                return message("User not found", 404)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            return message(f"An error occurred: {str(e)}", 500)
+
+    send_delete_signals(flask_app, "user", user_id, changes)
+    return message("User deleted successfully", 200)
+
+
+@jwt_required
+async def get_user_purge(request):
+    """Retrieve the latest purge job of a user, as `UserPurgeView.get`."""
+    user_id = request.path_params["user_id"]
+    current_user_id = get_jwt_identity(request)
+    if get_jwt(request)["role"] != "admin" and user_id != current_user_id:
+        return message("Access denied", 403)
+
+    async with request.app.state.sessionmaker() as session:
+        job = await session.run_sync(latest_purge, "user", user_id)
+    if job is None:
+        return message("No purge job found", 404)
+    return JSONResponse(job_schema.dump(job))
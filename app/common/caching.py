@@ -0,0 +1,52 @@
+from flask import current_app, jsonify, request
+
+from app.extensions.cache import cache
+
+
+def cached_json_response(namespaces, key, load):
+    """
+    Serve a JSON payload through the cache.
+
+    On a miss `load` is called for the already dumped data, which is stored
+    serialized together with its ETag, so a hit costs neither a query nor
+    any marshalling.
+
+    Args:
+        namespaces (tuple): Cache namespaces the payload depends on.
+        key (str): Key of the payload within the namespaces.
+        load (callable): Returns the data to serialize.
+
+    Returns:
+        Response: The JSON response with its ETag set.
+    """
+
+    def build():
+        response = jsonify(load())
+        response.add_etag()
+        return {
+            "body": response.get_data(as_text=True),
+            "etag": response.get_etag()[0],
+        }
+
+    cached = cache.get_or_set(namespaces, key, build)
+    response = current_app.response_class(cached["body"], mimetype="application/json")
+    response.set_etag(cached["etag"])
+    return response
+
+
+def conditional_response(response):
+    """
+    `after_request` hook adding an ETag to successful GET responses.
+
+    Responses that already carry an ETag (served from a cache) keep it. When
+    the client's `If-None-Match` matches, the body is dropped and a
+    304 Not Modified is returned instead. Streamed responses are left alone,
+    hashing them would mean buffering the whole stream.
+    """
+    if request.method != "GET" or response.status_code != 200:
+        return response
+    if response.is_streamed:
+        return response
+    if "ETag" not in response.headers:
+        response.add_etag()
+    return response.make_conditional(request)
@@ -0,0 +1,129 @@
+import base64
+import binascii
+import json
+
+from sqlalchemy import and_, or_
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+
+def encode_cursor(values):
+    """
+    Encode the sort key values of the last row of a page into an opaque cursor.
+
+    Args:
+        values (list): Sort key values, in the same order as the sort columns.
+
+    Returns:
+        str: A URL-safe cursor string.
+    """
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor, size):
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (str): The opaque cursor sent by the client.
+        size (int): Number of sort columns the cursor must carry.
+
+    Returns:
+        list: The decoded sort key values.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def _seek(columns, values):
+    # Lexicographic "(c1, c2, ...) > (v1, v2, ...)" spelled out with AND/OR so
+    # it works on every backend and can still use a composite index.
+    clauses = []
+    for i, column in enumerate(columns):
+        equal = [columns[j] == values[j] for j in range(i)]
+        clauses.append(and_(*equal, column > values[i]))
+    return or_(*clauses)
+
+
+def seek(query, columns, limit, cursor=None):
+    """
+    Restrict a query to the page after `cursor`.
+
+    Works on both ORM `Query` objects and `select()` statements. One extra row
+    is fetched so `split_page` can tell whether a next page exists.
+
+    Args:
+        query: The query or statement to paginate.
+        columns (tuple): Sort columns, ending with a unique column.
+        limit (int): Maximum number of rows in the page.
+        cursor (str): Cursor returned with the previous page (optional).
+
+    Returns:
+        The ordered and limited query.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    if cursor:
+        query = query.filter(_seek(columns, decode_cursor(cursor, len(columns))))
+    return query.order_by(*columns).limit(limit + 1)
+
+
+def split_page(rows, columns, limit):
+    """
+    Split the rows fetched by a `seek` query into a page and the next cursor.
+
+    Args:
+        rows (list): The rows returned by the query.
+        columns (tuple): The sort columns passed to `seek`.
+        limit (int): The limit passed to `seek`.
+
+    Returns:
+        tuple: The list of rows and the cursor of the next page, or None when
+        this is the last page.
+    """
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    next_cursor = encode_cursor([getattr(last, column.key) for column in columns])
+    return rows, next_cursor
+
+
+def paginate(query, columns, limit, cursor=None):
+    """
+    Apply keyset pagination to a query.
+
+    Rows are ordered by `columns` and the page starts right after the row
+    described by `cursor`, so the database seeks on the sort key instead of
+    scanning and discarding rows like OFFSET does. The last column must be
+    unique (usually the primary key) to make the ordering total.
+
+    Args:
+        query: The SQLAlchemy query to paginate.
+        columns (tuple): Sort columns, ending with a unique column.
+        limit (int): Maximum number of rows in the page.
+        cursor (str): Cursor returned with the previous page (optional).
+
+    Returns:
+        tuple: The list of rows and the cursor of the next page, or None when
+        this is the last page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    rows = seek(query, columns, limit, cursor).all()
+    return split_page(rows, columns, limit)
@@ -1,5 +1,112 @@
-from marshmallow import Schema, fields
+from marshmallow import Schema, fields, validate, missing
 
+from app.common.pagination import DEFAULT_LIMIT, MAX_LIMIT
+from app.common.timing import timed
 
-class MessageSchema(Schema):
+
+class FastDumpSchema(Schema):
+    """
+    Schema whose `dump` runs a plan compiled once from its declared fields.
+
+    Plain marshmallow dumping walks every field through `Field.serialize` on
+    each call. For the simple field types used by our response payloads the
+    conversion is a single Python call, so the plan stores
+    `(key, attribute, convert)` triples and `dump` applies them directly.
+    Schemas with a field type or hook the plan cannot reproduce fall back to
+    the regular marshmallow implementation, so output is always identical.
+
+    Instances are never mutated after construction and are safe to share
+    between threads; use a separate `many=True` instance for list payloads.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._dump_plan = self._compile_dump_plan()
+
+    def _compile_dump_plan(self):
+        if self._hooks:
+            return None
+        plan = []
+        for key, field in self.dump_fields.items():
+            convert = _compile_field(field)
+            if convert is None:
+                return None
+            plan.append((field.data_key or key, field.attribute or key, convert))
+        return tuple(plan)
+
+    def _dump_one(self, obj):
+        if isinstance(obj, dict):
+            get = obj.get
+        else:
+            get = lambda attr, default: getattr(obj, attr, default)
+
+        data = {}
+        for key, attr, convert in self._dump_plan:
+            value = get(attr, missing)
+            if value is missing:
+                continue
+            data[key] = None if value is None else convert(value)
+        return data
+
+    def dump(self, obj, *, many=None):
+        with timed("serialize"):
+            if self._dump_plan is None:
+                return super().dump(obj, many=many)
+            many = self.many if many is None else bool(many)
+            if many:
+                return [self._dump_one(item) for item in obj]
+            return self._dump_one(obj)
+
+
+def _compile_field(field):
+    # Return a function converting a non-null attribute value the same way
+    # `field.serialize` would, or None if the field is not supported.
+    if type(field).serialize is not fields.Field.serialize:
+        return None
+    if field.dump_default is not missing:
+        return None
+    if isinstance(field, fields.Nested):
+        schema = field.schema
+        many = schema.many or field.many
+        return lambda value: schema.dump(value, many=many)
+    if isinstance(field, fields.List):
+        inner = _compile_field(field.inner)
+        if inner is None:
+            return None
+        return lambda value: [None if item is None else inner(item) for item in value]
+    if isinstance(field, fields.Boolean):
+        truthy, falsy = field.truthy, field.falsy
+
+        def convert(value):
+            try:
+                if value in truthy:
+                    return True
+                if value in falsy:
+                    return False
+            except TypeError:
+                pass
+            return bool(value)
+
+        return convert
+    if isinstance(field, fields.Integer) and not field.as_string:
+        return int
+    if type(field) in (fields.String, fields.Email):
+        return str
+    if isinstance(field, fields.DateTime):
+        return field.SERIALIZATION_FUNCS.get(field.format or field.DEFAULT_FORMAT)
+    return None
+
+
+class MessageSchema(FastDumpSchema):
     message = fields.String(required=True)
+
+
+class PaginationQuerySchema(Schema):
+    limit = fields.Int(
+        load_default=DEFAULT_LIMIT, validate=validate.Range(min=1, max=MAX_LIMIT)
+    )
+    cursor = fields.Str()
+
+
+class PaginatedResponseSchema(FastDumpSchema):
+    next_cursor = fields.Str(allow_none=True)
@@ -0,0 +1,16 @@
+from blinker import Namespace
+
+signals = Namespace()
+
+# Sent after a commit that created, updated or deleted tasks, with
+# `changes`: a list of {"action", "task_id", "user_id"} dicts, where
+# `user_id` is the owner of the task.
+tasks_changed = signals.signal("tasks-changed")
+
+# Sent after a commit that created or deleted a category, with
+# `action` and `category_id`.
+category_changed = signals.signal("category-changed")
+
+# Sent after a commit that updated or deleted a user, with `action`
+# and `user_id`.
+user_changed = signals.signal("user-changed")
@@ -0,0 +1,72 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_current = ContextVar("request_timings", default=None)
+
+
+class RequestTimings:
+    """
+    Time spent in each phase of one request, in seconds.
+
+    Phases are re-entrant: time spent in a phase that is already running
+    (a nested schema dumping its children, for instance) is counted once.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = {}
+        self.sql_count = 0
+        self._running = {}
+
+    def start(self, phase):
+        self._running.setdefault(phase, [time.perf_counter(), 0])[1] += 1
+
+    def stop(self, phase):
+        running = self._running.get(phase)
+        if running is None:
+            return
+        running[1] -= 1
+        if running[1] == 0:
+            del self._running[phase]
+            self.add(phase, time.perf_counter() - running[0])
+
+    def finish(self):
+        """Stop every phase still running, e.g. after a failed JWT check."""
+        now = time.perf_counter()
+        for phase, (started, _) in self._running.items():
+            self.add(phase, now - started)
+        self._running.clear()
+
+    def add(self, phase, seconds):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def activate(self):
+        """Make these the timings of the current context; returns a reset token."""
+        return _current.set(self)
+
+    @staticmethod
+    def deactivate(token):
+        _current.reset(token)
+
+    @staticmethod
+    def current():
+        """Return the timings of the current request, or None if not recording."""
+        return _current.get()
+
+
+@contextmanager
+def timed(phase):
+    """Add the time spent in the block to `phase` of the current request."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    timings.start(phase)
+    try:
+        yield
+    finally:
+        timings.stop(phase)
@@ -1,9 +1,19 @@
 from app.extensions.jwt import jwt
 from app.extensions.db import db
+from app.extensions.cache import cache
 from app.extensions.docs import docs
+from app.extensions.hashing import hasher
+from app.extensions.instrumentation import instrumentation
+from app.extensions.migrate import migrate
+from app.extensions.sqlite import init_sqlite
 
 
 def init_extensions(app):
     db.init_app(app)
+    init_sqlite(app)
+    migrate.init_app(app, db)
+    cache.init_app(app)
     jwt.init_app(app)
     docs.init_app(app)
+    hasher.init_app(app)
+    instrumentation.init_app(app)
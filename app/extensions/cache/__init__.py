@@ -0,0 +1,2 @@
+from app.extensions.cache.cache import cache
+from app.extensions.cache.backends import CacheBackend, MemoryBackend, RedisBackend
@@ -0,0 +1,124 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+
+class CacheBackend:
+    """
+    Interface every cache backend implements.
+
+    Values must be JSON serializable so that all backends, including the
+    ones storing data out of process, behave the same.
+    """
+
+    def get_many(self, keys):
+        """Return the values of `keys`, with None for missing entries."""
+        raise NotImplementedError
+
+    def set(self, key, value, timeout=None):
+        """Store `value` under `key`, expiring after `timeout` seconds."""
+        raise NotImplementedError
+
+    def incr(self, key, initial):
+        """Increment a counter, creating it as `initial` if it does not exist."""
+        raise NotImplementedError
+
+    def clear(self):
+        """Remove every entry."""
+        raise NotImplementedError
+
+
+class MemoryBackend(CacheBackend):
+    """
+    In-process LRU backend.
+
+    Each worker process has its own copy, so invalidations made by one
+    process are not seen by the others. Use it for a single process or when
+    a short `CACHE_DEFAULT_TIMEOUT` bounds staleness.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key, now):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at < now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _set(self, key, value, timeout):
+        expires_at = time.monotonic() + timeout if timeout else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get_many(self, keys):
+        now = time.monotonic()
+        with self._lock:
+            return [self._get(key, now) for key in keys]
+
+    def set(self, key, value, timeout=None):
+        with self._lock:
+            self._set(key, value, timeout)
+
+    def incr(self, key, initial):
+        with self._lock:
+            value = self._get(key, time.monotonic())
+            value = initial if value is None else value + 1
+            self._set(key, value, None)
+            return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisBackend(CacheBackend):
+    """
+    Backend storing entries in a Redis-protocol server, shared by all workers.
+
+    Args:
+        client: A `redis.Redis` compatible client, e.g. `fakeredis.FakeRedis`.
+        key_prefix (str): Prefix of every key written, used by `clear`.
+    """
+
+    def __init__(self, client, key_prefix=""):
+        self.client = client
+        self.key_prefix = key_prefix
+
+    @classmethod
+    def from_url(cls, url, key_prefix=""):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("CACHE_TYPE 'redis' requires the redis package.")
+        return cls(redis.Redis.from_url(url), key_prefix=key_prefix)
+
+    def get_many(self, keys):
+        return [
+            None if value is None else json.loads(value)
+            for value in self.client.mget(keys)
+        ]
+
+    def set(self, key, value, timeout=None):
+        self.client.set(key, json.dumps(value), ex=timeout or None)
+
+    def incr(self, key, initial):
+        pipe = self.client.pipeline()
+        pipe.set(key, initial - 1, nx=True)
+        pipe.incr(key)
+        return pipe.execute()[1]
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=f"{self.key_prefix}*"))
+        if keys:
+            self.client.delete(*keys)
@@ -0,0 +1,98 @@
+import time
+
+from app.extensions.cache.backends import MemoryBackend, RedisBackend
+
+
+class Cache:
+    """
+    Read-through cache with namespace-based invalidation.
+
+    Every entry is stored under the current version of one or more
+    namespaces (e.g. `categories`, `tasks:user:1`). Invalidating a namespace
+    bumps its version, which makes all entries stored under the old version
+    unreachable at once without scanning keys; they age out of the backend
+    on their own. Versions live in the backend too, so with a shared backend
+    an invalidation in one worker is seen by every other worker.
+
+    Configuration:
+        CACHE_TYPE: `memory` (default) or `redis`.
+        CACHE_REDIS_URL: Server URL for the `redis` backend.
+        CACHE_MAXSIZE: Entry limit of the `memory` backend.
+        CACHE_DEFAULT_TIMEOUT: Entry lifetime in seconds.
+        CACHE_KEY_PREFIX: Prefix of every key.
+    """
+
+    def __init__(self):
+        self.backend = MemoryBackend()
+        self.default_timeout = 300
+        self.key_prefix = "todo:"
+
+    def init_app(self, app):
+        self.default_timeout = app.config["CACHE_DEFAULT_TIMEOUT"]
+        self.key_prefix = app.config["CACHE_KEY_PREFIX"]
+
+        cache_type = app.config["CACHE_TYPE"]
+        if cache_type == "memory":
+            self.backend = MemoryBackend(maxsize=app.config["CACHE_MAXSIZE"])
+        elif cache_type == "redis":
+            self.backend = RedisBackend.from_url(
+                app.config["CACHE_REDIS_URL"], key_prefix=self.key_prefix
+            )
+        else:
+            raise ValueError(f"Invalid CACHE_TYPE '{cache_type}'.")
+
+    def _version_key(self, namespace):
+        return f"{self.key_prefix}version:{namespace}"
+
+    def _versions(self, namespaces):
+        keys = [self._version_key(namespace) for namespace in namespaces]
+        versions = self.backend.get_many(keys)
+        for i, version in enumerate(versions):
+            if version is None:
+                # A version that was never set (or was evicted) starts from a
+                # fresh value, so entries written under an older version of
+                # the namespace can never be matched again.
+                versions[i] = self.backend.incr(keys[i], initial=time.time_ns())
+        return versions
+
+    def _key(self, namespaces, key):
+        versions = self._versions(namespaces)
+        scope = ",".join(f"{ns}@{v}" for ns, v in zip(namespaces, versions))
+        return f"{self.key_prefix}{scope}:{key}"
+
+    def get(self, namespaces, key):
+        """Return the entry stored for `key` under `namespaces`, or None."""
+        return self.backend.get_many([self._key(namespaces, key)])[0]
+
+    def set(self, namespaces, key, value, timeout=None):
+        """Store `value` for `key` under the current version of `namespaces`."""
+        self.backend.set(
+            self._key(namespaces, key), value, timeout or self.default_timeout
+        )
+
+    def get_or_set(self, namespaces, key, load, timeout=None):
+        """
+        Return the entry for `key`, calling `load` to fill it on a miss.
+
+        The versions are resolved before `load` runs, so a result computed
+        while the namespace is being invalidated is stored under the old
+        version and never served.
+        """
+        full_key = self._key(namespaces, key)
+        value = self.backend.get_many([full_key])[0]
+        if value is None:
+            value = load()
+            self.backend.set(full_key, value, timeout or self.default_timeout)
+        return value
+
+    def invalidate(self, *namespaces):
+        """Drop every entry stored under any of `namespaces`."""
+        for namespace in namespaces:
+            self.backend.incr(self._version_key(namespace), initial=time.time_ns())
+
+    def clear(self):
+        """Drop every entry."""
+        self.backend.clear()
+
+
+cache = Cache()
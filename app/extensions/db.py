@@ -1,3 +1,137 @@
+import os
+import threading
+import time
+
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool, StaticPool
 
 db = SQLAlchemy()
+
+
+class PoolMetrics:
+    """
+    Process-wide connection pool counters.
+
+    Tracks how many connections were checked out, how long callers waited
+    for one, and how many checkouts timed out because the pool was
+    exhausted.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+
+    def record(self, waited, timed_out=False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def snapshot(self, pool=None):
+        with self._lock:
+            data = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+            }
+        if isinstance(pool, QueuePool):
+            data.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+            )
+        return data
+
+
+pool_metrics = PoolMetrics()
+
+
+class MeteredQueuePool(QueuePool):
+    """QueuePool recording checkout wait times into `pool_metrics`."""
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            pool_metrics.record(time.perf_counter() - started, timed_out=True)
+            raise
+        pool_metrics.record(time.perf_counter() - started)
+        return connection
+
+
+def _env_int(name):
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
+def engine_options(database_uri, asyncio=False):
+    """
+    Build `SQLALCHEMY_ENGINE_OPTIONS` from the environment.
+
+    Environment:
+        DB_POOL_SIZE: Connections kept open in the pool.
+        DB_MAX_OVERFLOW: Extra connections allowed above the pool size.
+        DB_POOL_TIMEOUT: Seconds to wait for a free connection.
+        DB_POOL_RECYCLE: Seconds after which a connection is replaced
+            (default 1800).
+        DB_POOL_PRE_PING: Test connections before use, "0" to disable
+            (default on). Drops connections broken by a failover instead of
+            failing the request with them.
+        DB_STATEMENT_TIMEOUT_MS: Server-side statement timeout (Postgres).
+
+    Args:
+        database_uri (str): The database URL the engine is created for.
+        asyncio (bool): Build options for an asyncio engine instead, which
+            uses its own pool class and driver-specific connect arguments.
+
+    Returns:
+        dict: Keyword arguments for `create_engine`.
+    """
+    url = make_url(database_uri)
+    options = {
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "1") != "0",
+        "pool_recycle": _env_int("DB_POOL_RECYCLE") or 1800,
+    }
+
+    # In-memory SQLite lives in a single connection; there is no pool to size.
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        if asyncio:
+            options["poolclass"] = StaticPool
+        return options
+
+    if not asyncio:
+        options["poolclass"] = MeteredQueuePool
+    for option, name in (
+        ("pool_size", "DB_POOL_SIZE"),
+        ("max_overflow", "DB_MAX_OVERFLOW"),
+        ("pool_timeout", "DB_POOL_TIMEOUT"),
+    ):
+        value = _env_int(name)
+        if value is not None:
+            options[option] = value
+
+    statement_timeout = _env_int("DB_STATEMENT_TIMEOUT_MS")
+    if statement_timeout and url.get_backend_name() == "postgresql":
+        if asyncio:
+            options["connect_args"] = {
+                "server_settings": {"statement_timeout": str(statement_timeout)}
+            }
+        else:
+            options["connect_args"] = {
+                "options": f"-c statement_timeout={statement_timeout}"
+            }
+    return options
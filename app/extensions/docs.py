@@ -1,3 +1,65 @@
+import json
+import threading
+
+from flask import current_app
 from flask_apispec.extension import FlaskApiSpec
 
-docs = FlaskApiSpec()
+
+class LazyFlaskApiSpec(FlaskApiSpec):
+    """
+    FlaskApiSpec building the OpenAPI document on first use.
+
+    Converting every registered view through apispec and marshmallow is the
+    most expensive part of `create_app`, yet most workers never serve
+    `/swagger/`. Registrations are only recorded at startup; the spec is
+    built the first time it is requested and the rendered JSON is kept for
+    later requests.
+
+    Configuration:
+        API_DOCS_PATH: A spec file written by `flask export-docs` at build
+            time. When set, `/swagger/` serves it as is and no spec is
+            built in the worker at all.
+    """
+
+    def __init__(self, app=None, document_options=True):
+        self._lock = threading.Lock()
+        self._built = False
+        self._json = None
+        super().__init__(app, document_options)
+
+    def init_app(self, app):
+        # Registrations belong to the app being set up, not to an earlier
+        # app created in the same process.
+        self._deferred = []
+        self._built = False
+        self._json = None
+        super().init_app(app)
+
+    def _defer(self, callable, *args, **kwargs):
+        self._deferred.append(lambda: callable(*args, **kwargs))
+
+    def build(self):
+        """Convert the registered views into the spec, once."""
+        with self._lock:
+            if not self._built:
+                for deferred in self._deferred:
+                    deferred()
+                self._built = True
+        return self.spec
+
+    def to_json(self):
+        """Return the spec rendered as JSON, building it if needed."""
+        if self._json is None:
+            path = self.app.config.get("API_DOCS_PATH")
+            if path:
+                with open(path) as f:
+                    self._json = f.read()
+            else:
+                self._json = json.dumps(self.build().to_dict())
+        return self._json
+
+    def swagger_json(self):
+        return current_app.response_class(self.to_json(), mimetype="application/json")
+
+
+docs = LazyFlaskApiSpec()
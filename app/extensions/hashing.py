@@ -0,0 +1,82 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.security import (
+    DEFAULT_PBKDF2_ITERATIONS,
+    check_password_hash,
+    generate_password_hash,
+)
+
+
+def _canonical_method(method):
+    # Expand a werkzeug method string to the form stored in the hash prefix,
+    # e.g. "pbkdf2:sha256" -> "pbkdf2:sha256:600000", so stored hashes can be
+    # compared against the configured parameters.
+    name, *args = method.split(":")
+    if name == "scrypt":
+        n, r, p = map(int, args) if args else (2**15, 8, 1)
+        return f"scrypt:{n}:{r}:{p}"
+    if name == "pbkdf2":
+        hash_name = args[0] if args else "sha256"
+        iterations = int(args[1]) if len(args) > 1 else DEFAULT_PBKDF2_ITERATIONS
+        return f"pbkdf2:{hash_name}:{iterations}"
+    raise ValueError(f"Invalid hash method '{method}'.")
+
+
+class PasswordHasher:
+    """
+    Password hashing service shared by every view and CLI command.
+
+    The algorithm and cost come from `PASSWORD_HASH_METHOD`, using werkzeug's
+    method syntax (`pbkdf2:sha256:<iterations>` or `scrypt:<n>:<r>:<p>`).
+    Hashing runs on a pool of `PASSWORD_HASH_WORKERS` threads: the key
+    derivation functions release the GIL, and the bounded pool caps how many
+    CPU-heavy hashes run at once, so a burst of logins queues up instead of
+    taking every core away from the other endpoints.
+    """
+
+    def __init__(self):
+        self.method = _canonical_method("pbkdf2:sha256")
+        self._executor = None
+
+    def init_app(self, app):
+        self.method = _canonical_method(app.config["PASSWORD_HASH_METHOD"])
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self._executor = ThreadPoolExecutor(
+            max_workers=app.config["PASSWORD_HASH_WORKERS"],
+            thread_name_prefix="password-hash",
+        )
+
+    def _run(self, func, *args):
+        if self._executor is None:
+            return func(*args)
+        return self._executor.submit(func, *args).result()
+
+    def _run_async(self, func, *args):
+        if self._executor is None:
+            return asyncio.get_running_loop().run_in_executor(None, func, *args)
+        return asyncio.wrap_future(self._executor.submit(func, *args))
+
+    def hash(self, password):
+        """Hash `password` with the configured method."""
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, pwhash, password):
+        """Check `password` against a stored hash."""
+        return self._run(check_password_hash, pwhash, password)
+
+    async def hash_async(self, password):
+        """Hash `password` without blocking the event loop."""
+        return await self._run_async(generate_password_hash, password, self.method)
+
+    async def verify_async(self, pwhash, password):
+        """Check `password` against a stored hash without blocking the event loop."""
+        return await self._run_async(check_password_hash, pwhash, password)
+
+    def needs_rehash(self, pwhash):
+        """Return True if `pwhash` was made with other parameters than configured."""
+        return pwhash.split("$", 1)[0] != self.method
+
+
+hasher = PasswordHasher()
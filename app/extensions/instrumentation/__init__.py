@@ -0,0 +1,4 @@
+from app.extensions.instrumentation.instrumentation import Instrumentation
+from app.extensions.instrumentation.metrics import Metrics
+
+instrumentation = Instrumentation()
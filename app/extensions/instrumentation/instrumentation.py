@@ -0,0 +1,176 @@
+import cProfile
+import os
+import random
+import time
+
+from flask import current_app, g, jsonify, request
+from flask_jwt_extended.default_callbacks import default_decode_key_callback
+from sqlalchemy import event
+from webargs.flaskparser import FlaskParser
+
+from app.extensions.db import db, pool_metrics
+from app.extensions.instrumentation.metrics import Metrics
+from app.common.timing import RequestTimings, timed
+from app.extensions.jwt import jwt
+
+# Phases reported in the Server-Timing header, in order.
+PHASES = ("parse", "jwt", "sql", "serialize")
+
+
+class TimedParser(FlaskParser):
+    """Webargs parser recording the time spent parsing request arguments."""
+
+    def parse(self, *args, **kwargs):
+        with timed("parse"):
+            return super().parse(*args, **kwargs)
+
+
+def timed_jsonify(data):
+    with timed("serialize"):
+        return jsonify(data)
+
+
+class Instrumentation:
+    """
+    Opt-in per-request timings, SQL counters and sampling profiler.
+
+    When enabled every response carries a `Server-Timing` header splitting
+    the request into argument parsing, JWT verification, SQL and
+    serialization, and the same numbers are aggregated per endpoint and
+    served in the Prometheus text format at `/metrics`. The endpoint is not
+    authenticated; expose it on an internal network only.
+
+    Independently, a fraction of requests can be run under cProfile; the
+    profiles of those slower than a threshold are written to disk for
+    `python -m pstats` or snakeviz.
+
+    Configuration:
+        INSTRUMENTATION: Enable timings and `/metrics` (default off).
+        PROFILE_SAMPLE_RATE: Fraction of requests to profile, 0 to disable.
+        PROFILE_SLOW_MS: Only keep profiles of requests slower than this.
+        PROFILE_DIR: Directory the `.prof` files are written to.
+    """
+
+    def __init__(self):
+        self.metrics = Metrics()
+        self.enabled = False
+        self.sample_rate = 0.0
+
+    def init_app(self, app):
+        self.enabled = app.config["INSTRUMENTATION"]
+        self.sample_rate = app.config["PROFILE_SAMPLE_RATE"]
+        self.slow_ms = app.config["PROFILE_SLOW_MS"]
+        self.profile_dir = app.config["PROFILE_DIR"]
+
+        if self.enabled:
+            app.config["APISPEC_WEBARGS_PARSER"] = TimedParser()
+            app.config["APISPEC_FORMAT_RESPONSE"] = timed_jsonify
+            jwt.decode_key_loader(self._start_jwt)
+            jwt.token_verification_loader(self._stop_jwt)
+            with app.app_context():
+                event.listen(db.engine, "before_cursor_execute", _before_execute)
+                event.listen(db.engine, "after_cursor_execute", _after_execute)
+            app.add_url_rule("/metrics", "metrics", self.metrics_view)
+
+        if self.enabled or self.sample_rate > 0:
+            app.before_request(self._before_request)
+            app.after_request(self._after_request)
+            app.teardown_request(self._teardown_request)
+
+    @staticmethod
+    def _start_jwt(jwt_header, jwt_data):
+        timings = RequestTimings.current()
+        if timings is not None:
+            timings.start("jwt")
+        return default_decode_key_callback(jwt_header, jwt_data)
+
+    @staticmethod
+    def _stop_jwt(jwt_header, jwt_data):
+        timings = RequestTimings.current()
+        if timings is not None:
+            timings.stop("jwt")
+        return True
+
+    def metrics_view(self):
+        body = self.metrics.render(pool_metrics.snapshot(db.engine.pool))
+        return current_app.response_class(
+            body, mimetype="text/plain; version=0.0.4; charset=utf-8"
+        )
+
+    def _before_request(self):
+        if self.enabled:
+            timings = RequestTimings()
+            g.instrumentation_token = timings.activate()
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            g.profiler = cProfile.Profile()
+            g.profiler_started = time.perf_counter()
+            g.profiler.enable()
+
+    def _after_request(self, response):
+        profiler = g.pop("profiler", None)
+        if profiler is not None:
+            profiler.disable()
+            self._save_profile(profiler, time.perf_counter() - g.profiler_started)
+
+        timings = RequestTimings.current()
+        if timings is None:
+            return response
+
+        timings.finish()
+        endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+        self.metrics.observe(request.method, endpoint, response.status_code, timings)
+        response.headers["Server-Timing"] = server_timing(timings)
+        return response
+
+    def _teardown_request(self, error=None):
+        profiler = g.pop("profiler", None)
+        if profiler is not None:
+            profiler.disable()
+        token = g.pop("instrumentation_token", None)
+        if token is not None:
+            RequestTimings.deactivate(token)
+
+    def _save_profile(self, profiler, elapsed):
+        ms = elapsed * 1000
+        if ms < self.slow_ms:
+            return
+        os.makedirs(self.profile_dir, exist_ok=True)
+        name = (request.endpoint or "unmatched").replace(".", "-")
+        filename = f"{time.strftime('%Y%m%dT%H%M%S')}-{name}-{ms:.0f}ms.prof"
+        profiler.dump_stats(os.path.join(self.profile_dir, filename))
+
+
+def server_timing(timings):
+    """
+    Format request timings as a `Server-Timing` header value.
+
+    Args:
+        timings (RequestTimings): The timings of the finished request.
+
+    Returns:
+        str: Durations of every recorded phase and the total, in milliseconds.
+    """
+    metrics = []
+    for phase in PHASES:
+        if phase not in timings.phases:
+            continue
+        metric = f"{phase};dur={timings.phases[phase] * 1000:.2f}"
+        if phase == "sql":
+            metric += f';desc="{timings.sql_count} queries"'
+        metrics.append(metric)
+    metrics.append(f"total;dur={timings.elapsed() * 1000:.2f}")
+    return ", ".join(metrics)
+
+
+def _before_execute(conn, cursor, statement, parameters, context, executemany):
+    if RequestTimings.current() is not None:
+        conn.info.setdefault("instrumentation_started", []).append(time.perf_counter())
+
+
+def _after_execute(conn, cursor, statement, parameters, context, executemany):
+    timings = RequestTimings.current()
+    started = conn.info.get("instrumentation_started")
+    if timings is None or not started:
+        return
+    timings.add("sql", time.perf_counter() - started.pop())
+    timings.sql_count += 1
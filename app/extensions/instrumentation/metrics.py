@@ -0,0 +1,118 @@
+import threading
+from collections import defaultdict
+
+# Upper bounds, in seconds, of the request duration histogram buckets.
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _labels(**labels):
+    escaped = (
+        (key, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for key, value in labels.items()
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+class Metrics:
+    """
+    Process-wide request metrics, rendered in the Prometheus text format.
+
+    Endpoints are identified by their URL rule (`/task/<int:task_id>/`), not
+    the requested path, so the number of series stays bounded.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            # (method, endpoint, status) -> [bucket counts..., count, sum]
+            self._requests = {}
+            self._phases = defaultdict(float)
+            self._statements = defaultdict(int)
+
+    def observe(self, method, endpoint, status, timings):
+        """Record a finished request and its `RequestTimings`."""
+        duration = timings.elapsed()
+        key = (method, endpoint, status)
+        with self._lock:
+            series = self._requests.get(key)
+            if series is None:
+                series = self._requests[key] = [0] * (len(BUCKETS) + 2)
+            for i, bound in enumerate(BUCKETS):
+                if duration <= bound:
+                    series[i] += 1
+            series[-2] += 1
+            series[-1] += duration
+            for phase, seconds in timings.phases.items():
+                self._phases[(endpoint, phase)] += seconds
+            self._statements[endpoint] += timings.sql_count
+
+    def render(self, pool=None):
+        """
+        Render all metrics.
+
+        Args:
+            pool (dict): A `pool_metrics.snapshot()` to export as well (optional).
+
+        Returns:
+            str: The metrics in the Prometheus text exposition format.
+        """
+        with self._lock:
+            requests = {key: list(series) for key, series in self._requests.items()}
+            phases = dict(self._phases)
+            statements = dict(self._statements)
+
+        lines = [
+            "# HELP http_request_duration_seconds Time spent handling requests.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, endpoint, status), series in sorted(requests.items()):
+            labels = dict(method=method, endpoint=endpoint, status=status)
+            for bound, count in zip(BUCKETS, series):
+                lines.append(
+                    "http_request_duration_seconds_bucket"
+                    f"{_labels(**labels, le=bound)} {count}"
+                )
+            lines.append(
+                "http_request_duration_seconds_bucket"
+                f'{_labels(**labels, le="+Inf")} {series[-2]}'
+            )
+            lines.append(
+                f"http_request_duration_seconds_count{_labels(**labels)} {series[-2]}"
+            )
+            lines.append(
+                f"http_request_duration_seconds_sum{_labels(**labels)} {series[-1]}"
+            )
+
+        lines += [
+            "# HELP http_request_phase_seconds_total Time spent in each request phase.",
+            "# TYPE http_request_phase_seconds_total counter",
+        ]
+        for (endpoint, phase), seconds in sorted(phases.items()):
+            lines.append(
+                "http_request_phase_seconds_total"
+                f"{_labels(endpoint=endpoint, phase=phase)} {seconds}"
+            )
+
+        lines += [
+            "# HELP db_statements_total SQL statements executed while handling requests.",
+            "# TYPE db_statements_total counter",
+        ]
+        for endpoint, count in sorted(statements.items()):
+            lines.append(f"db_statements_total{_labels(endpoint=endpoint)} {count}")
+
+        if pool:
+            for name, kind in (
+                ("checkouts", "counter"),
+                ("timeouts", "counter"),
+                ("wait_seconds_total", "counter"),
+                ("checked_out", "gauge"),
+                ("overflow", "gauge"),
+            ):
+                if name in pool:
+                    lines.append(f"# TYPE db_pool_{name} {kind}")
+                    lines.append(f"db_pool_{name} {pool[name]}")
+
+        return "\n".join(lines) + "\n"
@@ -1,14 +1,25 @@
 from flask_jwt_extended import JWTManager
+from app.extensions.db import db
 from app.modules.user.models import UserModel
 from flask import jsonify
 
 jwt = JWTManager()
 
 
+@jwt.user_identity_loader
+def user_identity_lookup(identity):
+    if isinstance(identity, UserModel):
+        return identity.id
+    return identity
+
+
 @jwt.additional_claims_loader
 def add_claims_to_jwt(identity):
-    user = UserModel.query.get(identity)
-    return {"role": user.role}
+    # Callers that already hold the user row pass it as the identity, so the
+    # role is read from it instead of querying the database again.
+    if isinstance(identity, UserModel):
+        return {"role": identity.role}
+    return {"role": db.session.get(UserModel, identity).role}
 
 
 @jwt.expired_token_loader
@@ -0,0 +1,12 @@
+from flask_migrate import Migrate
+
+
+def include_name(name, type_, parent_names):
+    # The SQLite full-text index of tasks is a virtual table with shadow
+    # tables of its own; it is managed by hand, not by autogenerate.
+    if type_ == "table":
+        return not name.startswith("tasks_fts")
+    return True
+
+
+migrate = Migrate(render_as_batch=True, include_name=include_name)
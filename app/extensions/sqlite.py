@@ -0,0 +1,137 @@
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+from app.extensions.db import db
+
+# Statements that start a write transaction on SQLite.
+WRITE_PREFIXES = ("INSERT", "UPDATE", "DELETE", "REPLACE", "CREATE", "DROP", "ALTER")
+
+
+class SingleWriter:
+    """
+    In-process lock serializing SQLite write transactions.
+
+    SQLite allows a single writer at a time. Instead of letting concurrent
+    transactions race for the database lock and fail with "database is
+    locked", the first write statement of a transaction takes this lock and
+    the commit or rollback releases it, so writers of the same process queue
+    up. Writers in other processes still rely on `busy_timeout`.
+    """
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self._lock = threading.Lock()
+
+    def before_cursor_execute(self, conn, cursor, statement, *args):
+        if conn.info.get("holds_write_lock"):
+            return
+        if not statement.lstrip()[:7].upper().startswith(WRITE_PREFIXES):
+            return
+        if not self._lock.acquire(timeout=self.timeout):
+            raise TimeoutError("Timed out waiting for the SQLite write lock.")
+        conn.info["holds_write_lock"] = True
+
+    def release(self, conn):
+        if conn.info.pop("holds_write_lock", False):
+            self._lock.release()
+
+    def release_connection(self, dbapi_connection, connection_record, *args):
+        if connection_record.info.pop("holds_write_lock", False):
+            self._lock.release()
+
+
+def is_file_database(database_uri):
+    """Return True if `database_uri` points to an SQLite database file."""
+    url = make_url(database_uri)
+    return url.get_backend_name() == "sqlite" and url.database not in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def is_sqlite(database_uri):
+    """Return True if `database_uri` points to an SQLite database."""
+    return make_url(database_uri).get_backend_name() == "sqlite"
+
+
+def enforce_foreign_keys(engine):
+    """
+    Turn on foreign key enforcement for every connection of `engine`.
+
+    SQLite ignores foreign keys, including their ON DELETE actions, unless
+    each connection asks for them.
+    """
+
+    @event.listens_for(engine, "connect")
+    def foreign_keys_on(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+def tune_engine(engine, config, single_writer=True):
+    """
+    Apply the SQLite production profile to `engine`.
+
+    Every new connection gets WAL journaling, `synchronous=NORMAL` (durable
+    with WAL, without an fsync per commit), a busy timeout, memory-mapped
+    reads and a larger page cache.
+
+    Args:
+        engine: The (sync) engine to tune.
+        config (dict): The app configuration, see `init_sqlite`.
+        single_writer (bool): Whether `SQLITE_SINGLE_WRITER` may be honoured.
+            Thread locks cannot be used from an event loop, so async engines
+            pass False.
+    """
+    if config["SQLITE_TUNING"]:
+        pragmas = (
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=NORMAL",
+            f"PRAGMA busy_timeout={config['SQLITE_BUSY_TIMEOUT_MS']}",
+            f"PRAGMA mmap_size={config['SQLITE_MMAP_SIZE']}",
+            f"PRAGMA cache_size={config['SQLITE_CACHE_SIZE']}",
+        )
+
+        @event.listens_for(engine, "connect")
+        def apply_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
+
+    if single_writer and config["SQLITE_SINGLE_WRITER"]:
+        writer = SingleWriter(timeout=config["SQLITE_BUSY_TIMEOUT_MS"] / 1000)
+        event.listen(engine, "before_cursor_execute", writer.before_cursor_execute)
+        event.listen(engine, "commit", writer.release)
+        event.listen(engine, "rollback", writer.release)
+        # A connection returned to the pool mid-transaction is rolled back by
+        # the pool itself; make sure its lock is released too.
+        event.listen(engine, "checkin", writer.release_connection)
+
+
+def init_sqlite(app):
+    """
+    Apply the SQLite production profile to the app's engine.
+
+    Foreign keys are enforced on every SQLite database; only file databases
+    are tuned.
+
+    Configuration:
+        SQLITE_TUNING: Apply the pragmas (default on).
+        SQLITE_BUSY_TIMEOUT_MS: How long to wait on a locked database.
+        SQLITE_MMAP_SIZE: Bytes of the database mapped into memory.
+        SQLITE_CACHE_SIZE: Page cache size, negative values are in KiB.
+        SQLITE_SINGLE_WRITER: Serialize writes in-process (default off).
+    """
+    database_uri = app.config["SQLALCHEMY_DATABASE_URI"]
+    if not is_sqlite(database_uri):
+        return
+
+    with app.app_context():
+        enforce_foreign_keys(db.engine)
+        if is_file_database(database_uri):
+            tune_engine(db.engine, app.config)
@@ -2,6 +2,8 @@ from app.modules.auth import init_auth
 from app.modules.user import init_user
 from app.modules.task import init_task
 from app.modules.cli import init_cli
+from app.modules.job import init_job
+from app.modules.health import init_health
 
 
 def init_modules(app):
@@ -9,3 +11,5 @@ def init_modules(app):
     init_auth(app)
     init_task(app)
     init_cli(app)
+    init_job(app)
+    init_health(app)
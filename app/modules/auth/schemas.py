@@ -1,5 +1,7 @@
 from marshmallow import Schema, fields
 
+from app.common.schemas import FastDumpSchema
+
 
 class SignUpRequestSchema(Schema):
     username = fields.Str(required=True)
@@ -12,5 +14,5 @@ class LoginViewRequestSchema(Schema):
     password = fields.Str(required=True)
 
 
-class AccessTokenResponseSchema(Schema):
+class AccessTokenResponseSchema(FastDumpSchema):
     access_token = fields.String()
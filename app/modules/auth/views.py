@@ -1,8 +1,8 @@
 from flask_apispec import use_kwargs, marshal_with, MethodResource, doc
-from werkzeug.security import generate_password_hash, check_password_hash
 from flask_jwt_extended import create_access_token
 
 from app.extensions.db import db
+from app.extensions.hashing import hasher
 from app.common.schemas import MessageSchema
 from app.modules.user.models import UserModel
 from app.modules.auth.schemas import (
@@ -49,9 +49,7 @@ class SignUpView(MethodResource):
         user = UserModel(
             username=kwargs["username"],
             email=kwargs["email"],
-            password=generate_password_hash(
-                password=kwargs["password"], method="pbkdf2:sha256"
-            ),
+            password=hasher.hash(kwargs["password"]),
         )
         db.session.add(user)
         db.session.commit()
@@ -92,8 +90,14 @@ class LoginView(MethodResource):
         """
         user = UserModel.query.filter_by(username=kwargs["username"]).first()
 
-        if not user or not check_password_hash(user.password, kwargs["password"]):
+        if not user or not hasher.verify(user.password, kwargs["password"]):
             return {"message": "Invalid credentials"}, 401
 
-        access_token = create_access_token(identity=user.id)
+        # Upgrade hashes made with outdated parameters while the plain-text
+        # password is at hand.
+        if hasher.needs_rehash(user.password):
+            user.password = hasher.hash(kwargs["password"])
+            db.session.commit()
+
+        access_token = create_access_token(identity=user)
         return {"access_token": access_token}, 200
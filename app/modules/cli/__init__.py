@@ -1,7 +1,21 @@
 from flask import Flask
 
-from app.modules.cli.commands import create_admin_command
+from app.modules.cli.commands import (
+    create_admin_command,
+    export_docs_command,
+    export_tasks_command,
+    import_command,
+    init_db_command,
+    refresh_task_stats_command,
+    worker_command,
+)
 
 
 def init_cli(app: Flask):
     app.cli.add_command(create_admin_command)
+    app.cli.add_command(worker_command)
+    app.cli.add_command(init_db_command)
+    app.cli.add_command(export_docs_command)
+    app.cli.add_command(refresh_task_stats_command)
+    app.cli.add_command(export_tasks_command)
+    app.cli.add_command(import_command)
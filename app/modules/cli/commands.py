@@ -1,6 +1,20 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
 import click
+from flask import current_app
 from flask.cli import with_appcontext
+from flask_migrate import stamp
+from app.extensions.db import db
+from app.extensions.docs import docs
+from app.modules.cli.importer import IMPORT_BATCH_SIZE, read_records, run_import
 from app.modules.cli.utils import create_admin
+from app.modules.job.queue import enqueue
+from app.modules.job.worker import Worker
+from app.modules.task.export import EXPORT_BATCH_SIZE, export_tasks
+from app.modules.task.stats import refresh_summary
 
 
 @click.command("create-admin")
@@ -17,3 +31,152 @@ def create_admin_command():
         print(f"Admin {new_admin.username} created successfully.")
     except ValueError as e:
         print(f"Error: {e}")
+
+
+@click.command("worker")
+@click.option(
+    "--concurrency",
+    type=int,
+    help="Processes running jobs. Defaults to JOB_WORKER_CONCURRENCY.",
+)
+@click.option("--burst", is_flag=True, help="Exit once no job is ready to run.")
+@with_appcontext
+def worker_command(concurrency, burst):
+    """Run queued background jobs until stopped."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    config = current_app.config
+    worker = Worker(
+        current_app._get_current_object(),
+        concurrency or config["JOB_WORKER_CONCURRENCY"],
+        poll_interval=config["JOB_POLL_INTERVAL"],
+        lease=config["JOB_LEASE_SECONDS"],
+        retry_delay=config["JOB_RETRY_DELAY"],
+        burst=burst,
+    )
+    worker.run()
+
+
+@click.command("init-db")
+@with_appcontext
+def init_db_command():
+    """
+    Create all tables in an empty database and mark it as migrated.
+
+    The app does not create tables on startup; use this for a fresh
+    database and `flask db upgrade` to update an existing one.
+    """
+    db.create_all()
+    stamp()
+    print("Database created.")
+
+
+@click.command("export-docs")
+@click.option(
+    "--output", "-o", type=click.File("w"), default="-", help="Defaults to stdout."
+)
+@with_appcontext
+def export_docs_command(output):
+    """Write the OpenAPI spec, to be served through API_DOCS_PATH."""
+    output.write(docs.to_json())
+
+
+@click.command("refresh-task-stats")
+@click.option("--background", is_flag=True, help="Queue a job for `flask worker`.")
+@with_appcontext
+def refresh_task_stats_command(background):
+    """Rebuild the task statistics summary read by admins."""
+    if background:
+        job = enqueue(db.session, "refresh_task_stats", key="refresh_task_stats")
+        db.session.commit()
+        print(f"Job {job.id} queued.")
+        return
+
+    as_of = refresh_summary(db.session)
+    print(f"Task statistics refreshed as of {as_of.isoformat()}.")
+
+
+@click.command("export-tasks")
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(["ndjson", "csv"]),
+    default="ndjson",
+    show_default=True,
+)
+@click.option(
+    "--output", "-o", type=click.File("w"), default="-", help="Defaults to stdout."
+)
+@click.option("--batch-size", type=int, default=EXPORT_BATCH_SIZE, show_default=True)
+@with_appcontext
+def export_tasks_command(fmt, output, batch_size):
+    """Export all tasks as NDJSON or CSV."""
+    for chunk in export_tasks(db.session, fmt, "admin", None, batch_size):
+        output.write(chunk)
+
+
+@click.command("import")
+@click.argument("kind", type=click.Choice(["users", "categories", "tasks"]))
+@click.argument("source", type=click.File("r"))
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(["ndjson", "csv"]),
+    help="Defaults to csv for .csv files and ndjson otherwise.",
+)
+@click.option("--batch-size", type=int, default=IMPORT_BATCH_SIZE, show_default=True)
+@click.option(
+    "--workers",
+    type=int,
+    default=os.cpu_count(),
+    show_default="CPU count",
+    help="Processes hashing passwords.",
+)
+@click.option(
+    "--background",
+    is_flag=True,
+    help="Queue a job for `flask worker`, which reads the file.",
+)
+@with_appcontext
+def import_command(kind, source, fmt, batch_size, workers, background):
+    """Import users, categories or tasks from an NDJSON or CSV file."""
+    if fmt is None:
+        fmt = "csv" if source.name.endswith(".csv") else "ndjson"
+
+    if background:
+        if source.name == "<stdin>":
+            raise click.BadParameter("a file is required with --background.")
+        job = enqueue(
+            db.session,
+            "import",
+            dict(
+                kind=kind,
+                path=os.path.abspath(source.name),
+                fmt=fmt,
+                batch_size=batch_size,
+            ),
+        )
+        db.session.commit()
+        print(f"Job {job.id} queued.")
+        return
+
+    imported = skipped = 0
+    elapsed = 0.0
+    with ProcessPoolExecutor(workers) if kind == "users" else nullcontext() as pool:
+        batches = run_import(
+            db.session, kind, read_records(source, fmt), pool, batch_size
+        )
+        for imported, skipped, errors, elapsed in batches:
+            for number, message in errors:
+                click.echo(f"Record {number} skipped: {message}", err=True)
+            click.echo(
+                f"{imported} imported, {skipped} skipped, "
+                f"{imported / elapsed if elapsed else 0:.0f} rows/s",
+                err=True,
+            )
+
+    print(
+        f"Imported {imported} {kind} ({skipped} skipped) in {elapsed:.1f}s, "
+        f"{imported / elapsed if elapsed else 0:.0f} rows/s."
+    )
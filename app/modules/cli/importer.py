@@ -0,0 +1,251 @@
+import csv
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+
+from flask import current_app
+from marshmallow import EXCLUDE, ValidationError
+from sqlalchemy import insert, or_, select
+from werkzeug.security import generate_password_hash
+
+from app.common.signals import category_changed, tasks_changed
+from app.extensions.db import db
+from app.extensions.hashing import hasher
+from app.modules.job.queue import job_handler
+from app.modules.auth.schemas import SignUpRequestSchema
+from app.modules.cli.schemas import TaskImportSchema
+from app.modules.task.models import CategoryModel, TaskModel
+from app.modules.task.schemas import CategorySchema
+from app.modules.task.sync import reserve_versions
+from app.modules.user.models import UserModel
+
+IMPORT_BATCH_SIZE = 1000
+
+# Passwords sent to a hashing process at a time. A hash takes far longer
+# than the round trip, so small chunks keep every process busy.
+HASH_CHUNK_SIZE = 8
+
+# Record errors kept in the result of an import job.
+MAX_REPORTED_ERRORS = 100
+
+
+def read_records(stream, fmt):
+    """
+    Yield the records of an NDJSON or CSV stream, one at a time.
+
+    Empty CSV cells and JSON nulls are dropped so optional fields are simply
+    missing; files written by `flask export-tasks` import as they are.
+    """
+    if fmt == "csv":
+        for row in csv.DictReader(stream):
+            yield {key: value for key, value in row.items() if value != ""}
+    else:
+        for line in stream:
+            if line.strip():
+                record = json.loads(line)
+                yield {key: value for key, value in record.items() if value is not None}
+
+
+def _batches(records, size):
+    numbered = enumerate(records, start=1)
+    while batch := list(islice(numbered, size)):
+        yield batch
+
+
+def _validate(schema, batch):
+    valid, errors = [], []
+    for number, record in batch:
+        try:
+            valid.append((number, schema.load(record, unknown=EXCLUDE)))
+        except ValidationError as e:
+            errors.append((number, e.messages))
+    return valid, errors
+
+
+def import_users(session, batch, pool):
+    """
+    Insert a batch of users validated with `SignUpRequestSchema`.
+
+    Users whose username or email is taken, in the database or earlier in
+    the batch, are skipped. Passwords are hashed on the process pool.
+    """
+    valid, errors = _validate(SignUpRequestSchema(), batch)
+    usernames = {data["username"] for _, data in valid}
+    emails = {data["email"] for _, data in valid}
+    taken = session.execute(
+        select(UserModel.username, UserModel.email).where(
+            or_(UserModel.username.in_(usernames), UserModel.email.in_(emails))
+        )
+    ).all()
+    taken_usernames = {username for username, _ in taken}
+    taken_emails = {email for _, email in taken}
+
+    users = []
+    for number, data in valid:
+        if data["username"] in taken_usernames or data["email"] in taken_emails:
+            errors.append((number, "User already exists"))
+            continue
+        taken_usernames.add(data["username"])
+        taken_emails.add(data["email"])
+        users.append(data)
+
+    hash_password = partial(generate_password_hash, method=hasher.method)
+    passwords = pool.map(
+        hash_password,
+        [user["password"] for user in users],
+        chunksize=HASH_CHUNK_SIZE,
+    )
+    rows = [
+        {"username": user["username"], "email": user["email"], "password": password}
+        for user, password in zip(users, passwords)
+    ]
+    if rows:
+        session.execute(insert(UserModel), rows)
+    session.commit()
+    return len(rows), errors
+
+
+def import_categories(session, batch, pool):
+    """Insert a batch of categories, skipping names that already exist."""
+    valid, errors = _validate(CategorySchema(), batch)
+    taken = set(
+        session.scalars(
+            select(CategoryModel.name).where(
+                CategoryModel.name.in_({data["name"] for _, data in valid})
+            )
+        )
+    )
+
+    rows = []
+    for number, data in valid:
+        if data["name"] in taken:
+            errors.append((number, "Category already exists"))
+            continue
+        taken.add(data["name"])
+        rows.append(data)
+
+    ids = _insert_versioned(session, CategoryModel, rows)
+    session.commit()
+    for category_id in ids:
+        category_changed.send(
+            current_app._get_current_object(), action="create", category_id=category_id
+        )
+    return len(rows), errors
+
+
+def import_tasks(session, batch, pool):
+    """Insert a batch of tasks whose owner and category exist."""
+    valid, errors = _validate(TaskImportSchema(), batch)
+    user_ids = set(
+        session.scalars(
+            select(UserModel.id).where(
+                UserModel.id.in_({data["user_id"] for _, data in valid})
+            )
+        )
+    )
+    category_ids = set(
+        session.scalars(
+            select(CategoryModel.id).where(
+                CategoryModel.id.in_({data["category_id"] for _, data in valid})
+            )
+        )
+    )
+
+    rows = []
+    for number, data in valid:
+        if data["user_id"] not in user_ids:
+            errors.append((number, "User not found"))
+        elif data["category_id"] not in category_ids:
+            errors.append((number, "Category not found"))
+        else:
+            rows.append(data)
+
+    ids = _insert_versioned(session, TaskModel, rows)
+    session.commit()
+    if ids:
+        tasks_changed.send(
+            current_app._get_current_object(),
+            changes=[
+                {"action": "create", "task_id": task_id, "user_id": row["user_id"]}
+                for task_id, row in zip(ids, rows)
+            ],
+        )
+    return len(rows), errors
+
+
+def _insert_versioned(session, model, rows):
+    # Core inserts bypass the flush that stamps versions, so reserve them
+    # here; otherwise incremental sync would never see imported rows.
+    if not rows:
+        return []
+    first = reserve_versions(session, len(rows))
+    for offset, row in enumerate(rows):
+        row["version"] = first + offset
+    return session.scalars(
+        insert(model).returning(model.id, sort_by_parameter_order=True), rows
+    ).all()
+
+
+IMPORTERS = {
+    "users": import_users,
+    "categories": import_categories,
+    "tasks": import_tasks,
+}
+
+
+def run_import(session, kind, records, pool, batch_size=IMPORT_BATCH_SIZE):
+    """
+    Import `records` batch by batch, one transaction per batch.
+
+    Args:
+        session (Session): The session to write with.
+        kind (str): `users`, `categories` or `tasks`.
+        records (iterable): The records to import, read lazily.
+        pool (Executor): Process pool used to hash passwords (users only).
+        batch_size (int): Number of records validated and inserted together.
+
+    Yields:
+        tuple: After each batch, `(imported, skipped, errors, elapsed)` where
+        the counts are running totals and `errors` lists the
+        `(record number, message)` pairs of the batch.
+    """
+    importer = IMPORTERS[kind]
+    imported = skipped = 0
+    start = time.perf_counter()
+    for batch in _batches(records, batch_size):
+        try:
+            count, errors = importer(session, batch, pool)
+        except Exception:
+            session.rollback()
+            raise
+        imported += count
+        skipped += len(errors)
+        yield imported, skipped, errors, time.perf_counter() - start
+
+
+# Not retried: the batches committed before a failure would be imported
+# twice.
+@job_handler("import", max_attempts=1)
+def import_job(job, kind, path, fmt, batch_size=IMPORT_BATCH_SIZE):
+    """
+    Import a file in a worker, see `flask import --background`.
+
+    Returns:
+        dict: The counts and the first errors, as `(record number, message)`.
+    """
+    imported = skipped = 0
+    reported = []
+    # The job already runs in a pool process; passwords are hashed on
+    # threads, as the key derivation functions release the GIL.
+    workers = current_app.config["PASSWORD_HASH_WORKERS"]
+    with open(path, newline="") as source, ThreadPoolExecutor(workers) as pool:
+        batches = run_import(
+            db.session, kind, read_records(source, fmt), pool, batch_size
+        )
+        for imported, skipped, errors, _ in batches:
+            reported.extend(errors[: MAX_REPORTED_ERRORS - len(reported)])
+            job.progress = imported + skipped
+            db.session.commit()
+    return {"imported": imported, "skipped": skipped, "errors": reported}
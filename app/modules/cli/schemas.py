@@ -0,0 +1,9 @@
+from marshmallow import fields
+
+from app.modules.task.schemas import TaskViewPostRequestSchema
+
+
+class TaskImportSchema(TaskViewPostRequestSchema):
+    # Imported tasks name their owner, unlike tasks created through the API.
+    user_id = fields.Integer(required=True)
+    completed = fields.Boolean(load_default=False)
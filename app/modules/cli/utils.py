@@ -1,6 +1,5 @@
-from werkzeug.security import generate_password_hash
-
 from app.extensions.db import db
+from app.extensions.hashing import hasher
 from app.modules.auth.schemas import SignUpRequestSchema
 from app.modules.user.models import UserModel
 
@@ -17,9 +16,7 @@ def create_admin(username, email, password):
     new_admin = UserModel(
         username=user_data["username"],
         email=user_data["email"],
-        password=generate_password_hash(
-            password=user_data["password"], method="pbkdf2:sha256"
-        ),
+        password=hasher.hash(user_data["password"]),
         role="admin",
     )
     db.session.add(new_admin)
@@ -0,0 +1,8 @@
+from flask import Flask
+from app.modules.health.bp import health_bp
+from app.modules.health.docs import register_docs
+
+
+def init_health(app: Flask):
+    app.register_blueprint(health_bp)
+    register_docs()
@@ -0,0 +1,10 @@
+from flask import Blueprint
+from app.modules.health.views import HealthView
+
+health_bp = Blueprint("health", __name__, url_prefix="/health")
+
+health_bp.add_url_rule(
+    "/",
+    view_func=HealthView.as_view("health_view"),
+    methods=["GET"],
+)
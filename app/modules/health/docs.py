@@ -0,0 +1,7 @@
+from app.extensions.docs import docs
+
+from app.modules.health.views import HealthView
+
+
+def register_docs():
+    docs.register(HealthView, endpoint="health.health_view")
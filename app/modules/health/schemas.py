@@ -0,0 +1,8 @@
+from marshmallow import fields
+
+from app.common.schemas import FastDumpSchema
+
+
+class HealthResponseSchema(FastDumpSchema):
+    database = fields.Str()
+    pool = fields.Dict()
@@ -0,0 +1,38 @@
+from flask_apispec import marshal_with, MethodResource, doc
+from sqlalchemy import text
+
+from app.extensions.db import db, pool_metrics
+from app.modules.health.schemas import HealthResponseSchema
+
+
+class HealthView(MethodResource):
+    """
+    API endpoint reporting the health of the service.
+
+    Pings the database through the connection pool and reports the pool
+    counters, so load balancers can take an instance out of rotation when
+    its database is unreachable.
+
+    Returns:
+        200: If the database answered.
+        503: If the database could not be reached.
+    """
+
+    @doc(description="Check the service and database health.", tags=["Health"])
+    @marshal_with(HealthResponseSchema, code=200, description="Service is healthy.")
+    @marshal_with(HealthResponseSchema, code=503, description="Database unavailable.")
+    def get(self):
+        """
+        Ping the database and report pool metrics.
+
+        Returns:
+            dict: The database status and the pool metrics.
+        """
+        try:
+            db.session.execute(text("SELECT 1"))
+            status, code = "ok", 200
+        except Exception:
+            db.session.rollback()
+            status, code = "unavailable", 503
+
+        return {"database": status, "pool": pool_metrics.snapshot(db.engine.pool)}, code
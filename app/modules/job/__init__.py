@@ -0,0 +1,8 @@
+from flask import Flask
+from app.modules.job.bp import job_bp
+from app.modules.job.docs import register_docs
+
+
+def init_job(app: Flask):
+    app.register_blueprint(job_bp)
+    register_docs()
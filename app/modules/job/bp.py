@@ -0,0 +1,10 @@
+from flask import Blueprint
+from app.modules.job.views import JobView
+
+job_bp = Blueprint("job", __name__, url_prefix="/job")
+
+job_bp.add_url_rule(
+    "/<int:job_id>/",
+    view_func=JobView.as_view("get_job_view"),
+    methods=["GET"],
+)
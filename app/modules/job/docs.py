@@ -0,0 +1,7 @@
+from app.extensions.docs import docs
+
+from app.modules.job.views import JobView
+
+
+def register_docs():
+    docs.register(JobView, endpoint="job.get_job_view")
@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from app.extensions.db import db
+
+
+class JobModel(db.Model):
+    """
+    Background job run by `flask worker`, see `app.modules.job.queue`.
+    """
+
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Claim order: the next ready job.
+        db.Index("ix_jobs_status_run_at", "status", "run_at"),
+        db.Index("ix_jobs_key", "key"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(50), nullable=False)
+    args = db.Column(db.JSON, nullable=False, default=dict)
+    # Identifies the work being done, e.g. `purge:user:42`: an active job
+    # with the same key is reused instead of queueing a duplicate.
+    key = db.Column(db.String(100))
+    # The user who queued the job, who may follow it.
+    user_id = db.Column(db.Integer)
+    # pending, running, done or failed.
+    status = db.Column(db.String(20), nullable=False, default="pending")
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=1)
+    # Pending jobs are not claimed before this time; retries are delayed.
+    run_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    # The worker running the job and the end of its lease, extended while
+    # the job runs; an expired lease means the worker is gone.
+    locked_by = db.Column(db.String(100))
+    locked_until = db.Column(db.DateTime)
+    progress = db.Column(db.Integer, nullable=False, default=0)
+    total = db.Column(db.Integer)
+    result = db.Column(db.JSON)
+    error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = db.Column(
+        db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+    finished_at = db.Column(db.DateTime)
@@ -0,0 +1,270 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import aliased
+
+from app.modules.job.models import JobModel
+
+ACTIVE_STATUSES = ("pending", "running")
+
+# Longest delay between two attempts of a failing job, in seconds.
+MAX_RETRY_DELAY = 3600
+
+
+@dataclass(frozen=True)
+class JobHandler:
+    func: object
+    concurrency: int = None
+    max_attempts: int = 3
+
+
+# Job name -> handler, filled by `job_handler` as modules are imported.
+HANDLERS = {}
+
+
+def job_handler(name, concurrency=None, max_attempts=3):
+    """
+    Register a function as the handler of the jobs called `name`.
+
+    The handler runs in a worker process, inside an app context, as
+    `func(job, **job.args)`. It may update `job.progress` and commit along
+    with its own work, and returns a JSON-serializable result. Handlers
+    must be safe to run again: a failed or interrupted job is retried.
+
+    Args:
+        name (str): Name of the jobs, as passed to `enqueue`.
+        concurrency (int): At most this many jobs of the name run at once,
+            across all workers (optional).
+        max_attempts (int): Default number of attempts before a job fails.
+    """
+
+    def register(func):
+        HANDLERS[name] = JobHandler(func, concurrency, max_attempts)
+        return func
+
+    return register
+
+
+def enqueue(
+    session,
+    name,
+    args=None,
+    key=None,
+    user_id=None,
+    total=None,
+    max_attempts=None,
+    delay=0,
+):
+    """
+    Queue a job for `flask worker`. The caller commits.
+
+    Args:
+        session (Session): The session to write with.
+        name (str): Name of a registered job handler.
+        args (dict): Keyword arguments of the handler, JSON-serializable.
+        key (str): Identifies the work; if an active job has the same key,
+            it is returned instead of queueing another one (optional).
+        user_id (int): The user allowed to follow the job (optional).
+        total (int): Amount of work, for progress reporting (optional).
+        max_attempts (int): Overrides the handler's number of attempts.
+        delay (float): Seconds to wait before the job may run.
+
+    Returns:
+        JobModel: The queued job.
+    """
+    if name not in HANDLERS:
+        raise ValueError(f"Unknown job '{name}'.")
+    if key is not None:
+        job = session.scalars(
+            select(JobModel)
+            .where(JobModel.key == key, JobModel.status.in_(ACTIVE_STATUSES))
+            .limit(1)
+        ).first()
+        if job is not None:
+            return job
+
+    job = JobModel(
+        name=name,
+        args=args or {},
+        key=key,
+        user_id=user_id,
+        total=total,
+        max_attempts=max_attempts or HANDLERS[name].max_attempts,
+        run_at=datetime.utcnow() + timedelta(seconds=delay),
+    )
+    session.add(job)
+    session.flush()
+    return job
+
+
+def latest_job(session, key):
+    """Return the most recent job with `key`, or None."""
+    return session.scalars(
+        select(JobModel)
+        .where(JobModel.key == key)
+        .order_by(JobModel.id.desc())
+        .limit(1)
+    ).first()
+
+
+def _ready(now):
+    # Pending jobs that are due, and running jobs whose worker is gone.
+    return or_(
+        and_(JobModel.status == "pending", JobModel.run_at <= now),
+        and_(JobModel.status == "running", JobModel.locked_until < now),
+    )
+
+
+def reap(session, now):
+    """Fail the jobs whose worker is gone during their last attempt."""
+    session.execute(
+        update(JobModel)
+        .where(
+            JobModel.status == "running",
+            JobModel.locked_until < now,
+            JobModel.attempts >= JobModel.max_attempts,
+        )
+        .values(
+            status="failed",
+            error="The worker running the job stopped.",
+            locked_by=None,
+            locked_until=None,
+            finished_at=now,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _under_limit(name, concurrency, now):
+    # True while fewer than `concurrency` jobs called `name` hold a lease.
+    running = aliased(JobModel)
+    return (
+        select(func.count())
+        .where(
+            running.name == name,
+            running.status == "running",
+            running.locked_until >= now,
+        )
+        .scalar_subquery()
+        < concurrency
+    )
+
+
+def claim(session, worker, lease):
+    """
+    Take the next ready job for `worker`, honouring handler concurrency.
+
+    The candidate is picked with `FOR UPDATE SKIP LOCKED` where supported
+    and taken with a conditional UPDATE, so two workers never run the
+    same attempt. For handlers with a concurrency limit the UPDATE also
+    counts the running jobs of the name, so the limit holds across
+    workers: SQLite runs the statement under its write lock, and on
+    PostgreSQL claims of the name are serialized by an advisory lock held
+    until the commit. Commits.
+
+    Args:
+        session (Session): The session to write with.
+        worker (str): Name of the claiming worker.
+        lease (int): Seconds the job stays locked without a heartbeat.
+
+    Returns:
+        int: The ID of the claimed job, or None if no job is ready.
+    """
+    now = datetime.utcnow()
+    reap(session, now)
+    # Names seen at their limit are skipped for the rest of this claim.
+    full = []
+
+    while True:
+        candidate = session.execute(
+            select(JobModel.id, JobModel.name)
+            .where(_ready(now), JobModel.name.not_in(full))
+            .order_by(JobModel.run_at, JobModel.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        ).first()
+        if candidate is None:
+            session.commit()
+            return None
+
+        job_id, name = candidate
+        concurrency = HANDLERS[name].concurrency if name in HANDLERS else None
+        statement = update(JobModel).where(JobModel.id == job_id, _ready(now))
+        if concurrency is not None:
+            if session.get_bind().dialect.name == "postgresql":
+                session.execute(
+                    select(func.pg_advisory_xact_lock(func.hashtext(f"job:{name}")))
+                )
+            statement = statement.where(_under_limit(name, concurrency, now))
+
+        claimed = session.execute(
+            statement.values(
+                status="running",
+                attempts=JobModel.attempts + 1,
+                locked_by=worker,
+                locked_until=now + timedelta(seconds=lease),
+            ).execution_options(synchronize_session=False)
+        ).rowcount
+        session.commit()
+        if claimed:
+            return job_id
+        if concurrency is not None:
+            full.append(name)
+
+
+def heartbeat(session, worker, job_ids, lease):
+    """Extend the lease of the jobs `worker` is running. Commits."""
+    if job_ids:
+        session.execute(
+            update(JobModel)
+            .where(JobModel.id.in_(job_ids), JobModel.locked_by == worker)
+            .values(locked_until=datetime.utcnow() + timedelta(seconds=lease))
+            .execution_options(synchronize_session=False)
+        )
+    session.commit()
+
+
+def _finish(session, job_id, worker, **values):
+    # Only the worker holding the job may record its outcome.
+    session.execute(
+        update(JobModel)
+        .where(
+            JobModel.id == job_id,
+            JobModel.status == "running",
+            JobModel.locked_by == worker,
+        )
+        .values(locked_by=None, locked_until=None, **values)
+        .execution_options(synchronize_session=False)
+    )
+    session.commit()
+
+
+def complete(session, job_id, worker, result):
+    """Record the result of a successful job. Commits."""
+    _finish(
+        session,
+        job_id,
+        worker,
+        status="done",
+        result=result,
+        error=None,
+        finished_at=datetime.utcnow(),
+    )
+
+
+def fail(session, job_id, worker, error, retry_delay):
+    """
+    Record a failed attempt. Commits.
+
+    The job is queued again after `retry_delay` seconds, doubled at each
+    attempt, until it runs out of attempts.
+    """
+    job = session.get(JobModel, job_id, populate_existing=True)
+    now = datetime.utcnow()
+    if job.attempts < job.max_attempts:
+        delay = min(retry_delay * 2 ** (job.attempts - 1), MAX_RETRY_DELAY)
+        values = dict(status="pending", run_at=now + timedelta(seconds=delay))
+    else:
+        values = dict(status="failed", finished_at=now)
+    _finish(session, job_id, worker, error=error, **values)
@@ -0,0 +1,19 @@
+from marshmallow import fields
+
+from app.common.schemas import FastDumpSchema
+
+
+class JobSchema(FastDumpSchema):
+    id = fields.Int()
+    name = fields.Str()
+    status = fields.Str()
+    attempts = fields.Int()
+    max_attempts = fields.Int()
+    progress = fields.Int()
+    total = fields.Int(allow_none=True)
+    result = fields.Raw(allow_none=True)
+    error = fields.Str(allow_none=True)
+    run_at = fields.DateTime()
+    created_at = fields.DateTime()
+    updated_at = fields.DateTime()
+    finished_at = fields.DateTime(allow_none=True)
@@ -0,0 +1,42 @@
+from flask_apispec import marshal_with, MethodResource, doc
+from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
+
+from app.extensions.db import db
+from app.common.schemas import MessageSchema
+from app.modules.job.models import JobModel
+from app.modules.job.schemas import JobSchema
+
+
+class JobView(MethodResource):
+    """
+    API endpoint reporting the status and result of a background job.
+
+    Permissions:
+    - Admins can follow any job.
+    - Regular users can only follow the jobs they started.
+    """
+
+    @doc(
+        description="Get the status, progress and result of a background job.",
+        tags=["Jobs"],
+    )
+    @jwt_required()
+    @marshal_with(JobSchema, code=200, description="Job retrieved.")
+    @marshal_with(MessageSchema, code=404, description="Job not found.")
+    @marshal_with(MessageSchema, code=403, description="Access denied.")
+    def get(self, job_id):
+        """
+        Retrieve a background job.
+
+        Args:
+            job_id (int): ID of the job.
+
+        Returns:
+            dict: The job, with its result once done.
+        """
+        job = db.session.get(JobModel, job_id)
+        if job is None:
+            return {"message": "Job not found"}, 404
+        if get_jwt()["role"] != "admin" and job.user_id != get_jwt_identity():
+            return {"message": "Access denied"}, 403
+        return job, 200
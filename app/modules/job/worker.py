@@ -0,0 +1,151 @@
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from app.extensions.db import db
+from app.modules.job.models import JobModel
+from app.modules.job.queue import HANDLERS, claim, complete, fail, heartbeat
+
+logger = logging.getLogger(__name__)
+
+# App of a pool process, created once by `_init_process`.
+_app = None
+
+
+class JobError(Exception):
+    """A job handler failed; carries the original error as text."""
+
+
+def _init_process(db_url):
+    global _app
+    # Ctrl-C stops the worker, which lets running jobs finish.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    from app import create_app
+
+    _app = create_app(db_url)
+
+
+def perform(job_id):
+    """Run a claimed job in a pool process and return its result."""
+    with _app.app_context():
+        try:
+            job = db.session.get(JobModel, job_id)
+            result = HANDLERS[job.name].func(job, **job.args)
+            db.session.commit()
+            return result
+        except Exception as e:
+            # Raised again as a plain exception, which always pickles.
+            logger.exception("Job %s failed", job_id)
+            db.session.rollback()
+            raise JobError(f"{type(e).__name__}: {e}") from None
+        finally:
+            db.session.remove()
+
+
+class Worker:
+    """
+    Runs queued jobs on a pool of processes until stopped.
+
+    The worker claims ready jobs while it has idle processes, extends their
+    leases while they run and records their outcome. Jobs run in separate
+    processes with their own app and engine, so CPU-heavy work never holds
+    the GIL of the worker or of the web server. SIGINT and SIGTERM stop
+    claiming; running jobs are finished first.
+
+    Args:
+        app (Flask): The app holding the queue's database.
+        concurrency (int): Number of pool processes.
+        poll_interval (float): Seconds between polls while idle.
+        lease (int): Seconds a job stays locked without a heartbeat.
+        retry_delay (float): Seconds before the first retry of a failed job.
+        burst (bool): Exit once no job is ready instead of waiting for more.
+    """
+
+    def __init__(
+        self, app, concurrency, poll_interval=1.0, lease=60, retry_delay=10, burst=False
+    ):
+        self.app = app
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.lease = lease
+        self.retry_delay = retry_delay
+        self.burst = burst
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self.stopping = False
+
+    def stop(self, *args):
+        self.stopping = True
+
+    def _start_pool(self):
+        # Spawned, not forked: pool processes never share the worker's
+        # database connections.
+        return ProcessPoolExecutor(
+            self.concurrency,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_process,
+            initargs=(self.app.config["SQLALCHEMY_DATABASE_URI"],),
+        )
+
+    def run(self):
+        """Process jobs until stopped, or until idle in burst mode."""
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.stop)
+            signal.signal(signal.SIGINT, self.stop)
+        logger.info("Worker %s started with %d processes", self.name, self.concurrency)
+
+        with self.app.app_context():
+            session = db.session
+            pool = self._start_pool()
+            running = {}
+            try:
+                while running or not self.stopping:
+                    heartbeat(session, self.name, list(running.values()), self.lease)
+                    while not self.stopping and len(running) < self.concurrency:
+                        job_id = claim(session, self.name, self.lease)
+                        if job_id is None:
+                            break
+                        running[pool.submit(perform, job_id)] = job_id
+
+                    if not running:
+                        if self.burst:
+                            break
+                        time.sleep(self.poll_interval)
+                        continue
+
+                    done, _ = wait(
+                        running, timeout=self.poll_interval, return_when=FIRST_COMPLETED
+                    )
+                    broken = False
+                    for future in done:
+                        job_id = running.pop(future)
+                        try:
+                            result = future.result()
+                        except BrokenProcessPool:
+                            broken = True
+                            self._failed(session, job_id, "The job process died.")
+                        except Exception as e:
+                            self._failed(session, job_id, str(e))
+                        else:
+                            complete(session, job_id, self.name, result)
+                            logger.info("Job %s done", job_id)
+                    if broken:
+                        # Every job of a broken pool fails; start a new one.
+                        for future, job_id in running.items():
+                            self._failed(session, job_id, "The job process died.")
+                        running.clear()
+                        pool.shutdown(wait=False)
+                        pool = self._start_pool()
+            finally:
+                pool.shutdown()
+                db.session.remove()
+        logger.info("Worker %s stopped", self.name)
+
+    def _failed(self, session, job_id, error):
+        logger.warning("Job %s failed: %s", job_id, error)
+        fail(session, job_id, self.name, error, self.retry_delay)
@@ -0,0 +1,64 @@
+def plan_batch(operations, tasks, known_categories, user_id, user_role):
+    """
+    Decide the outcome of every operation of a task batch.
+
+    Nothing is written here: the caller applies the planned creates, updates
+    and deletes to its session, so the same rules serve every transport.
+
+    Args:
+        operations (list): Operations loaded by `TaskBatchRequestSchema`.
+        tasks (dict): Tasks referenced by the operations, by ID.
+        known_categories (set): IDs of the referenced categories that exist.
+        user_id (int): ID of the current user.
+        user_role (str): Role of the current user.
+
+    Returns:
+        tuple: `(results, changes, creates, updates, deletes)`. `results`
+        holds one entry per operation in request order and `changes` the
+        change events of the successful ones. `creates` holds
+        `(result, change, data)` triples whose `task_id` must be filled in
+        once the new task has an ID. `updates` holds `(task, data)` pairs and
+        `deletes` the tasks to delete.
+    """
+    tasks = dict(tasks)
+    results = []
+    changes = []
+    creates = []
+    updates = []
+    deletes = []
+
+    for item in operations:
+        op, data = item["op"], item["data"]
+        task_id = item.get("task_id")
+        result = {"op": op, "task_id": task_id}
+        results.append(result)
+
+        if "category_id" in data and data["category_id"] not in known_categories:
+            result.update(status=400, message="Category not found")
+            continue
+
+        if op == "create":
+            change = {"action": op, "user_id": user_id}
+            changes.append(change)
+            creates.append((result, change, data))
+            result.update(status=201, message="Task created successfully")
+            continue
+
+        task = tasks.get(task_id)
+        if task is None:
+            result.update(status=404, message="Task not found")
+            continue
+        if user_role != "admin" and task.user_id != user_id:
+            result.update(status=403, message="Access denied")
+            continue
+
+        changes.append({"action": op, "task_id": task_id, "user_id": task.user_id})
+        if op == "update":
+            updates.append((task, data))
+            result.update(status=200, message="Task updated successfully")
+        else:
+            deletes.append(task)
+            del tasks[task_id]
+            result.update(status=200, message="Task deleted successfully")
+
+    return results, changes, creates, updates, deletes
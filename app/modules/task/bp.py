@@ -1,17 +1,33 @@
 from flask import Blueprint
-from app.modules.task.views import TasksView, CategoryView
+from app.common.caching import conditional_response
+from app.modules.task.views import (
+    TasksView,
+    TaskListView,
+    TaskBatchView,
+    TaskChangesView,
+    TaskExportView,
+    TaskSearchView,
+    TaskStatsView,
+    TaskStreamView,
+    CategoryView,
+    CategoryListView,
+    CategoryPurgeView,
+)
 
 task_bp = Blueprint("task", __name__, url_prefix="/task", template_folder="templates")
 category_bp = Blueprint(
     "category", __name__, url_prefix="/category", template_folder="templates"
 )
 
+task_bp.after_request(conditional_response)
+category_bp.after_request(conditional_response)
+
 
 # Category routes
 
 category_bp.add_url_rule(
     "/",
-    view_func=CategoryView.as_view("get_all_category_view"),
+    view_func=CategoryListView.as_view("get_all_category_view"),
     methods=["GET"],
 )
 
@@ -33,11 +49,17 @@ category_bp.add_url_rule(
     methods=["DELETE"],
 )
 
+category_bp.add_url_rule(
+    "/<int:category_id>/purge/",
+    view_func=CategoryPurgeView.as_view("purge_category_view"),
+    methods=["GET"],
+)
+
 # Task routes
 
 task_bp.add_url_rule(
     "/",
-    view_func=TasksView.as_view("get_all_task_view"),
+    view_func=TaskListView.as_view("get_all_task_view"),
     methods=["GET"],
 )
 
@@ -64,3 +86,39 @@ task_bp.add_url_rule(
     view_func=TasksView.as_view("delete_task_view"),
     methods=["DELETE"],
 )
+
+task_bp.add_url_rule(
+    "/batch/",
+    view_func=TaskBatchView.as_view("batch_task_view"),
+    methods=["POST"],
+)
+
+task_bp.add_url_rule(
+    "/stream/",
+    view_func=TaskStreamView.as_view("stream_task_view"),
+    methods=["GET"],
+)
+
+task_bp.add_url_rule(
+    "/changes/",
+    view_func=TaskChangesView.as_view("changes_task_view"),
+    methods=["GET"],
+)
+
+task_bp.add_url_rule(
+    "/search/",
+    view_func=TaskSearchView.as_view("search_task_view"),
+    methods=["GET"],
+)
+
+task_bp.add_url_rule(
+    "/stats/",
+    view_func=TaskStatsView.as_view("stats_task_view"),
+    methods=["GET"],
+)
+
+task_bp.add_url_rule(
+    "/export/",
+    view_func=TaskExportView.as_view("export_task_view"),
+    methods=["GET"],
+)
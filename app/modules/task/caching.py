@@ -0,0 +1,28 @@
+from app.common.signals import category_changed, tasks_changed, user_changed
+from app.extensions.cache import cache
+
+CATEGORIES = "categories"
+ALL_TASKS = "tasks:all"
+
+
+def user_tasks(user_id):
+    """Cache namespace of the tasks owned by `user_id`."""
+    return f"tasks:user:{user_id}"
+
+
+@tasks_changed.connect
+def invalidate_tasks(sender, changes, **kwargs):
+    owners = {user_tasks(change["user_id"]) for change in changes}
+    cache.invalidate(ALL_TASKS, *owners)
+
+
+@category_changed.connect
+def invalidate_categories(sender, **kwargs):
+    # Task payloads embed their category, so this also drops task pages.
+    cache.invalidate(CATEGORIES)
+
+
+@user_changed.connect
+def invalidate_user_tasks(sender, action, user_id, **kwargs):
+    if action == "delete":
+        cache.invalidate(ALL_TASKS, user_tasks(user_id))
@@ -1,18 +1,37 @@
 from app.extensions.docs import docs
 
-from app.modules.task.views import CategoryView, TasksView
+from app.modules.task.views import (
+    CategoryView,
+    CategoryListView,
+    CategoryPurgeView,
+    TasksView,
+    TaskListView,
+    TaskBatchView,
+    TaskChangesView,
+    TaskExportView,
+    TaskSearchView,
+    TaskStatsView,
+    TaskStreamView,
+)
 
 
 def register_docs():
     # Categories
-    docs.register(CategoryView, endpoint="category.get_all_category_view")
+    docs.register(CategoryListView, endpoint="category.get_all_category_view")
     docs.register(CategoryView, endpoint="category.get_category_view")
     docs.register(CategoryView, endpoint="category.post_category_view")
     docs.register(CategoryView, endpoint="category.delete_category_view")
+    docs.register(CategoryPurgeView, endpoint="category.purge_category_view")
 
     # Tasks
-    docs.register(TasksView, endpoint="task.get_all_task_view")
+    docs.register(TaskListView, endpoint="task.get_all_task_view")
     docs.register(TasksView, endpoint="task.get_task_view")
     docs.register(TasksView, endpoint="task.post_task_view")
     docs.register(TasksView, endpoint="task.put_task_view")
     docs.register(TasksView, endpoint="task.delete_task_view")
+    docs.register(TaskBatchView, endpoint="task.batch_task_view")
+    docs.register(TaskStreamView, endpoint="task.stream_task_view")
+    docs.register(TaskChangesView, endpoint="task.changes_task_view")
+    docs.register(TaskSearchView, endpoint="task.search_task_view")
+    docs.register(TaskStatsView, endpoint="task.stats_task_view")
+    docs.register(TaskExportView, endpoint="task.export_task_view")
@@ -0,0 +1,117 @@
+import csv
+import io
+import json
+
+from sqlalchemy import select
+
+from app.modules.task.models import TaskModel
+from app.modules.task.queries import filter_tasks
+
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_COLUMNS = (
+    TaskModel.id,
+    TaskModel.title,
+    TaskModel.description,
+    TaskModel.due_date,
+    TaskModel.completed,
+    TaskModel.category_id,
+    TaskModel.user_id,
+    TaskModel.version,
+)
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _record(row):
+    record = row._asdict()
+    if record["due_date"] is not None:
+        record["due_date"] = record["due_date"].isoformat()
+    return record
+
+
+def _ndjson(rows):
+    return "".join(
+        json.dumps(_record(row), separators=(",", ":")) + "\n" for row in rows
+    )
+
+
+def _csv(rows):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(_record(row).values() for row in rows)
+    return buffer.getvalue()
+
+
+def _csv_header():
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(column.key for column in EXPORT_COLUMNS)
+    return buffer.getvalue()
+
+
+def export_statement(user_role, user_id, batch_size=EXPORT_BATCH_SIZE):
+    """
+    Build the statement reading the tasks to export, in ID order.
+
+    Plain columns are selected instead of `TaskModel` objects so rows never
+    enter the session's identity map. `yield_per` makes the driver fetch
+    `batch_size` rows at a time, through a server-side cursor on PostgreSQL.
+
+    Args:
+        user_role (str): Role of the exporting user; admins export every task.
+        user_id (int): ID of the exporting user.
+        batch_size (int): Number of rows fetched and encoded at a time.
+
+    Returns:
+        Select: The export statement.
+    """
+    stmt = select(*EXPORT_COLUMNS).order_by(TaskModel.id)
+    stmt = filter_tasks(stmt, user_role, user_id)
+    return stmt.execution_options(yield_per=batch_size)
+
+
+def _encoder(fmt):
+    if fmt == "csv":
+        return _csv_header(), _csv
+    if fmt == "ndjson":
+        return None, _ndjson
+    raise ValueError(f"Unknown export format '{fmt}'")
+
+
+def export_tasks(session, fmt, user_role, user_id, batch_size=EXPORT_BATCH_SIZE):
+    """
+    Encode tasks as NDJSON or CSV, one batch of rows at a time.
+
+    Only one batch is held in memory at once, so memory use does not depend
+    on the number of exported tasks.
+
+    Args:
+        session (Session): The session to read with.
+        fmt (str): `ndjson` or `csv`.
+        user_role (str): Role of the exporting user; admins export every task.
+        user_id (int): ID of the exporting user.
+        batch_size (int): Number of rows fetched and encoded at a time.
+
+    Yields:
+        str: Encoded chunks of the export.
+    """
+    header, encode = _encoder(fmt)
+    if header:
+        yield header
+    result = session.execute(export_statement(user_role, user_id, batch_size))
+    for rows in result.partitions():
+        yield encode(rows)
+
+
+async def export_tasks_async(
+    session, fmt, user_role, user_id, batch_size=EXPORT_BATCH_SIZE
+):
+    """Asynchronous version of `export_tasks` for an `AsyncSession`."""
+    header, encode = _encoder(fmt)
+    if header:
+        yield header
+    result = await session.stream(export_statement(user_role, user_id, batch_size))
+    async for rows in result.partitions():
+        yield encode(rows)
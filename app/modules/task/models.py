@@ -3,16 +3,34 @@ from app.extensions.db import db
 
 class TaskModel(db.Model):
     __tablename__ = "tasks"
+    __table_args__ = (
+        db.Index(
+            "ix_tasks_user_id_completed_due_date", "user_id", "completed", "due_date"
+        ),
+        db.Index("ix_tasks_category_id", "category_id"),
+        db.Index("ix_tasks_user_id_version", "user_id", "version"),
+        db.Index("ix_tasks_version", "version"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text)
-    due_date = db.Column(db.Text)
+    due_date = db.Column(db.DateTime)
     completed = db.Column(db.Boolean, default=False)
-    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
-    category_id = db.Column(db.Integer, db.ForeignKey("categories.id"), nullable=False)
+    user_id = db.Column(
+        db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    category_id = db.Column(
+        db.Integer, db.ForeignKey("categories.id", ondelete="CASCADE"), nullable=False
+    )
+    version = db.Column(db.BigInteger, nullable=False, default=0, server_default="0")
 
-    category = db.relationship("CategoryModel", backref="tasks")
+    # Tasks of a deleted category are removed by the database, the ORM never
+    # loads them.
+    category = db.relationship(
+        "CategoryModel",
+        backref=db.backref("tasks", cascade="all", passive_deletes=True),
+    )
 
 
 class CategoryModel(db.Model):
@@ -20,3 +38,48 @@ class CategoryModel(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(50), nullable=False, unique=True)
+    version = db.Column(
+        db.BigInteger, nullable=False, default=0, server_default="0", index=True
+    )
+
+
+class TombstoneModel(db.Model):
+    """A deleted task or category, kept so clients can sync the deletion."""
+
+    __tablename__ = "tombstones"
+    __table_args__ = (
+        db.Index("ix_tombstones_user_id_version", "user_id", "version"),
+        db.Index("ix_tombstones_version", "version"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    entity = db.Column(db.String(20), nullable=False)
+    entity_id = db.Column(db.Integer, nullable=False)
+    # Owner of a deleted task; NULL for categories, which everyone sees.
+    user_id = db.Column(db.Integer)
+    version = db.Column(db.BigInteger, nullable=False)
+
+
+class TaskStatsModel(db.Model):
+    """
+    Materialized task counts by category, completion and due-date bucket,
+    as of `refreshed_at`. Rebuilt by `flask refresh-task-stats`.
+    """
+
+    __tablename__ = "task_stats"
+
+    id = db.Column(db.Integer, primary_key=True)
+    category_id = db.Column(db.Integer)
+    completed = db.Column(db.Boolean, nullable=False)
+    bucket = db.Column(db.String(20), nullable=False)
+    count = db.Column(db.Integer, nullable=False)
+    refreshed_at = db.Column(db.DateTime, nullable=False)
+
+
+class ChangeCounterModel(db.Model):
+    """Single-row counter handing out change versions."""
+
+    __tablename__ = "change_counter"
+
+    id = db.Column(db.Integer, primary_key=True)
+    value = db.Column(db.BigInteger, nullable=False)
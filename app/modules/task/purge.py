@@ -0,0 +1,170 @@
+from flask import current_app
+from sqlalchemy import delete, func, insert, select
+
+from app.common.signals import category_changed, tasks_changed, user_changed
+from app.extensions.db import db
+from app.modules.job.queue import enqueue, job_handler, latest_job
+from app.modules.task.models import CategoryModel, TaskModel, TombstoneModel
+from app.modules.task.sync import reserve_versions
+from app.modules.user.models import UserModel
+
+PURGE_CHUNK_SIZE = 1000
+
+# Entity name -> (model, task column referencing it).
+PURGE_TARGETS = {
+    "user": (UserModel, TaskModel.user_id),
+    "category": (CategoryModel, TaskModel.category_id),
+}
+
+
+def count_tasks(session, entity, entity_id):
+    """Return the number of tasks that deleting the entity would remove."""
+    column = PURGE_TARGETS[entity][1]
+    return session.scalar(
+        select(func.count()).select_from(TaskModel).where(column == entity_id)
+    )
+
+
+def delete_tasks(session, entity, entity_id, limit=None):
+    """
+    Delete tasks of a user or a category and record their tombstones.
+
+    The version counter is locked first, so no task of the entity can be
+    created or changed until the transaction ends and every deleted task
+    gets a tombstone. The caller commits.
+
+    Args:
+        session (Session): The session to write with.
+        entity (str): `user` or `category`.
+        entity_id (int): ID of the user or category.
+        limit (int): Delete at most this many tasks, oldest first (optional).
+
+    Returns:
+        list: `tasks_changed` changes for the deleted tasks.
+    """
+    column = PURGE_TARGETS[entity][1]
+    reserve_versions(session, 0)
+    rows = session.execute(
+        select(TaskModel.id, TaskModel.user_id)
+        .where(column == entity_id)
+        .order_by(TaskModel.id)
+        .limit(limit)
+    ).all()
+    if not rows:
+        return []
+
+    version = reserve_versions(session, len(rows))
+    session.execute(
+        insert(TombstoneModel),
+        [
+            dict(entity="task", entity_id=task_id, user_id=user_id, version=version + i)
+            for i, (task_id, user_id) in enumerate(rows)
+        ],
+    )
+    session.execute(
+        delete(TaskModel)
+        .where(TaskModel.id.in_([task_id for task_id, _ in rows]))
+        .execution_options(synchronize_session=False)
+    )
+    return [
+        {"action": "delete", "task_id": task_id, "user_id": user_id}
+        for task_id, user_id in rows
+    ]
+
+
+def delete_entity(session, entity, entity_id):
+    """
+    Delete a user or a category together with its tasks, in one transaction.
+
+    Meant for entities with few tasks; larger ones go through `start_purge`.
+    Pass the result to `send_delete_signals` once committed.
+
+    Returns:
+        list: `tasks_changed` changes for the deleted tasks, or None if the
+        entity does not exist.
+    """
+    model = PURGE_TARGETS[entity][0]
+    obj = session.get(model, entity_id)
+    if obj is None:
+        return None
+
+    changes = delete_tasks(session, entity, entity_id)
+    # Anything left is removed by ON DELETE CASCADE.
+    session.delete(obj)
+    return changes
+
+
+def send_delete_signals(app, entity, entity_id, changes):
+    """Announce the committed deletion of an entity and its tasks."""
+    if changes:
+        tasks_changed.send(app, changes=changes)
+    if entity == "user":
+        user_changed.send(app, action="delete", user_id=entity_id)
+    else:
+        category_changed.send(app, action="delete", category_id=entity_id)
+
+
+def _purge_key(entity, entity_id):
+    return f"purge:{entity}:{entity_id}"
+
+
+def latest_purge(session, entity, entity_id):
+    """Return the most recent purge job of an entity, or None."""
+    return latest_job(session, _purge_key(entity, entity_id))
+
+
+def start_purge(
+    session, entity, entity_id, total, chunk_size=PURGE_CHUNK_SIZE, user_id=None
+):
+    """
+    Queue the deletion of an entity with many tasks for `flask worker`.
+
+    Tasks are deleted in chunks of `chunk_size`, each in its own short
+    transaction, so memory use and lock time stay bounded whatever the
+    number of tasks; the entity itself goes last. A job already pending or
+    running for the entity is returned instead of queueing another one.
+
+    Args:
+        session (Session): The session to queue the job with.
+        entity (str): `user` or `category`.
+        entity_id (int): ID of the user or category.
+        total (int): Number of tasks to delete, for progress reporting.
+        chunk_size (int): Tasks deleted per transaction.
+        user_id (int): The user asking for the deletion (optional).
+
+    Returns:
+        JobModel: The job, whose progress can be polled.
+    """
+    job = enqueue(
+        session,
+        "purge",
+        dict(entity=entity, entity_id=entity_id, chunk_size=chunk_size),
+        key=_purge_key(entity, entity_id),
+        user_id=user_id,
+        total=total,
+    )
+    session.commit()
+    return job
+
+
+# Purges run one at a time, so they never compete with each other for
+# locks. Running a purge again resumes it.
+@job_handler("purge", concurrency=1)
+def purge(job, entity, entity_id, chunk_size):
+    """Carry out a purge job queued by `start_purge`."""
+    app = current_app._get_current_object()
+    session = db.session
+    while True:
+        changes = delete_tasks(session, entity, entity_id, chunk_size)
+        job.progress += len(changes)
+        session.commit()
+        if changes:
+            tasks_changed.send(app, changes=changes)
+        if len(changes) < chunk_size:
+            break
+
+    changes = delete_entity(session, entity, entity_id)
+    session.commit()
+    if changes is not None:
+        send_delete_signals(app, entity, entity_id, changes)
+    return {"deleted": job.progress}
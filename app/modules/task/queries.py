@@ -0,0 +1,43 @@
+from app.modules.task.models import TaskModel
+
+TASK_SORT_COLUMNS = {
+    "id": (TaskModel.id,),
+    "title": (TaskModel.title, TaskModel.id),
+}
+
+
+def filter_tasks(
+    query,
+    user_role,
+    user_id,
+    completed=None,
+    due_after=None,
+    due_before=None,
+):
+    """
+    Apply the visibility rules and list filters to a task query.
+
+    Works on both ORM `Query` objects and `select(TaskModel)` statements.
+    Filters are applied in SQL so they can use the
+    `(user_id, completed, due_date)` index.
+
+    Args:
+        query: The query or statement to filter.
+        user_role (str): Role of the current user; admins see every task.
+        user_id (int): ID of the current user.
+        completed (bool): Only completed or only open tasks (optional).
+        due_after (datetime): Only tasks due at or after this time (optional).
+        due_before (datetime): Only tasks due strictly before this time (optional).
+
+    Returns:
+        The filtered query.
+    """
+    if user_role != "admin":
+        query = query.filter_by(user_id=user_id)
+    if completed is not None:
+        query = query.filter_by(completed=completed)
+    if due_after is not None:
+        query = query.filter(TaskModel.due_date >= due_after)
+    if due_before is not None:
+        query = query.filter(TaskModel.due_date < due_before)
+    return query
@@ -1,32 +1,166 @@
-from marshmallow import Schema, fields
+from datetime import timezone
+from marshmallow import (
+    Schema,
+    ValidationError,
+    fields,
+    post_load,
+    validate,
+    validates_schema,
+)
 from typing import Type
 
+from app.common.pagination import DEFAULT_LIMIT, MAX_LIMIT
+from app.common.schemas import (
+    FastDumpSchema,
+    PaginationQuerySchema,
+    PaginatedResponseSchema,
+)
 
-class CategorySchema(Schema):
+
+class CategorySchema(FastDumpSchema):
     id = fields.Int(dump_only=True)
     name = fields.String(required=True)
+    version = fields.Int(dump_only=True)
 
 
-class TaskViewResponseSchema(Schema):
+class TaskViewResponseSchema(FastDumpSchema):
     id = fields.Int(dump_only=True)
     title = fields.Str(required=True)
     description = fields.Str()
-    due_date = fields.Str()
+    due_date = fields.DateTime()
     completed = fields.Bool()
     category_id = fields.Int(required=True)
     category = fields.Nested(CategorySchema(), dump_only=True)
+    version = fields.Int(dump_only=True)
+
+
+class TaskListQuerySchema(PaginationQuerySchema):
+    sort = fields.Str(load_default="id", validate=validate.OneOf(["id", "title"]))
+    due_before = fields.NaiveDateTime(timezone=timezone.utc)
+    due_after = fields.NaiveDateTime(timezone=timezone.utc)
+    completed = fields.Boolean()
+
+
+class TaskSearchQuerySchema(PaginationQuerySchema):
+    q = fields.Str(required=True, validate=validate.Length(min=1, max=200))
+
+
+class TaskExportQuerySchema(Schema):
+    format = fields.Str(
+        load_default="ndjson", validate=validate.OneOf(["ndjson", "csv"])
+    )
+
+
+class TaskListResponseSchema(PaginatedResponseSchema):
+    items = fields.List(fields.Nested(TaskViewResponseSchema()))
 
 
 class TaskViewPostRequestSchema(Schema):
     title = fields.String(required=True)
     description = fields.String()
-    due_date = fields.String()
+    due_date = fields.NaiveDateTime(timezone=timezone.utc, allow_none=True)
     category_id = fields.Integer(required=True)
 
 
 class TaskViewPutRequestSchema(Schema):
     title = fields.String()
     description = fields.String()
-    due_date = fields.String()
+    due_date = fields.NaiveDateTime(timezone=timezone.utc, allow_none=True)
     completed = fields.Boolean()
     category_id = fields.Integer()
+
+
+MAX_BATCH_SIZE = 1000
+
+
+class TaskBatchOperationSchema(Schema):
+    op = fields.Str(
+        required=True, validate=validate.OneOf(["create", "update", "delete"])
+    )
+    task_id = fields.Integer()
+    data = fields.Dict(load_default=dict)
+
+    data_schemas = {
+        "create": TaskViewPostRequestSchema(),
+        "update": TaskViewPutRequestSchema(),
+    }
+
+    @validates_schema
+    def validate_task_id(self, data, **kwargs):
+        if data["op"] != "create" and "task_id" not in data:
+            raise ValidationError(
+                f"task_id is required for {data['op']} operations.", "task_id"
+            )
+
+    @post_load
+    def load_data(self, data, **kwargs):
+        schema = self.data_schemas.get(data["op"])
+        if schema is None:
+            data["data"] = {}
+        else:
+            try:
+                data["data"] = schema.load(data["data"])
+            except ValidationError as e:
+                raise ValidationError(e.messages, "data")
+        return data
+
+
+class TaskBatchRequestSchema(Schema):
+    operations = fields.List(
+        fields.Nested(TaskBatchOperationSchema()),
+        required=True,
+        validate=validate.Length(min=1, max=MAX_BATCH_SIZE),
+    )
+
+
+class TaskBatchResultSchema(FastDumpSchema):
+    op = fields.Str()
+    task_id = fields.Int(allow_none=True)
+    status = fields.Int()
+    message = fields.Str()
+
+
+class TaskBatchResponseSchema(FastDumpSchema):
+    results = fields.List(fields.Nested(TaskBatchResultSchema()))
+
+
+class TaskChangesQuerySchema(Schema):
+    since = fields.Int(load_default=0, validate=validate.Range(min=0))
+    limit = fields.Int(
+        load_default=DEFAULT_LIMIT, validate=validate.Range(min=1, max=MAX_LIMIT)
+    )
+
+
+class TaskChangesResponseSchema(FastDumpSchema):
+    tasks = fields.List(fields.Nested(TaskViewResponseSchema()))
+    categories = fields.List(fields.Nested(CategorySchema()))
+    deleted_tasks = fields.List(fields.Int())
+    deleted_categories = fields.List(fields.Int())
+    version = fields.Int()
+    has_more = fields.Bool()
+
+
+class TaskDueStatsSchema(FastDumpSchema):
+    overdue = fields.Int()
+    next_24h = fields.Int()
+    next_7_days = fields.Int()
+    later = fields.Int()
+    none = fields.Int()
+
+
+class CategoryStatsSchema(FastDumpSchema):
+    category_id = fields.Int(allow_none=True)
+    total = fields.Int()
+    completed = fields.Int()
+    open = fields.Int()
+    overdue = fields.Int()
+
+
+class TaskStatsSchema(FastDumpSchema):
+    total = fields.Int()
+    completed = fields.Int()
+    open = fields.Int()
+    overdue = fields.Int()
+    due = fields.Nested(TaskDueStatsSchema())
+    categories = fields.List(fields.Nested(CategoryStatsSchema()))
+    as_of = fields.DateTime()
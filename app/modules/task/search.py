@@ -0,0 +1,144 @@
+import re
+
+from sqlalchemy import column, event, func, literal_column, select, table, text
+from sqlalchemy.orm import joinedload
+
+from app.common.pagination import encode_cursor, seek
+from app.modules.task.models import TaskModel
+from app.modules.task.queries import filter_tasks
+
+# Matches in a title count this many times more than in a description.
+TITLE_WEIGHT = 10.0
+
+# External-content FTS5 index over `tasks`. Triggers keep it in sync with
+# every write to the table, whichever code path makes it.
+SQLITE_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5("
+    "title, description, content='tasks', content_rowid='id', "
+    "tokenize='porter unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_update "
+    "AFTER UPDATE OF title, description ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO tasks_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')",
+)
+SQLITE_DROP_DDL = (
+    "DROP TRIGGER IF EXISTS tasks_fts_update",
+    "DROP TRIGGER IF EXISTS tasks_fts_delete",
+    "DROP TRIGGER IF EXISTS tasks_fts_insert",
+    "DROP TABLE IF EXISTS tasks_fts",
+)
+
+# Postgres maintains an expression index by itself; queries must use the
+# exact same expression for the planner to pick it.
+TSVECTOR = (
+    "setweight(to_tsvector('english', coalesce(tasks.title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(tasks.description, '')), 'B')"
+)
+POSTGRES_DDL = (
+    f"CREATE INDEX IF NOT EXISTS ix_tasks_search ON tasks USING gin (({TSVECTOR}))",
+)
+POSTGRES_DROP_DDL = ("DROP INDEX IF EXISTS ix_tasks_search",)
+
+tasks_fts = table("tasks_fts", column("rowid"))
+
+
+def create_search_index(connection):
+    """Create the full-text index of tasks, if the database supports one."""
+    ddl = {"sqlite": SQLITE_DDL, "postgresql": POSTGRES_DDL}
+    for statement in ddl.get(connection.dialect.name, ()):
+        connection.execute(text(statement))
+
+
+def drop_search_index(connection):
+    """Drop the full-text index of tasks."""
+    ddl = {"sqlite": SQLITE_DROP_DDL, "postgresql": POSTGRES_DROP_DDL}
+    for statement in ddl.get(connection.dialect.name, ()):
+        connection.execute(text(statement))
+
+
+@event.listens_for(TaskModel.__table__, "after_create")
+def _create_search_index(target, connection, **kwargs):
+    create_search_index(connection)
+
+
+@event.listens_for(TaskModel.__table__, "before_drop")
+def _drop_search_index(target, connection, **kwargs):
+    drop_search_index(connection)
+
+
+def _match(dialect, terms):
+    # Return the full-text condition and a score where lower is better.
+    if dialect == "sqlite":
+        query = " ".join(f'"{term}"*' for term in terms)
+        fts = literal_column("tasks_fts")
+        return fts.op("MATCH")(query), func.bm25(fts, TITLE_WEIGHT, 1.0)
+    if dialect == "postgresql":
+        vector = literal_column(TSVECTOR)
+        query = func.to_tsquery("english", " & ".join(f"{term}:*" for term in terms))
+        weights = literal_column(f"'{{0.1, 0.2, {1 / TITLE_WEIGHT}, 1.0}}'")
+        return vector.op("@@")(query), -func.ts_rank_cd(weights, vector, query)
+    raise ValueError("Full-text search is not supported on this database")
+
+
+def search_tasks(dialect, search, user_role, user_id, limit, cursor=None):
+    """
+    Build a ranked full-text search over task titles and descriptions.
+
+    Every word of `search` must appear in the task, as a word prefix. The
+    best matches come first; ties are broken by ID so pages can be fetched
+    with a `(score, id)` cursor like the other lists.
+
+    Args:
+        dialect (str): Name of the database dialect.
+        search (str): The text to search for.
+        user_role (str): Role of the current user; admins search every task.
+        user_id (int): ID of the current user.
+        limit (int): Maximum number of tasks in the page.
+        cursor (str): Cursor returned with the previous page (optional).
+
+    Returns:
+        Select: Statement returning `(TaskModel, score)` rows; pass them to
+        `split_search_page`.
+
+    Raises:
+        ValueError: If the search has no words, the cursor is malformed or
+            the database has no full-text index.
+    """
+    terms = re.findall(r"\w+", search)
+    if not terms:
+        raise ValueError("Search has no words to look for")
+
+    condition, score = _match(dialect, terms)
+    score = score.label("score")
+    stmt = filter_tasks(
+        select(TaskModel, score).options(joinedload(TaskModel.category)),
+        user_role,
+        user_id,
+    )
+    if dialect == "sqlite":
+        stmt = stmt.join(tasks_fts, tasks_fts.c.rowid == TaskModel.id)
+    return seek(stmt.where(condition), (score, TaskModel.id), limit, cursor)
+
+
+def split_search_page(rows, limit):
+    """
+    Split the rows of a `search_tasks` statement into tasks and next cursor.
+
+    Returns:
+        tuple: The list of tasks and the cursor of the next page, or None when
+        this is the last page.
+    """
+    tasks = [task for task, _ in rows[:limit]]
+    if len(rows) <= limit:
+        return tasks, None
+    task, score = rows[limit - 1]
+    return tasks, encode_cursor([score, task.id])
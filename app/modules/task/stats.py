@@ -0,0 +1,156 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import case, delete, func, insert, literal, select
+
+from app.extensions.db import db
+from app.modules.job.queue import job_handler
+from app.modules.task.models import TaskModel, TaskStatsModel
+
+# Due-date buckets, relative to the time the stats are computed.
+BUCKETS = ("overdue", "next_24h", "next_7_days", "later", "none")
+
+
+def aggregate(now, user_id=None):
+    """
+    Build the grouped count of tasks by category, completion and due bucket.
+
+    Args:
+        now (datetime): Naive UTC time the buckets are relative to.
+        user_id (int): Only count the tasks of this user (optional).
+
+    Returns:
+        Select: Statement returning `(category_id, completed, bucket, count)`.
+    """
+    bucket = case(
+        (TaskModel.due_date.is_(None), "none"),
+        (TaskModel.due_date < now, "overdue"),
+        (TaskModel.due_date < now + timedelta(days=1), "next_24h"),
+        (TaskModel.due_date < now + timedelta(days=7), "next_7_days"),
+        else_="later",
+    )
+    tasks = select(
+        TaskModel.category_id,
+        func.coalesce(TaskModel.completed, False).label("completed"),
+        bucket.label("bucket"),
+    )
+    if user_id is not None:
+        tasks = tasks.filter_by(user_id=user_id)
+
+    # Group on the subquery columns: grouping on the CASE itself would repeat
+    # its bound parameters, which PostgreSQL does not accept as the same
+    # expression.
+    tasks = tasks.subquery()
+    return select(
+        tasks.c.category_id, tasks.c.completed, tasks.c.bucket, func.count()
+    ).group_by(tasks.c.category_id, tasks.c.completed, tasks.c.bucket)
+
+
+def fold(rows, as_of):
+    """
+    Turn aggregate rows into the `TaskStatsSchema` payload.
+
+    Only open tasks are counted in the due-date buckets; `overdue` is the
+    number of open tasks past their due date.
+
+    Args:
+        rows (iterable): `(category_id, completed, bucket, count)` rows.
+        as_of (datetime): Time the rows were computed.
+
+    Returns:
+        dict: Overall totals, open tasks by due bucket and per-category totals.
+    """
+    totals = {"total": 0, "completed": 0, "open": 0, "overdue": 0}
+    due = dict.fromkeys(BUCKETS, 0)
+    categories = {}
+
+    for category_id, completed, bucket, count in rows:
+        category = categories.setdefault(
+            category_id, {"category_id": category_id, **dict.fromkeys(totals, 0)}
+        )
+        for target in (totals, category):
+            target["total"] += count
+            target["completed" if completed else "open"] += count
+            if not completed and bucket == "overdue":
+                target["overdue"] += count
+        if not completed:
+            due[bucket] += count
+
+    return {
+        **totals,
+        "due": due,
+        "categories": sorted(
+            categories.values(),
+            key=lambda item: (item["category_id"] is None, item["category_id"] or 0),
+        ),
+        "as_of": as_of,
+    }
+
+
+def live_stats(session, user_role, user_id):
+    """
+    Compute task statistics with a grouped query.
+
+    Args:
+        session (Session): The session to query with.
+        user_role (str): Role of the current user; admins get global stats.
+        user_id (int): ID of the current user.
+
+    Returns:
+        dict: See `fold`.
+    """
+    now = datetime.utcnow()
+    scope = None if user_role == "admin" else user_id
+    return fold(session.execute(aggregate(now, scope)).all(), now)
+
+
+def summary_stats(session):
+    """
+    Read global task statistics from the `task_stats` summary table.
+
+    The table holds one row per (category, completion, bucket), so reading it
+    costs the same however many tasks there are.
+
+    Returns:
+        dict: See `fold`, or None if the summary has never been refreshed.
+    """
+    rows = session.execute(
+        select(
+            TaskStatsModel.category_id,
+            TaskStatsModel.completed,
+            TaskStatsModel.bucket,
+            TaskStatsModel.count,
+            TaskStatsModel.refreshed_at,
+        )
+    ).all()
+    if not rows:
+        return None
+    return fold((row[:4] for row in rows), rows[0].refreshed_at)
+
+
+def refresh_summary(session):
+    """
+    Rebuild the `task_stats` summary table in one transaction.
+
+    The aggregate is computed and stored by a single INSERT ... SELECT, so
+    no task rows travel to the application.
+
+    Returns:
+        datetime: The time the summary is now current as of.
+    """
+    now = datetime.utcnow()
+    columns = ["category_id", "completed", "bucket", "count", "refreshed_at"]
+    session.execute(delete(TaskStatsModel))
+    session.execute(
+        insert(TaskStatsModel).from_select(
+            columns,
+            aggregate(now).add_columns(literal(now, TaskStatsModel.refreshed_at.type)),
+        )
+    )
+    session.commit()
+    return now
+
+
+@job_handler("refresh_task_stats", concurrency=1)
+def refresh_summary_job(job):
+    """Rebuild the summary in a worker, see `flask refresh-task-stats`."""
+    return {"as_of": refresh_summary(db.session).isoformat()}
@@ -0,0 +1,187 @@
+import asyncio
+import json
+import queue
+import threading
+from collections import defaultdict
+
+from app.common.signals import tasks_changed
+
+HEARTBEAT = b": heartbeat\n\n"
+
+# Sent instead of the events that did not fit in a subscriber's buffer; the
+# client should refetch `GET /task/` and reconnect.
+OVERFLOW = b"event: overflow\ndata: {}\n\n"
+
+
+def format_event(change):
+    """
+    Encode a `tasks_changed` change as a Server-Sent Event.
+
+    Args:
+        change (dict): `{"action", "task_id", "user_id"}`.
+
+    Returns:
+        bytes: The event, with the action as its type.
+    """
+    data = json.dumps(
+        {"task_id": change["task_id"], "user_id": change["user_id"]},
+        separators=(",", ":"),
+    )
+    return f"event: {change['action']}\ndata: {data}\n\n".encode()
+
+
+class Subscription:
+    """
+    Bounded buffer of the events waiting to be sent on one blocking stream.
+
+    Once the buffer is full the subscription is marked as overflowed instead
+    of blocking the publisher or growing without limit: the stream then sends
+    `OVERFLOW` and ends.
+    """
+
+    def __init__(self, user_id, is_admin, maxsize):
+        self.user_id = user_id
+        self.is_admin = is_admin
+        self.overflowed = False
+        self._queue = queue.Queue(maxsize)
+
+    def deliver(self, event):
+        """Queue `event` without blocking. Called by the publisher."""
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.overflowed = True
+
+    def get(self, timeout):
+        """
+        Wait for the next event.
+
+        Returns:
+            bytes: The event, or None if none arrived within `timeout` seconds.
+        """
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class AsyncSubscription(Subscription):
+    """`Subscription` consumed by a coroutine on an asyncio event loop."""
+
+    def __init__(self, user_id, is_admin, maxsize):
+        super().__init__(user_id, is_admin, maxsize)
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize)
+
+    def _put(self, event):
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    def deliver(self, event):
+        # Changes may be published from a WSGI worker thread.
+        self._loop.call_soon_threadsafe(self._put, event)
+
+    async def get(self, timeout):
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class ChangeFeed:
+    """
+    Fans task changes out to the open streams of this process.
+
+    Subscriptions are indexed by owner, so publishing a change touches only
+    the streams of the task owner and of the admins, and each event is
+    encoded once however many streams receive it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_user = defaultdict(set)
+        self._admins = set()
+
+    def subscribe(self, subscription):
+        with self._lock:
+            if subscription.is_admin:
+                self._admins.add(subscription)
+            else:
+                self._by_user[subscription.user_id].add(subscription)
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            if subscription.is_admin:
+                self._admins.discard(subscription)
+            else:
+                subscribers = self._by_user.get(subscription.user_id)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._by_user[subscription.user_id]
+
+    def publish(self, changes):
+        """
+        Deliver `changes` to the streams allowed to see them.
+
+        Args:
+            changes (list): `{"action", "task_id", "user_id"}` dicts.
+        """
+        with self._lock:
+            if not self._admins and not self._by_user:
+                return
+            targets = [
+                (change, self._admins | self._by_user.get(change["user_id"], set()))
+                for change in changes
+            ]
+
+        for change, subscribers in targets:
+            if not subscribers:
+                continue
+            event = format_event(change)
+            for subscription in subscribers:
+                subscription.deliver(event)
+
+    def stream(self, subscription, heartbeat):
+        """
+        Subscribe and yield the events of a blocking subscription until the
+        client leaves.
+
+        The subscription is only registered once the response starts, so a
+        response that is never iterated leaves nothing behind.
+
+        Args:
+            subscription (Subscription): The subscription to stream.
+            heartbeat (float): Seconds of silence before a heartbeat is sent.
+        """
+        self.subscribe(subscription)
+        try:
+            yield HEARTBEAT
+            while not subscription.overflowed:
+                event = subscription.get(heartbeat)
+                yield HEARTBEAT if event is None else event
+            yield OVERFLOW
+        finally:
+            self.unsubscribe(subscription)
+
+    async def stream_async(self, subscription, heartbeat):
+        """Asynchronous version of `stream` for an `AsyncSubscription`."""
+        self.subscribe(subscription)
+        try:
+            yield HEARTBEAT
+            while not subscription.overflowed:
+                event = await subscription.get(heartbeat)
+                yield HEARTBEAT if event is None else event
+            yield OVERFLOW
+        finally:
+            self.unsubscribe(subscription)
+
+
+change_feed = ChangeFeed()
+
+
+@tasks_changed.connect
+def publish_changes(sender, changes, **kwargs):
+    change_feed.publish(changes)
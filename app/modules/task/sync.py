@@ -0,0 +1,164 @@
+import heapq
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.orm import Session, joinedload
+
+from app.modules.task.models import (
+    CategoryModel,
+    ChangeCounterModel,
+    TaskModel,
+    TombstoneModel,
+)
+
+VERSIONED = {TaskModel: "task", CategoryModel: "category"}
+
+
+def reserve_versions(session, count):
+    """
+    Reserve `count` consecutive change versions.
+
+    The counter row stays locked until the transaction ends, so versions
+    become visible in the order they were handed out and a client that has
+    synced up to version N can never miss a later commit with a lower one.
+
+    Args:
+        session (Session): The session about to flush the changes.
+        count (int): Number of versions to reserve.
+
+    Returns:
+        int: The first reserved version.
+    """
+    connection = session.connection()
+    counter = ChangeCounterModel.__table__
+    statement = (
+        update(counter).where(counter.c.id == 1).values(value=counter.c.value + count)
+    )
+    if connection.dialect.update_returning:
+        # One round trip instead of an UPDATE followed by a SELECT.
+        last = connection.scalar(statement.returning(counter.c.value))
+    elif connection.execute(statement).rowcount > 0:
+        last = connection.scalar(select(counter.c.value).where(counter.c.id == 1))
+    else:
+        last = None
+    if last is None:
+        raise RuntimeError("The change counter row is missing; run `flask db upgrade`.")
+    return last - count + 1
+
+
+def reserved_version_cte(dialect):
+    """
+    Reserve one change version inside the statement that uses it.
+
+    On PostgreSQL the counter UPDATE can run as a data-modifying CTE, so a
+    write and its version reservation take a single round trip; select
+    `value` from the returned CTE. Other databases return None and must
+    call `reserve_versions` first.
+
+    Args:
+        dialect (Dialect): Dialect of the connection the statement runs on.
+
+    Returns:
+        CTE: The reservation, or None if the database cannot embed it.
+    """
+    if dialect.name != "postgresql":
+        return None
+    counter = ChangeCounterModel.__table__
+    return (
+        update(counter)
+        .where(counter.c.id == 1)
+        .values(value=counter.c.value + 1)
+        .returning(counter.c.value)
+        .cte("reserved_version")
+    )
+
+
+@event.listens_for(ChangeCounterModel.__table__, "after_create")
+def _create_counter_row(target, connection, **kwargs):
+    # The row exists from the start, so concurrent first writes all update
+    # it instead of racing to insert it.
+    connection.execute(insert(target).values(id=1, value=0))
+
+
+@event.listens_for(Session, "before_flush")
+def assign_versions(session, flush_context, instances):
+    """
+    Stamp created and updated tasks and categories with a new version and
+    record a tombstone for every deleted one.
+    """
+    changed = [obj for obj in session.new if type(obj) in VERSIONED]
+    changed += [
+        obj
+        for obj in session.dirty
+        if type(obj) in VERSIONED
+        and session.is_modified(obj, include_collections=False)
+    ]
+    deleted = [obj for obj in session.deleted if type(obj) in VERSIONED]
+    if not changed and not deleted:
+        return
+
+    version = reserve_versions(session, len(changed) + len(deleted))
+    for obj in changed:
+        obj.version = version
+        version += 1
+    for obj in deleted:
+        session.add(
+            TombstoneModel(
+                entity=VERSIONED[type(obj)],
+                entity_id=obj.id,
+                user_id=getattr(obj, "user_id", None),
+                version=version,
+            )
+        )
+        version += 1
+
+
+def changes_since(session, user_role, user_id, since, limit):
+    """
+    Collect the task and category changes made after version `since`.
+
+    Each of the four sources (tasks, categories and their tombstones) is read
+    in version order from its version index, at most `limit + 1` rows each,
+    and the streams are merged so the page holds the `limit` oldest changes.
+
+    Args:
+        session (Session): The session to query with.
+        user_role (str): Role of the current user; admins see every task.
+        user_id (int): ID of the current user.
+        since (int): Version the client has already synced.
+        limit (int): Maximum number of changes to return.
+
+    Returns:
+        dict: Changed tasks and categories, IDs of the deleted ones, the
+        version to pass as `since` next time and whether more changes are
+        waiting.
+    """
+    tasks = select(TaskModel).options(joinedload(TaskModel.category))
+    task_tombstones = select(TombstoneModel).filter_by(entity="task")
+    if user_role != "admin":
+        tasks = tasks.filter_by(user_id=user_id)
+        task_tombstones = task_tombstones.filter_by(user_id=user_id)
+
+    sources = {
+        "tasks": (tasks, TaskModel),
+        "categories": (select(CategoryModel), CategoryModel),
+        "deleted_tasks": (task_tombstones, TombstoneModel),
+        "deleted_categories": (
+            select(TombstoneModel).filter_by(entity="category"),
+            TombstoneModel,
+        ),
+    }
+    streams = []
+    for key, (stmt, model) in sources.items():
+        stmt = stmt.where(model.version > since).order_by(model.version)
+        rows = session.scalars(stmt.limit(limit + 1)).all()
+        streams.append([(row.version, key, row) for row in rows])
+
+    merged = list(heapq.merge(*streams, key=lambda item: item[0]))
+    page = merged[:limit]
+
+    changes = {key: [] for key in sources}
+    for _, key, row in page:
+        changes[key].append(row.entity_id if key.startswith("deleted_") else row)
+    changes["version"] = page[-1][0] if page else since
+    changes["has_more"] = len(merged) > limit
+    return changes
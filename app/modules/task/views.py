@@ -1,11 +1,48 @@
+from flask import current_app, request, stream_with_context
 from flask_apispec import MethodResource, use_kwargs, marshal_with, doc
 from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
 
 from app.extensions.db import db
+from app.common.caching import cached_json_response
+from app.common.pagination import paginate
 from app.common.schemas import MessageSchema
+from app.common.signals import category_changed, tasks_changed
+from app.modules.task.caching import CATEGORIES, ALL_TASKS, user_tasks
+from app.modules.task.batch import plan_batch
+from app.modules.task.export import EXPORT_FORMATS, export_tasks
+from app.modules.job.schemas import JobSchema
 from app.modules.task.models import CategoryModel, TaskModel
+from app.modules.task.purge import (
+    count_tasks,
+    delete_entity,
+    latest_purge,
+    send_delete_signals,
+    start_purge,
+)
+from app.modules.task.queries import TASK_SORT_COLUMNS, filter_tasks
+from app.modules.task.search import search_tasks, split_search_page
+from app.modules.task.stats import live_stats, summary_stats
+from app.modules.task.stream import Subscription, change_feed
+from app.modules.task.sync import changes_since
+from app.modules.task.writes import (
+    delete_owned_task,
+    find_owned_task,
+    miss_status,
+    update_owned_task,
+)
 from app.modules.task.schemas import (
     CategorySchema,
+    TaskBatchRequestSchema,
+    TaskBatchResponseSchema,
+    TaskChangesQuerySchema,
+    TaskChangesResponseSchema,
+    TaskExportQuerySchema,
+    TaskListQuerySchema,
+    TaskListResponseSchema,
+    TaskSearchQuerySchema,
+    TaskStatsSchema,
     TaskViewResponseSchema,
     TaskViewPostRequestSchema,
     TaskViewPutRequestSchema,
@@ -35,30 +72,24 @@ class CategoryView(MethodResource):
     @jwt_required()
     @marshal_with(schema, code=200, description="Category retrieved successfully.")
     @marshal_with(MessageSchema, code=500, description="An error occurred.")
-    def get(self, category_id=None):
+    def get(self, category_id):
         """
         Retrieve category information.
 
-        If `category_id` is provided, fetches that category's information. If not, returns a list of all categories.
-
         Args:
-            category_id (int): ID of the category to fetch (optional).
+            category_id (int): ID of the category to fetch.
 
         Returns:
-            dict: The category's data or a list of categories.
+            dict: The category's data.
         """
-        if category_id:
-            self.schema.many = False
-            try:
-                category = CategoryModel.query.get_or_404(category_id)
-            except Exception as e:
-                return {"message": f"An error occurred: {str(e)}"}, 500
-            return category, 200
-
-        else:
-            self.schema.many = True
-            categories = CategoryModel.query.all()
-            return categories, 200
+        try:
+            return cached_json_response(
+                (CATEGORIES,),
+                f"category:{category_id}",
+                lambda: self.schema.dump(CategoryModel.query.get_or_404(category_id)),
+            )
+        except Exception as e:
+            return {"message": f"An error occurred: {str(e)}"}, 500
 
     @doc(
         description="Create a new category. Only admins can create categories.",
@@ -92,6 +123,11 @@ class CategoryView(MethodResource):
         except Exception as e:
             return {"message": f"An error occurred: {str(e)}"}, 500
 
+        category_changed.send(
+            current_app._get_current_object(),
+            action="create",
+            category_id=new_category.id,
+        )
         return {
             "message": f"Category created successfully, task_id: {new_category.id}"
         }, 201
@@ -102,33 +138,134 @@ class CategoryView(MethodResource):
     )
     @jwt_required()
     @marshal_with(MessageSchema, code=200, description="Category deleted successfully.")
+    @marshal_with(
+        JobSchema,
+        code=202,
+        description="The category has many tasks; it is deleted in the background.",
+    )
+    @marshal_with(MessageSchema, code=404, description="Category not found.")
     @marshal_with(MessageSchema, code=500, description="An error occurred.")
     def delete(self, category_id):
         """
         Delete a category.
 
-        Only admins can delete categories.
+        Only admins can delete categories. Their tasks are deleted with them;
+        above `PURGE_INLINE_LIMIT` tasks this happens in a background purge
+        job, which is returned for polling.
 
         Args:
             category_id (int): ID of the category to delete.
 
         Returns:
-            dict: A message indicating the result.
+            dict: A message indicating the result, or the purge job.
         """
         claims = get_jwt()
         if claims["role"] != "admin":
             return {"message": "Admin access required"}, 403
 
-        category = CategoryModel.query.get_or_404(category_id)
+        total = count_tasks(db.session, "category", category_id)
+        if total > current_app.config["PURGE_INLINE_LIMIT"]:
+            job = start_purge(
+                db.session,
+                "category",
+                category_id,
+                total,
+                current_app.config["PURGE_CHUNK_SIZE"],
+                get_jwt_identity(),
+            )
+            return job, 202
+
         try:
-            db.session.delete(category)
+            changes = delete_entity(db.session, "category", category_id)
+            if changes is None:
+                return {"message": "Category not found"}, 404
             db.session.commit()
         except Exception as e:
+            db.session.rollback()
             return {"message": f"An error occurred: {str(e)}"}, 500
 
+        send_delete_signals(
+            current_app._get_current_object(), "category", category_id, changes
+        )
         return {"message": "Category deleted successfully"}, 200
 
 
+class CategoryPurgeView(MethodResource):
+    """
+    API endpoint reporting the progress of a category's background deletion.
+
+    Permissions:
+    - Only admins can follow category deletions.
+    """
+
+    @doc(
+        description="Get the progress of the latest background deletion of a category.",
+        tags=["Categories"],
+    )
+    @jwt_required()
+    @marshal_with(JobSchema, code=200, description="Purge job retrieved.")
+    @marshal_with(MessageSchema, code=404, description="No purge job found.")
+    @marshal_with(MessageSchema, code=403, description="Admin access required.")
+    def get(self, category_id):
+        """
+        Retrieve the latest purge job of a category.
+
+        Args:
+            category_id (int): ID of the category being deleted.
+
+        Returns:
+            dict: The purge job and its progress.
+        """
+        if get_jwt()["role"] != "admin":
+            return {"message": "Admin access required"}, 403
+
+        job = latest_purge(db.session, "category", category_id)
+        if job is None:
+            return {"message": "No purge job found"}, 404
+        return job, 200
+
+
+class CategoryListView(MethodResource):
+    """
+    API endpoint to list all task categories.
+
+    Permissions:
+    - All users can list categories.
+    """
+
+    schema = CategorySchema(many=True)
+
+    @doc(
+        description="List all categories. Admins and regular users can access category information.",
+        tags=["Categories"],
+    )
+    @jwt_required()
+    @marshal_with(schema, code=200, description="Categories retrieved successfully.")
+    @marshal_with(MessageSchema, code=500, description="An error occurred.")
+    def get(self):
+        """
+        Retrieve all categories.
+
+        Returns:
+            list: The list of categories.
+        """
+        try:
+            return cached_json_response(
+                (CATEGORIES,),
+                "categories",
+                lambda: self.schema.dump(CategoryModel.query.all()),
+            )
+        except Exception as e:
+            return {"message": f"An error occurred: {str(e)}"}, 500
+
+
+def _miss(task_id):
+    # A conditional write matched nothing: the task is missing or not ours.
+    if miss_status(db.session, task_id) == 404:
+        return {"message": "Task not found"}, 404
+    return {"message": "Access denied"}, 403
+
+
 class TasksView(MethodResource):
     """
     API endpoint to manage tasks.
@@ -155,43 +292,33 @@ class TasksView(MethodResource):
     @marshal_with(MessageSchema, code=500, description="An error occurred.")
     @marshal_with(MessageSchema, code=404, description="Task not found.")
     @marshal_with(MessageSchema, code=403, description="Access denied.")
-    def get(self, task_id=None):
+    def get(self, task_id):
         """
         Retrieve task information.
 
-        If `task_id` is provided, fetches that task's information. Admins can access any task, while regular users can only access their own.
+        Admins can access any task, while regular users can only access their own.
 
         Args:
-            task_id (int): ID of the task to fetch (optional).
+            task_id (int): ID of the task to fetch.
 
         Returns:
-            dict: The task's data or a list of tasks.
+            dict: The task's data.
         """
         current_user_id = get_jwt_identity()
         claims = get_jwt()
         user_role = claims["role"]
 
-        if task_id:
-            self.schema.many = False
-            try:
-                task = TaskModel.query.get_or_404(task_id)
-                if user_role != "admin" and task.user_id != current_user_id:
-                    return {"message": "Access denied"}, 403
-                if not task:
-                    return {"message": "Task not found"}, 404
-            except Exception as e:
-                return {"message": f"An error occurred: {str(e)}"}, 500
-            return task, 200
-        else:
-            self.schema.many = True
-            try:
-                if user_role == "admin":
-                    tasks = TaskModel.query.all()
-                else:
-                    tasks = TaskModel.query.filter_by(user_id=current_user_id).all()
-                return tasks, 200
-            except Exception as e:
-                return {"message": f"An error occurred: {str(e)}"}, 500
+        try:
+            task = TaskModel.query.options(joinedload(TaskModel.category)).get_or_404(
+                task_id
+            )
+            if user_role != "admin" and task.user_id != current_user_id:
+                return {"message": "Access denied"}, 403
+            if not task:
+                return {"message": "Task not found"}, 404
+        except Exception as e:
+            return {"message": f"An error occurred: {str(e)}"}, 500
+        return task, 200
 
     @doc(
         description="Create a new task. Regular users can create tasks for themselves.",
@@ -200,6 +327,7 @@ class TasksView(MethodResource):
     @jwt_required()
     @use_kwargs(TaskViewPostRequestSchema, location="json")
     @marshal_with(MessageSchema, code=201, description="Task created successfully.")
+    @marshal_with(MessageSchema, code=400, description="Category not found.")
     @marshal_with(MessageSchema, code=500, description="An error occurred.")
     def post(self, *args, **kwargs):
         """
@@ -227,10 +355,18 @@ class TasksView(MethodResource):
         try:
             db.session.add(new_task)
             db.session.commit()
-
+        except IntegrityError:
+            db.session.rollback()
+            return {"message": "Category not found"}, 400
         except Exception as e:
             return {"message": f"An error occurred: {str(e)}"}, 500
 
+        tasks_changed.send(
+            current_app._get_current_object(),
+            changes=[
+                {"action": "create", "task_id": new_task.id, "user_id": current_user_id}
+            ],
+        )
         return {"message": f"Task created successfully, task_id: {new_task.id}"}, 201
 
     @doc(
@@ -240,6 +376,8 @@ class TasksView(MethodResource):
     @jwt_required()
     @use_kwargs(TaskViewPutRequestSchema, location="json")
     @marshal_with(MessageSchema, code=200, description="Task updated successfully.")
+    @marshal_with(MessageSchema, code=400, description="Category not found.")
+    @marshal_with(MessageSchema, code=404, description="Task not found.")
     @marshal_with(MessageSchema, code=403, description="Access denied.")
     def put(self, *args, task_id, **kwargs):
         """
@@ -259,14 +397,26 @@ class TasksView(MethodResource):
         claims = get_jwt()
         user_role = claims["role"]
 
-        task = TaskModel.query.get_or_404(task_id)
-
-        if user_role != "admin" and task.user_id != current_user_id:
-            return {"message": "Access denied"}, 403
-
-        for key, value in kwargs.items():
-            setattr(task, key, value)
-        db.session.commit()
+        try:
+            if kwargs:
+                owner = update_owned_task(
+                    db.session, task_id, kwargs, user_role, current_user_id
+                )
+            else:
+                owner = find_owned_task(db.session, task_id, user_role, current_user_id)
+            if owner is None:
+                db.session.rollback()
+                return _miss(task_id)
+            db.session.commit()
+        except IntegrityError:
+            # The only foreign key a task update can break.
+            db.session.rollback()
+            return {"message": "Category not found"}, 400
+
+        tasks_changed.send(
+            current_app._get_current_object(),
+            changes=[{"action": "update", "task_id": task_id, "user_id": owner}],
+        )
         return {"message": "Task updated successfully"}, 200
 
     @doc(
@@ -276,6 +426,7 @@ class TasksView(MethodResource):
     @jwt_required()
     @marshal_with(MessageSchema, code=200, description="Task deleted successfully.")
     @marshal_with(MessageSchema, code=500, description="An error occurred.")
+    @marshal_with(MessageSchema, code=404, description="Task not found.")
     @marshal_with(MessageSchema, code=403, description="Access denied.")
     def delete(self, task_id):
         """
@@ -293,15 +444,438 @@ class TasksView(MethodResource):
         claims = get_jwt()
         user_role = claims["role"]
 
-        task = TaskModel.query.get_or_404(task_id)
+        try:
+            owner = delete_owned_task(db.session, task_id, user_role, current_user_id)
+            if owner is None:
+                db.session.rollback()
+                return _miss(task_id)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            return {"message": f"An error occurred: {str(e)}"}, 500
+
+        tasks_changed.send(
+            current_app._get_current_object(),
+            changes=[{"action": "delete", "task_id": task_id, "user_id": owner}],
+        )
+        return {"message": "Task deleted successfully"}, 200
+
+
+class TaskListView(MethodResource):
+    """
+    API endpoint to list tasks page by page.
+
+    Pages are fetched with keyset (cursor) pagination: each response carries a
+    `next_cursor` that is passed back to fetch the following page, so the cost
+    of a page does not grow with the size of the table.
+
+    Permissions:
+    - Admins can list all tasks.
+    - Regular users can only list their own tasks.
+    """
+
+    schema = TaskListResponseSchema()
+
+    @doc(
+        description="List tasks. Admins can list all tasks, while regular users can list only their own tasks.",
+        tags=["Tasks"],
+    )
+    @jwt_required()
+    @use_kwargs(TaskListQuerySchema, location="query")
+    @marshal_with(schema, code=200, description="Tasks retrieved successfully.")
+    @marshal_with(MessageSchema, code=400, description="Invalid cursor.")
+    @marshal_with(MessageSchema, code=500, description="An error occurred.")
+    def get(
+        self,
+        limit,
+        sort,
+        cursor=None,
+        due_before=None,
+        due_after=None,
+        completed=None,
+    ):
+        """
+        Retrieve a page of tasks.
+
+        Args:
+            limit (int): Maximum number of tasks in the page.
+            sort (str): Sort key, either `id` or `title`.
+            cursor (str): Cursor of the page to fetch (optional).
+            due_before (datetime): Only tasks due strictly before this time (optional).
+            due_after (datetime): Only tasks due at or after this time (optional).
+            completed (bool): Only completed or only open tasks (optional).
+
+        Returns:
+            dict: The tasks of the page and the cursor of the next page.
+        """
+        current_user_id = get_jwt_identity()
+        claims = get_jwt()
+        user_role = claims["role"]
+
+        # Categories are serialized with every task, load them in the same query.
+        query = filter_tasks(
+            TaskModel.query.options(joinedload(TaskModel.category)),
+            user_role,
+            current_user_id,
+            completed=completed,
+            due_after=due_after,
+            due_before=due_before,
+        )
+        if user_role != "admin":
+            namespaces = (user_tasks(current_user_id), CATEGORIES)
+        else:
+            namespaces = (ALL_TASKS, CATEGORIES)
+
+        def load():
+            tasks, next_cursor = paginate(query, TASK_SORT_COLUMNS[sort], limit, cursor)
+            return self.schema.dump({"items": tasks, "next_cursor": next_cursor})
+
+        try:
+            return cached_json_response(namespaces, request.query_string.decode(), load)
+        except ValueError as e:
+            return {"message": str(e)}, 400
+        except Exception as e:
+            return {"message": f"An error occurred: {str(e)}"}, 500
+
+
+class TaskSearchView(MethodResource):
+    """
+    API endpoint to search tasks by title and description.
+
+    Searches go through a full-text index (FTS5 on SQLite, a GIN index on
+    PostgreSQL). Results are ranked, best match first, and fetched page by
+    page with the `next_cursor` of the previous page.
+
+    Permissions:
+    - Admins can search all tasks.
+    - Regular users can only search their own tasks.
+    """
+
+    schema = TaskListResponseSchema()
+
+    @doc(
+        description="Search tasks by title and description. Admins search all tasks, while regular users search only their own tasks.",
+        tags=["Tasks"],
+    )
+    @jwt_required()
+    @use_kwargs(TaskSearchQuerySchema, location="query")
+    @marshal_with(schema, code=200, description="Tasks retrieved successfully.")
+    @marshal_with(MessageSchema, code=400, description="Invalid search or cursor.")
+    @marshal_with(MessageSchema, code=500, description="An error occurred.")
+    def get(self, q, limit, cursor=None):
+        """
+        Retrieve a page of tasks matching a search.
+
+        Args:
+            q (str): The words to search for.
+            limit (int): Maximum number of tasks in the page.
+            cursor (str): Cursor of the page to fetch (optional).
+
+        Returns:
+            dict: The matching tasks of the page and the cursor of the next page.
+        """
+        current_user_id = get_jwt_identity()
+        claims = get_jwt()
+        user_role = claims["role"]
+
+        if user_role != "admin":
+            namespaces = (user_tasks(current_user_id), CATEGORIES)
+        else:
+            namespaces = (ALL_TASKS, CATEGORIES)
+
+        def load():
+            stmt = search_tasks(
+                db.engine.dialect.name, q, user_role, current_user_id, limit, cursor
+            )
+            rows = db.session.execute(stmt).all()
+            tasks, next_cursor = split_search_page(rows, limit)
+            return self.schema.dump({"items": tasks, "next_cursor": next_cursor})
+
+        try:
+            return cached_json_response(
+                namespaces, "search:" + request.query_string.decode(), load
+            )
+        except ValueError as e:
+            return {"message": str(e)}, 400
+        except Exception as e:
+            return {"message": f"An error occurred: {str(e)}"}, 500
+
+
+class TaskStatsView(MethodResource):
+    """
+    API endpoint returning task statistics for dashboards.
+
+    Counts are computed in the database with one grouped query: totals,
+    completed and open tasks, open tasks by due-date bucket and the same
+    totals per category. When `TASK_STATS_SUMMARY` is enabled, admins read
+    global stats from the summary table kept by `flask refresh-task-stats`
+    instead; `as_of` tells how fresh they are.
+
+    Permissions:
+    - Admins get statistics over all tasks.
+    - Regular users get statistics over their own tasks.
+    """
+
+    schema = TaskStatsSchema()
+
+    @doc(
+        description="Get task statistics. Admins get global statistics, while regular users get statistics over their own tasks.",
+        tags=["Tasks"],
+    )
+    @jwt_required()
+    @marshal_with(schema, code=200, description="Statistics retrieved successfully.")
+    @marshal_with(MessageSchema, code=500, description="An error occurred.")
+    def get(self):
+        """
+        Retrieve task statistics.
 
-        if user_role != "admin" and task.user_id != current_user_id:
-            return {"message": "Access denied"}, 403
+        Returns:
+            dict: The statistics and the time they were computed.
+        """
+        current_user_id = get_jwt_identity()
+        claims = get_jwt()
+        user_role = claims["role"]
 
         try:
-            db.session.delete(task)
+            stats = None
+            if user_role == "admin" and current_app.config["TASK_STATS_SUMMARY"]:
+                stats = summary_stats(db.session)
+            if stats is None:
+                stats = live_stats(db.session, user_role, current_user_id)
+        except Exception as e:
+            return {"message": f"An error occurred: {str(e)}"}, 500
+        return stats, 200
+
+
+class TaskExportView(MethodResource):
+    """
+    API endpoint to export tasks as NDJSON or CSV.
+
+    Rows are read in batches and written to the response as they are
+    encoded, so exporting a large tenant needs no more memory than a small
+    one.
+
+    Permissions:
+    - Admins export all tasks.
+    - Regular users export their own tasks.
+    """
+
+    @doc(
+        description="Export tasks as NDJSON or CSV. Admins export all tasks, while regular users export only their own tasks.",
+        tags=["Tasks"],
+    )
+    @jwt_required()
+    @use_kwargs(TaskExportQuerySchema, location="query")
+    def get(self, format):
+        """
+        Stream the export.
+
+        Args:
+            format (str): `ndjson` (default) or `csv`.
+
+        Returns:
+            Response: The streamed export, as an attachment.
+        """
+        claims = get_jwt()
+        chunks = export_tasks(db.session, format, claims["role"], get_jwt_identity())
+        # Keep the app context, and with it the session, alive while the
+        # response is being streamed.
+        return current_app.response_class(
+            stream_with_context(chunks),
+            mimetype=EXPORT_FORMATS[format],
+            headers={"Content-Disposition": f"attachment; filename=tasks.{format}"},
+        )
+
+
+class TaskBatchView(MethodResource):
+    """
+    API endpoint to apply many task operations in one request.
+
+    Used by clients replaying offline edits. Every referenced task is loaded
+    with a single query, all operations are applied in one transaction and a
+    result is returned for each operation, in request order.
+
+    Permissions:
+    - Admins can update or delete any task.
+    - Regular users can only update or delete their own tasks.
+    """
+
+    @doc(
+        description="Create, update and delete tasks in a single transaction.",
+        tags=["Tasks"],
+    )
+    @jwt_required()
+    @use_kwargs(TaskBatchRequestSchema, location="json")
+    @marshal_with(
+        TaskBatchResponseSchema, code=200, description="Batch applied successfully."
+    )
+    @marshal_with(
+        MessageSchema, code=400, description="A category was deleted meanwhile."
+    )
+    @marshal_with(MessageSchema, code=500, description="An error occurred.")
+    def post(self, operations):
+        """
+        Apply a batch of task operations.
+
+        Each operation is `{"op": "create", "data": {...}}`,
+        `{"op": "update", "task_id": 1, "data": {...}}` or
+        `{"op": "delete", "task_id": 1}`. Operations that fail (unknown task,
+        access denied or unknown category) are skipped and reported; the
+        others are committed together.
+
+        Args:
+            operations (list): The operations to apply.
+
+        Returns:
+            dict: The result of every operation.
+        """
+        current_user_id = get_jwt_identity()
+        claims = get_jwt()
+        user_role = claims["role"]
+
+        task_ids = {item["task_id"] for item in operations if "task_id" in item}
+        tasks = {}
+        if task_ids:
+            tasks = {
+                task.id: task
+                for task in TaskModel.query.filter(TaskModel.id.in_(task_ids))
+            }
+
+        category_ids = {
+            item["data"]["category_id"]
+            for item in operations
+            if "category_id" in item["data"]
+        }
+        known_categories = set()
+        if category_ids:
+            known_categories = {
+                category_id
+                for (category_id,) in db.session.query(CategoryModel.id).filter(
+                    CategoryModel.id.in_(category_ids)
+                )
+            }
+
+        results, changes, creates, updates, deletes = plan_batch(
+            operations, tasks, known_categories, current_user_id, user_role
+        )
+        try:
+            created = []
+            for result, change, data in creates:
+                task = TaskModel(**data, user_id=current_user_id)
+                db.session.add(task)
+                created.append((result, change, task))
+            for task, data in updates:
+                for key, value in data.items():
+                    setattr(task, key, value)
+            for task in deletes:
+                db.session.delete(task)
+
+            db.session.flush()
+            for result, change, task in created:
+                result["task_id"] = change["task_id"] = task.id
             db.session.commit()
+        except IntegrityError:
+            # A category was deleted after the batch was checked.
+            db.session.rollback()
+            return {"message": "Category not found"}, 400
         except Exception as e:
+            db.session.rollback()
             return {"message": f"An error occurred: {str(e)}"}, 500
 
-        return {"message": "Task deleted successfully"}, 200
+        if changes:
+            tasks_changed.send(current_app._get_current_object(), changes=changes)
+
+        return {"results": results}, 200
+
+
+class TaskStreamView(MethodResource):
+    """
+    API endpoint streaming task changes as Server-Sent Events.
+
+    An event is sent for every task created, updated or deleted, with the
+    action as the event type and `{"task_id", "user_id"}` as its data, so
+    clients can refresh only what changed instead of polling `GET /task/`.
+    A comment line is sent as heartbeat when the stream is idle. A client
+    that falls too far behind receives an `overflow` event and the stream
+    ends; it should refetch its tasks and reconnect.
+
+    Permissions:
+    - Admins receive the changes of all tasks.
+    - Regular users only receive the changes of their own tasks.
+    """
+
+    @doc(
+        description="Stream task changes as Server-Sent Events. Admins receive all changes, while regular users receive only the changes of their own tasks.",
+        tags=["Tasks"],
+    )
+    @jwt_required()
+    def get(self):
+        """
+        Open the change stream.
+
+        Returns:
+            Response: A `text/event-stream` response.
+        """
+        claims = get_jwt()
+        subscription = Subscription(
+            get_jwt_identity(),
+            claims["role"] == "admin",
+            current_app.config["TASK_STREAM_BUFFER"],
+        )
+        return current_app.response_class(
+            change_feed.stream(
+                subscription, current_app.config["TASK_STREAM_HEARTBEAT"]
+            ),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+
+class TaskChangesView(MethodResource):
+    """
+    API endpoint returning what changed since a client last synced.
+
+    Every write to a task or category stamps it with a new, strictly
+    increasing version and deletions leave a tombstone, so a client only
+    downloads the delta: it passes the `version` of its previous response as
+    `since` (0 for a full sync) and repeats while `has_more` is true.
+
+    Permissions:
+    - Admins receive the changes of all tasks.
+    - Regular users only receive the changes of their own tasks.
+    - Everyone receives category changes.
+    """
+
+    @doc(
+        description="List task and category changes after a version. Admins see all tasks, while regular users see only their own tasks.",
+        tags=["Tasks"],
+    )
+    @jwt_required()
+    @use_kwargs(TaskChangesQuerySchema, location="query")
+    @marshal_with(
+        TaskChangesResponseSchema,
+        code=200,
+        description="Changes retrieved successfully.",
+    )
+    @marshal_with(MessageSchema, code=500, description="An error occurred.")
+    def get(self, since, limit):
+        """
+        Retrieve the changes after version `since`.
+
+        Args:
+            since (int): Version the client has already synced.
+            limit (int): Maximum number of changes to return.
+
+        Returns:
+            dict: The changes and the version to pass as `since` next time.
+        """
+        claims = get_jwt()
+        try:
+            return (
+                changes_since(
+                    db.session, claims["role"], get_jwt_identity(), since, limit
+                ),
+                200,
+            )
+        except Exception as e:
+            return {"message": f"An error occurred: {str(e)}"}, 500
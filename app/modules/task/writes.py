@@ -0,0 +1,162 @@
+from sqlalchemy import delete, insert, literal, select, update
+
+from app.modules.task.models import TaskModel, TombstoneModel
+from app.modules.task.sync import reserve_versions, reserved_version_cte
+
+
+def _owned(statement, task_id, user_role, user_id):
+    # The ownership check is part of the WHERE clause: a regular user's
+    # statement simply matches nothing for somebody else's task.
+    statement = statement.where(TaskModel.id == task_id)
+    if user_role != "admin":
+        statement = statement.where(TaskModel.user_id == user_id)
+    return statement
+
+
+def _execute_owned(session, statement, task_id, user_role, user_id):
+    # Run the conditional statement and return the owner of the matched
+    # row, or None on a miss.
+    dialect = session.get_bind().dialect
+    if statement.is_delete:
+        returning = dialect.delete_returning
+    else:
+        returning = dialect.update_returning
+    if returning:
+        return session.execute(statement.returning(TaskModel.user_id)).scalar()
+
+    # Without RETURNING an admin's statement does not tell whose task it
+    # was; read the owner first.
+    owner = user_id
+    if user_role == "admin":
+        owner = session.scalar(select(TaskModel.user_id).where(TaskModel.id == task_id))
+    if owner is None or session.execute(statement).rowcount == 0:
+        return None
+    return owner
+
+
+def find_owned_task(session, task_id, user_role, user_id):
+    """
+    Check that a task exists and may be written by the current user.
+
+    Returns:
+        int: The ID of the task's owner, or None on a miss.
+    """
+    statement = _owned(select(TaskModel.user_id), task_id, user_role, user_id)
+    return session.scalar(statement)
+
+
+def update_owned_task(session, task_id, values, user_role, user_id):
+    """
+    Update a task in a single `UPDATE ... WHERE id = ? AND user_id = ?`.
+
+    The task is not loaded first; a new change version is stamped on the
+    row like `assign_versions` does for ORM flushes, reserved within the
+    same statement where the database allows it. On a miss the caller
+    should roll back and use `miss_status` to tell 404 from 403.
+
+    Args:
+        session (Session): The session to write with.
+        task_id (int): ID of the task to update.
+        values (dict): Columns to set.
+        user_role (str): Role of the current user; admins may update any task.
+        user_id (int): ID of the current user.
+
+    Returns:
+        int: The ID of the task's owner, or None if no task was updated.
+    """
+    reserved = reserved_version_cte(session.get_bind().dialect)
+    if reserved is not None:
+        # The subquery runs before the matched row is locked and updated,
+        # so the counter is locked first, as in flushes.
+        version = select(reserved.c.value).scalar_subquery()
+    else:
+        version = reserve_versions(session, 1)
+    statement = update(TaskModel).values(**values, version=version)
+    if reserved is not None:
+        statement = statement.add_cte(reserved)
+    return _execute_owned(
+        session,
+        _owned(statement, task_id, user_role, user_id).execution_options(
+            synchronize_session=False
+        ),
+        task_id,
+        user_role,
+        user_id,
+    )
+
+
+def delete_owned_task(session, task_id, user_role, user_id):
+    """
+    Delete a task in a single `DELETE ... WHERE id = ? AND user_id = ?`.
+
+    A tombstone is recorded for the deleted task like `assign_versions`
+    does for ORM flushes; on PostgreSQL the version reservation, the
+    DELETE and the tombstone are a single statement. On a miss the caller
+    should roll back and use `miss_status` to tell 404 from 403.
+
+    Args:
+        session (Session): The session to write with.
+        task_id (int): ID of the task to delete.
+        user_role (str): Role of the current user; admins may delete any task.
+        user_id (int): ID of the current user.
+
+    Returns:
+        int: The ID of the task's owner, or None if no task was deleted.
+    """
+    reserved = reserved_version_cte(session.get_bind().dialect)
+    if reserved is not None:
+        return session.execute(
+            _delete_with_tombstone(reserved, task_id, user_role, user_id)
+        ).scalar()
+
+    # Reserved before touching the task, in the same lock order as flushes.
+    version = reserve_versions(session, 1)
+    owner = _execute_owned(
+        session,
+        _owned(delete(TaskModel), task_id, user_role, user_id).execution_options(
+            synchronize_session=False
+        ),
+        task_id,
+        user_role,
+        user_id,
+    )
+    if owner is not None:
+        session.execute(
+            insert(TombstoneModel).values(
+                entity="task", entity_id=task_id, user_id=owner, version=version
+            )
+        )
+    return owner
+
+
+def _delete_with_tombstone(reserved, task_id, user_role, user_id):
+    # One statement reserving the version, deleting the task and recording
+    # its tombstone. Filtering the DELETE on the reservation makes it lock
+    # the counter before the task, in the same order as flushes.
+    version = select(reserved.c.value).scalar_subquery()
+    deleted = (
+        _owned(delete(TaskModel), task_id, user_role, user_id)
+        .where(version.is_not(None))
+        .returning(TaskModel.id, TaskModel.user_id)
+        .cte("deleted_task")
+    )
+    return (
+        insert(TombstoneModel)
+        .from_select(
+            ["entity", "entity_id", "user_id", "version"],
+            select(literal("task"), deleted.c.id, deleted.c.user_id, version),
+        )
+        .returning(TombstoneModel.user_id)
+        .add_cte(reserved)
+    )
+
+
+def miss_status(session, task_id):
+    """
+    Explain why a conditional write matched no task.
+
+    Returns:
+        int: 404 if the task does not exist, 403 if it belongs to someone else.
+    """
+    exists = session.scalar(select(TaskModel.id).where(TaskModel.id == task_id))
+    return 404 if exists is None else 403
@@ -1,11 +1,11 @@
 from flask import Blueprint
-from app.modules.user.views import UsersView
+from app.modules.user.views import UsersView, UserListView, UserPurgeView
 
 user_bp = Blueprint("user", __name__, url_prefix="/user", template_folder="templates")
 
 user_bp.add_url_rule(
     "/",
-    view_func=UsersView.as_view("get_all_user_view"),
+    view_func=UserListView.as_view("get_all_user_view"),
     methods=["GET"],
 )
 
@@ -26,3 +26,9 @@ user_bp.add_url_rule(
     view_func=UsersView.as_view("delete_user_view"),
     methods=["DELETE"],
 )
+
+user_bp.add_url_rule(
+    "/<int:user_id>/purge/",
+    view_func=UserPurgeView.as_view("purge_user_view"),
+    methods=["GET"],
+)
@@ -1,10 +1,11 @@
 from app.extensions.docs import docs
 
-from app.modules.user.views import UsersView
+from app.modules.user.views import UsersView, UserListView, UserPurgeView
 
 
 def register_docs():
-    docs.register(UsersView, endpoint="user.get_all_user_view")
+    docs.register(UserListView, endpoint="user.get_all_user_view")
     docs.register(UsersView, endpoint="user.get_user_view")
     docs.register(UsersView, endpoint="user.put_user_view")
     docs.register(UsersView, endpoint="user.delete_user_view")
+    docs.register(UserPurgeView, endpoint="user.purge_user_view")
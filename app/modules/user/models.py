@@ -8,10 +8,16 @@ class UserModel(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(50), unique=True, nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
-    password = db.Column(db.String(128), nullable=False)
+    password = db.Column(db.String(255), nullable=False)
     registered_on = db.Column(db.DateTime, default=datetime.utcnow)
     role = db.Column(db.String(20), default="user")
 
+    # The database deletes the tasks of a deleted user (ON DELETE CASCADE);
+    # the ORM never loads them for that.
     tasks = db.relationship(
-        "TaskModel", backref="user", lazy=True, cascade="all, delete-orphan"
+        "TaskModel",
+        backref="user",
+        lazy=True,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
@@ -0,0 +1,6 @@
+from app.modules.user.models import UserModel
+
+USER_SORT_COLUMNS = {
+    "id": (UserModel.id,),
+    "username": (UserModel.username, UserModel.id),
+}
@@ -1,18 +1,37 @@
-from marshmallow import Schema, fields
+from marshmallow import Schema, fields, validate
 from typing import Type
+
+from app.common.schemas import (
+    FastDumpSchema,
+    PaginationQuerySchema,
+    PaginatedResponseSchema,
+)
 from app.modules.task.schemas import TaskViewResponseSchema as TaskSchema
 
 
-class UserViewResponseSchema(Schema):
+class UserListItemSchema(FastDumpSchema):
     id = fields.Int(dump_only=True)
     username = fields.Str(required=True)
     email = fields.Email(required=True)
-    password = fields.Str(required=True, load_only=True)
     registered_on = fields.DateTime(dump_only=True)
     role = fields.Str(dump_only=True)
+
+
+class UserViewResponseSchema(UserListItemSchema):
+    password = fields.Str(required=True, load_only=True)
     tasks = fields.List(fields.Nested(TaskSchema()), dump_only=True)
 
 
+class UserListQuerySchema(PaginationQuerySchema):
+    sort = fields.Str(load_default="id", validate=validate.OneOf(["id", "username"]))
+
+
+class UserListResponseSchema(PaginatedResponseSchema):
+    # Tasks are left out: a page must cost the same whatever the number of
+    # tasks its users own. They are listed by `GET /user/<id>/` and `/task/`.
+    items = fields.List(fields.Nested(UserListItemSchema()))
+
+
 class UserViewPutRequestSchema(Schema):
     username = fields.String()
     email = fields.String()
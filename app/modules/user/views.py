@@ -1,11 +1,28 @@
+from flask import current_app
 from flask_apispec import use_kwargs, marshal_with, MethodResource, doc
-from werkzeug.security import generate_password_hash
 from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
 
 from app.extensions.db import db
+from app.extensions.hashing import hasher
+from app.common.pagination import paginate
 from app.common.schemas import MessageSchema
+from app.common.signals import user_changed
+from app.modules.task.purge import (
+    count_tasks,
+    delete_entity,
+    latest_purge,
+    send_delete_signals,
+    start_purge,
+)
+from app.modules.job.schemas import JobSchema
 from app.modules.user.models import UserModel
-from app.modules.user.schemas import UserViewResponseSchema, UserViewPutRequestSchema
+from app.modules.user.queries import USER_SORT_COLUMNS
+from app.modules.user.schemas import (
+    UserListQuerySchema,
+    UserListResponseSchema,
+    UserViewResponseSchema,
+    UserViewPutRequestSchema,
+)
 
 
 class UsersView(MethodResource):
@@ -33,14 +50,14 @@ class UsersView(MethodResource):
     @marshal_with(MessageSchema, code=500, description="An error occurred.")
     @marshal_with(MessageSchema, code=404, description="User not found.")
     @marshal_with(MessageSchema, code=403, description="Access denied.")
-    def get(self, user_id=None):
+    def get(self, user_id):
         """
         Retrieve user information.
 
-        If `user_id` is provided, fetches that user's information. Admins can access any user's data, while regular users can only access their own.
+        Admins can access any user's data, while regular users can only access their own.
 
         Args:
-            user_id (int): ID of the user to fetch (optional).
+            user_id (int): ID of the user to fetch.
 
         Returns:
             dict: The user's data or a message indicating the result.
@@ -49,27 +66,15 @@ class UsersView(MethodResource):
         claims = get_jwt()
         user_role = claims["role"]
 
-        if user_id:
-            self.schema.many = False
-            try:
-                user = UserModel.query.get_or_404(user_id)
-                if not user:
-                    return {"message": "User not found"}, 404
-                elif user_role != "admin" or user_id != current_user_id:
-                    return {"message": "Access denied"}, 403
-            except Exception as e:
-                return {"message": f"An error occurred: {str(e)}"}, 500
-            return user, 200
-        else:
-            self.schema.many = True
-            try:
-                if user_role == "admin":
-                    users = UserModel.query.all()
-                else:
-                    users = UserModel.query.filter_by(id=current_user_id).all()
-                return users, 200
-            except Exception as e:
-                return {"message": f"An error occurred: {str(e)}"}, 500
+        try:
+            user = UserModel.query.get_or_404(user_id)
+            if not user:
+                return {"message": "User not found"}, 404
+            elif user_role != "admin" or user_id != current_user_id:
+                return {"message": "Access denied"}, 403
+        except Exception as e:
+            return {"message": f"An error occurred: {str(e)}"}, 500
+        return user, 200
 
     @doc(
         description="Update a user's details. Admins can update any user, while regular users can update only their own data.",
@@ -105,11 +110,15 @@ class UsersView(MethodResource):
         try:
             for key, value in kwargs.items():
                 if key == "password":
-                    value = generate_password_hash(value, method="pbkdf2:sha256")
+                    value = hasher.hash(value)
                 setattr(user, key, value)
             db.session.commit()
         except Exception as e:
             return {"message": f"An error occurred: {str(e)}"}, 500
+
+        user_changed.send(
+            current_app._get_current_object(), action="update", user_id=user_id
+        )
         return user, 201
 
     @doc(
@@ -118,6 +127,12 @@ class UsersView(MethodResource):
     )
     @jwt_required()
     @marshal_with(MessageSchema, code=200, description="User deleted successfully.")
+    @marshal_with(
+        JobSchema,
+        code=202,
+        description="The user has many tasks; the account is deleted in the background.",
+    )
+    @marshal_with(MessageSchema, code=404, description="User not found.")
     @marshal_with(MessageSchema, code=500, description="An error occurred.")
     @marshal_with(MessageSchema, code=403, description="Access denied.")
     def delete(self, user_id):
@@ -125,12 +140,14 @@ class UsersView(MethodResource):
         Delete a user.
 
         Allows admins to delete any user. Regular users can only delete their own account.
+        The user's tasks are deleted with it; above `PURGE_INLINE_LIMIT` tasks this
+        happens in a background purge job, which is returned for polling.
 
         Args:
             user_id (int): ID of the user to delete.
 
         Returns:
-            dict: A message indicating the result of the operation.
+            dict: A message indicating the result of the operation, or the purge job.
         """
         current_user_id = get_jwt_identity()
         claims = get_jwt()
@@ -139,17 +156,119 @@ class UsersView(MethodResource):
         if user_role != "admin" and user_id != current_user_id:
             return {"message": "Access denied"}, 403
 
-        user = UserModel.query.get_or_404(user_id, description="User not found")
+        total = count_tasks(db.session, "user", user_id)
+        if total > current_app.config["PURGE_INLINE_LIMIT"]:
+            job = start_purge(
+                db.session,
+                "user",
+                user_id,
+                total,
+                current_app.config["PURGE_CHUNK_SIZE"],
+                current_user_id,
+            )
+            return job, 202
 
         try:
-            db.session.delete(user)
+            changes = delete_entity(db.session, "user", user_id)
+            if changes is None:
+                return {"message": "User not found"}, 404
             db.session.commit()
         except Exception as e:
+            db.session.rollback()
             return {"message": f"An error occurred: {str(e)}"}, 500
 
+        send_delete_signals(current_app._get_current_object(), "user", user_id, changes)
         return {"message": "User deleted successfully"}, 200
 
 
+class UserPurgeView(MethodResource):
+    """
+    API endpoint reporting the progress of a user's background deletion.
+
+    Permissions:
+    - Admins can follow the deletion of any user.
+    - Regular users can only follow the deletion of their own account.
+    """
+
+    @doc(
+        description="Get the progress of the latest background deletion of a user.",
+        tags=["Users"],
+    )
+    @jwt_required()
+    @marshal_with(JobSchema, code=200, description="Purge job retrieved.")
+    @marshal_with(MessageSchema, code=404, description="No purge job found.")
+    @marshal_with(MessageSchema, code=403, description="Access denied.")
+    def get(self, user_id):
+        """
+        Retrieve the latest purge job of a user.
+
+        Args:
+            user_id (int): ID of the user being deleted.
+
+        Returns:
+            dict: The purge job and its progress.
+        """
+        if get_jwt()["role"] != "admin" and user_id != get_jwt_identity():
+            return {"message": "Access denied"}, 403
+
+        job = latest_purge(db.session, "user", user_id)
+        if job is None:
+            return {"message": "No purge job found"}, 404
+        return job, 200
+
+
+class UserListView(MethodResource):
+    """
+    API endpoint to list users page by page.
+
+    Pages are fetched with keyset (cursor) pagination: each response carries a
+    `next_cursor` that is passed back to fetch the following page.
+
+    Permissions:
+    - Admins can list all users.
+    - Regular users only see their own account.
+    """
+
+    @doc(
+        description="List users. Admins can list all users, while regular users only see their own account.",
+        tags=["Users"],
+    )
+    @jwt_required()
+    @use_kwargs(UserListQuerySchema, location="query")
+    @marshal_with(
+        UserListResponseSchema, code=200, description="Users retrieved successfully."
+    )
+    @marshal_with(MessageSchema, code=400, description="Invalid cursor.")
+    @marshal_with(MessageSchema, code=500, description="An error occurred.")
+    def get(self, limit, sort, cursor=None):
+        """
+        Retrieve a page of users.
+
+        Args:
+            limit (int): Maximum number of users in the page.
+            sort (str): Sort key, either `id` or `username`.
+            cursor (str): Cursor of the page to fetch (optional).
+
+        Returns:
+            dict: The users of the page and the cursor of the next page.
+        """
+        current_user_id = get_jwt_identity()
+        claims = get_jwt()
+        user_role = claims["role"]
+
+        query = UserModel.query
+        if user_role != "admin":
+            query = query.filter_by(id=current_user_id)
+
+        try:
+            users, next_cursor = paginate(query, USER_SORT_COLUMNS[sort], limit, cursor)
+        except ValueError as e:
+            return {"message": str(e)}, 400
+        except Exception as e:
+            return {"message": f"An error occurred: {str(e)}"}, 500
+        return {"items": users, "next_cursor": next_cursor}, 200
+
+
 def create_admin_user(username, email, password):
     """
     Creates an admin user.
@@ -158,7 +277,7 @@ def create_admin_user(username, email, password):
     :param password: password
     :return: UserModel object
     """
-    hashed_password = generate_password_hash(password, method="pbkdf2:sha256")
+    hashed_password = hasher.hash(password)
 
     new_user = UserModel(
         username=username, email=email, password=hashed_password, role="admin"
@@ -0,0 +1,94 @@
+"""
+Compare two API benchmark result files.
+
+Prints the relative change of p50, p95, requests per second and SQL
+statements per request for every scenario present in both files, and
+exits with status 1 if any latency grew (or throughput dropped) by more
+than `--threshold` percent, so it can gate an upgrade in CI.
+
+Usage:
+    python -m benchmarks.compare baseline.json current.json [--threshold 10]
+"""
+
+import argparse
+import json
+import sys
+
+# Metric, and whether a higher value is better.
+METRICS = (("p50_ms", False), ("p95_ms", False), ("rps", True))
+
+
+def change(old, new):
+    if not old or new is None:
+        return None
+    return (new - old) / old * 100
+
+
+def compare(baseline, current, threshold):
+    """
+    Print the changes between two result documents.
+
+    Args:
+        baseline (dict): The reference results.
+        current (dict): The results to check.
+        threshold (float): Regression tolerance, in percent.
+
+    Returns:
+        list: Names of the scenarios that regressed beyond `threshold`.
+    """
+    regressions = []
+    print(f"{'scenario':<18} {'p50':>9} {'p95':>9} {'rps':>9} {'sql':>11}")
+    for name, new in current["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+
+        cells = []
+        regressed = False
+        for metric, higher_is_better in METRICS:
+            delta = change(old[metric], new[metric])
+            if delta is None:
+                cells.append(f"{'-':>9}")
+                continue
+            cells.append(f"{delta:>+8.1f}%")
+            if (-delta if higher_is_better else delta) > threshold:
+                regressed = True
+
+        sql = f"{old['sql_per_request']} -> {new['sql_per_request']}"
+        if old["sql_per_request"] != new["sql_per_request"]:
+            regressed = regressed or (new["sql_per_request"] or 0) > (
+                old["sql_per_request"] or 0
+            )
+        if new["errors"] > old["errors"]:
+            regressed = True
+
+        print(f"{name:<18} {' '.join(cells)} {sql:>11}" + ("  <-" if regressed else ""))
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    if baseline["benchmark"] != current["benchmark"]:
+        parser.error("The files come from different benchmarks.")
+    if baseline["parameters"] != current["parameters"]:
+        print("Warning: the runs used different parameters.", file=sys.stderr)
+
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"Regressed beyond {args.threshold}%: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+In-process micro-benchmark of every API route through the Flask test client.
+
+No network or server is involved, so the numbers isolate the cost of the
+framework, the schemas and the queries. Each scenario runs `--requests`
+sequential requests after a short warm-up; latency percentiles, requests
+per second and SQL statements per request are printed and written to
+`--output` as JSON (compare two files with `benchmarks.compare`).
+
+Usage:
+    python -m benchmarks.endpoints [--tasks 100000] [--requests 200]
+        [--scenario task. auth.login] [--output endpoints.json]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from app import create_app
+from app.extensions.db import db
+from benchmarks.results import Recorder, exit_on_failures, print_table, save
+from benchmarks.scenarios import Exhausted, Workload, select_scenarios
+from benchmarks.seed import add_arguments, ensure_seeded
+
+
+def run(client, scenario, workload, requests, warmup):
+    recorder = Recorder()
+    for i in range(warmup + requests):
+        if i == warmup:
+            recorder = Recorder()
+        try:
+            method, path, headers, body = scenario.build(workload)
+        except Exhausted:
+            break
+        started = time.perf_counter()
+        response = client.open(path, method=method, headers=headers, data=body)
+        response.get_data()
+        elapsed = time.perf_counter() - started
+        response.close()
+        recorder.record(
+            elapsed, response.status_code, response.headers.get("Server-Timing")
+        )
+    recorder.stop()
+    return recorder.summary()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_arguments(parser)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--scenario", nargs="+")
+    parser.add_argument("--output", default="endpoints.json")
+    args = parser.parse_args()
+
+    db_url = args.db_url or f"sqlite:///{tempfile.mkdtemp()}/bench_api.db"
+    # SQL statement counts are read from the Server-Timing header.
+    os.environ["INSTRUMENTATION"] = "1"
+
+    app = create_app(db_url=db_url)
+    with app.app_context():
+        ensure_seeded(args)
+        workload = Workload()
+        db.session.remove()
+
+    client = app.test_client()
+    results = {}
+    for scenario in select_scenarios(args.scenario):
+        results[scenario.name] = run(
+            client, scenario, workload, args.requests, args.warmup
+        )
+        print(f"  {scenario.name}: p50 {results[scenario.name]['p50_ms']} ms")
+
+    print_table(results)
+    parameters = {
+        key: getattr(args, key)
+        for key in ("tasks", "users", "categories", "spares", "requests", "warmup")
+    }
+    save(args.output, "endpoints", parameters, results, db_url)
+    print(f"Results written to {args.output}")
+    exit_on_failures(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Concurrent load test of every API route against a local HTTP server.
+
+The app is served by a threaded Werkzeug server in a separate process (or
+the server at `--url`, e.g. gunicorn, started on the same database), and
+`--concurrency` client threads keep-alive connections hammering one
+scenario at a time for `--duration` seconds. Results are printed and
+written to `--output` as JSON (compare two files with `benchmarks.compare`).
+
+Start an external server with `INSTRUMENTATION=1` to get SQL counts.
+
+Usage:
+    python -m benchmarks.load [--tasks 100000] [--concurrency 16]
+        [--duration 10] [--url http://127.0.0.1:8000] [--output load.json]
+"""
+
+import argparse
+import http.client
+import multiprocessing
+import os
+import socket
+import tempfile
+import threading
+import time
+from urllib.parse import urlsplit
+
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+from app import create_app
+from app.extensions.db import db
+from benchmarks.results import Recorder, exit_on_failures, print_table, save
+from benchmarks.scenarios import Exhausted, Workload, select_scenarios
+from benchmarks.seed import add_arguments, ensure_seeded
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    def log_request(self, *args, **kwargs):
+        pass
+
+
+def serve(db_url, port):
+    # Runs in a fresh process: the server gets its own app and engine.
+    os.environ["INSTRUMENTATION"] = "1"
+    app = create_app(db_url=db_url)
+    server = make_server(
+        "127.0.0.1", port, app, threaded=True, request_handler=QuietRequestHandler
+    )
+    server.serve_forever()
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_up(host, port, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection(host, port, timeout=5)
+            connection.request("GET", "/health/")
+            connection.getresponse().read()
+            connection.close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server at {host}:{port} did not come up.")
+
+
+def run(host, port, scenario, workload, concurrency, duration):
+    recorder = Recorder()
+    deadline = time.perf_counter() + duration
+
+    def worker():
+        connection = http.client.HTTPConnection(host, port, timeout=30)
+        while time.perf_counter() < deadline:
+            try:
+                method, path, headers, body = scenario.build(workload)
+            except Exhausted:
+                break
+            started = time.perf_counter()
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+                response.read()
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                recorder.record(time.perf_counter() - started, 599)
+                continue
+            recorder.record(
+                time.perf_counter() - started,
+                response.status,
+                response.getheader("Server-Timing"),
+            )
+        connection.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    recorder.stop()
+    return recorder.summary()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_arguments(parser)
+    parser.add_argument("--url")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--scenario", nargs="+")
+    parser.add_argument("--output", default="load.json")
+    args = parser.parse_args()
+
+    db_url = args.db_url or f"sqlite:///{tempfile.mkdtemp()}/bench_load.db"
+    if args.url and not args.db_url:
+        parser.error("--url requires the --db-url the server is using")
+
+    # Seeding and token signing happen here, against the same database and
+    # JWT secret as the server.
+    app = create_app(db_url=db_url)
+    with app.app_context():
+        ensure_seeded(args)
+        workload = Workload()
+        db.session.remove()
+
+    server = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        host, port = "127.0.0.1", free_port()
+        context = multiprocessing.get_context("spawn")
+        server = context.Process(target=serve, args=(db_url, port), daemon=True)
+        server.start()
+
+    try:
+        wait_until_up(host, port)
+        results = {}
+        for scenario in select_scenarios(args.scenario):
+            results[scenario.name] = run(
+                host, port, scenario, workload, args.concurrency, args.duration
+            )
+            print(f"  {scenario.name}: {results[scenario.name]['rps']} req/s")
+    finally:
+        if server is not None:
+            server.terminate()
+            server.join()
+
+    print_table(results)
+    parameters = {
+        key: getattr(args, key)
+        for key in ("tasks", "users", "categories", "spares", "concurrency", "duration")
+    }
+    parameters["server"] = args.url or "werkzeug (threaded)"
+    save(args.output, "load", parameters, results, db_url)
+    print(f"Results written to {args.output}")
+    exit_on_failures(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Query throughput against connection pool size.
+
+Runs `--threads` workers issuing a task listing query through the app's
+engine for every pool size given, and reports queries/sec together with
+the pool wait metrics.
+
+Usage:
+    python -m benchmarks.pool --db-url postgresql://... [--sizes 1 2 4 8 16]
+"""
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+
+from sqlalchemy import text
+
+from app import create_app
+from app.extensions.db import db, pool_metrics
+
+QUERY = text("SELECT count(*) FROM tasks WHERE user_id = :user_id")
+
+
+def run(app, threads, duration):
+    stop = time.perf_counter() + duration
+    counts = [0] * threads
+
+    def worker(index):
+        with app.app_context():
+            while time.perf_counter() < stop:
+                db.session.execute(QUERY, {"user_id": index})
+                db.session.remove()
+                counts[index] += 1
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return sum(counts) / duration
+
+
+def measure(db_url, size, threads, duration):
+    # Runs in a fresh process: the app, its engine and the metrics are
+    # built from scratch for every pool size.
+    os.environ["DB_POOL_SIZE"] = str(size)
+    os.environ["DB_MAX_OVERFLOW"] = "0"
+    app = create_app(db_url=db_url)
+    with app.app_context():
+        db.create_all()
+        pool_metrics.reset()
+        rate = run(app, threads, duration)
+        return rate, pool_metrics.snapshot()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--db-url")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=3.0)
+    args = parser.parse_args()
+
+    db_url = args.db_url
+    if db_url is None:
+        db_url = f"sqlite:///{tempfile.mkdtemp()}/bench_pool.db"
+
+    print(f"{'pool':>6} {'queries/s':>12} {'timeouts':>9} {'wait avg ms':>12}")
+    context = multiprocessing.get_context("spawn")
+    for size in args.sizes:
+        with context.Pool(1) as pool:
+            rate, stats = pool.apply(
+                measure, (db_url, size, args.threads, args.duration)
+            )
+
+        checkouts = stats["checkouts"] or 1
+        wait_ms = stats["wait_seconds_total"] / checkouts * 1000
+        print(f"{size:>6} {rate:>12,.0f} {stats['timeouts']:>9} {wait_ms:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Latency summaries and the JSON result files of the API benchmarks.
+"""
+
+import json
+import platform
+import re
+import sys
+import time
+from datetime import datetime, timezone
+from importlib import metadata
+
+# Packages whose upgrades the result files are meant to catch.
+PACKAGES = (
+    "flask",
+    "werkzeug",
+    "flask-apispec",
+    "flask-jwt-extended",
+    "flask-sqlalchemy",
+    "sqlalchemy",
+    "marshmallow",
+    "webargs",
+)
+
+_SQL_COUNT = re.compile(r'sql;[^,]*desc="(\d+) queries"')
+
+
+def sql_count(server_timing):
+    """Read the statement count from a `Server-Timing` header value."""
+    match = _SQL_COUNT.search(server_timing or "")
+    return int(match.group(1)) if match else 0
+
+
+class Recorder:
+    """
+    Collects the outcome of every request of one scenario.
+
+    `record` only appends to lists, which is atomic under the GIL, so one
+    recorder can be shared by all the threads of a load run.
+    """
+
+    def __init__(self):
+        self.latencies = []
+        self.statements = []
+        self.errors = []
+        self.started = time.perf_counter()
+        self.stopped = None
+
+    def record(self, seconds, status, server_timing=None):
+        if status >= 400:
+            self.errors.append(status)
+            return
+        self.latencies.append(seconds)
+        self.statements.append(sql_count(server_timing))
+
+    def stop(self):
+        self.stopped = time.perf_counter()
+
+    def summary(self):
+        """
+        Summarize the recorded requests.
+
+        Returns:
+            dict: Request and error counts, requests per second, latency
+            percentiles in milliseconds and the mean SQL statement count.
+        """
+        elapsed = (self.stopped or time.perf_counter()) - self.started
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+        data = {
+            "requests": count,
+            "errors": len(self.errors),
+            "rps": round(count / elapsed, 1) if elapsed else 0.0,
+            "sql_per_request": (
+                round(sum(self.statements) / count, 2) if count else None
+            ),
+        }
+        for name, q in (("p50", 50), ("p95", 95), ("p99", 99)):
+            data[f"{name}_ms"] = (
+                round(percentile(latencies, q) * 1000, 3) if count else None
+            )
+        data["mean_ms"] = round(sum(latencies) / count * 1000, 3) if count else None
+        if self.errors:
+            data["error_statuses"] = sorted(set(self.errors))
+        return data
+
+
+def percentile(values, q):
+    """Nearest-rank percentile `q` (0-100) of the sorted `values`."""
+    rank = max(1, -(-len(values) * q // 100))
+    return values[int(rank) - 1]
+
+
+def environment(database_url):
+    """Describe the interpreter, package versions and database of a run."""
+    versions = {}
+    for package in PACKAGES:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "database": database_url.split(":", 1)[0],
+        "packages": versions,
+    }
+
+
+def save(path, benchmark, parameters, results, database_url):
+    """
+    Write a benchmark result file.
+
+    Args:
+        path (str): Output file.
+        benchmark (str): Name of the benchmark that produced the results.
+        parameters (dict): The options of the run (dataset size, duration...).
+        results (dict): Scenario name to `Recorder.summary()`.
+        database_url (str): The benchmarked database; only its scheme is kept.
+    """
+    document = {
+        "benchmark": benchmark,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(database_url),
+        "parameters": parameters,
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+        f.write("\n")
+
+
+def exit_on_failures(results):
+    """
+    Exit with status 1 if a scenario had no successful request.
+
+    Its timings would only describe the error path, so comparing the run
+    with another one would be meaningless.
+    """
+    failed = [name for name, data in results.items() if not data["requests"]]
+    if failed:
+        print(f"No successful request: {', '.join(failed)}", file=sys.stderr)
+        sys.exit(1)
+
+
+def print_table(results):
+    print(
+        f"{'scenario':<18} {'requests':>8} {'errors':>6} {'rps':>9} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'sql':>6}"
+    )
+    for name, data in results.items():
+        if not data["requests"]:
+            print(f"{name:<18} {0:>8} {data['errors']:>6}")
+            continue
+        print(
+            f"{name:<18} {data['requests']:>8} {data['errors']:>6} "
+            f"{data['rps']:>9,.1f} {data['p50_ms']:>9.2f} {data['p95_ms']:>9.2f} "
+            f"{data['p99_ms']:>9.2f} {data['sql_per_request']:>6.1f}"
+        )
@@ -0,0 +1,242 @@
+"""
+Requests issued by the API benchmarks, one scenario per route and method.
+
+A scenario builds its next request from a `Workload`, which knows the
+seeded dataset: the tokens to authenticate with, the tasks owned by the
+benchmark user and the spare rows that can be deleted. Scenarios are
+listed read-only first and deleting last, so every scenario sees the
+dataset the seed built.
+
+`GET /task/stream/` is not benchmarked: it never ends by design.
+"""
+
+import itertools
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+from flask_jwt_extended import create_access_token
+from sqlalchemy import select
+
+from app.extensions.db import db
+from app.modules.task.models import CategoryModel, TaskModel
+from app.modules.user.models import UserModel
+from benchmarks.seed import ADMIN, PASSWORD, SPARE_PREFIX, USER
+
+# Tasks of the benchmark user used by reads and updates; the rest of its
+# tasks are deleted.
+HOT_TASKS = 100
+
+
+class Exhausted(Exception):
+    """Raised when a deleting scenario ran out of rows to delete."""
+
+
+class Workload:
+    """
+    Dataset facts the scenarios build requests from.
+
+    Built inside an app context of the benchmarked database; afterwards it
+    only hands out values and is safe to share between threads.
+    """
+
+    def __init__(self):
+        admin = db.session.execute(
+            select(UserModel).where(UserModel.username == ADMIN)
+        ).scalar_one()
+        user = db.session.execute(
+            select(UserModel).where(UserModel.username == USER)
+        ).scalar_one()
+        self.admin_id = admin.id
+        self.user_id = user.id
+        self.headers = {
+            "admin": {"Authorization": f"Bearer {create_access_token(admin)}"},
+            "user": {"Authorization": f"Bearer {create_access_token(user)}"},
+            None: {},
+        }
+
+        task_ids = db.session.scalars(
+            select(TaskModel.id)
+            .where(TaskModel.user_id == user.id)
+            .order_by(TaskModel.id)
+        ).all()
+        self.hot_tasks = task_ids[:HOT_TASKS]
+        self.category_id = db.session.scalar(
+            select(CategoryModel.id)
+            .where(CategoryModel.name.like("bench-category-%"))
+            .order_by(CategoryModel.id)
+        )
+        self.spare_tasks = deque(task_ids[HOT_TASKS:])
+        self.spare_users = deque(
+            db.session.scalars(
+                select(UserModel.id).where(UserModel.username.like(f"{SPARE_PREFIX}%"))
+            ).all()
+        )
+        self.spare_categories = deque(
+            db.session.scalars(
+                select(CategoryModel.id).where(
+                    CategoryModel.name.like(f"{SPARE_PREFIX}%")
+                )
+            ).all()
+        )
+
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def unique(self):
+        """Return a number never returned before, for unique names."""
+        with self._lock:
+            return next(self._counter)
+
+    def hot_task(self):
+        return self.hot_tasks[self.unique() % len(self.hot_tasks)]
+
+    @staticmethod
+    def take(pool):
+        """Pop a spare row id, raising `Exhausted` when none is left."""
+        try:
+            return pool.popleft()
+        except IndexError:
+            raise Exhausted()
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    One benchmarked route.
+
+    `path` and `body` are either constants or callables receiving the
+    `Workload`, called once per request.
+    """
+
+    name: str
+    method: str
+    path: object
+    role: object = "user"
+    body: object = None
+
+    def build(self, workload):
+        """
+        Build the next request.
+
+        Returns:
+            tuple: The method, path, headers and encoded JSON body (or None).
+
+        Raises:
+            Exhausted: If the scenario has no rows left to delete.
+        """
+        path = self.path(workload) if callable(self.path) else self.path
+        body = self.body(workload) if callable(self.body) else self.body
+        headers = dict(workload.headers[self.role])
+        if body is not None:
+            body = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+        return self.method, path, headers, body
+
+
+SCENARIOS = (
+    Scenario("health", "GET", "/health/", role=None),
+    Scenario("category.list", "GET", "/category/"),
+    Scenario("category.get", "GET", lambda w: f"/category/{w.category_id}/"),
+    Scenario("task.list", "GET", "/task/?limit=50"),
+    Scenario("task.list_admin", "GET", "/task/?limit=50", role="admin"),
+    Scenario("task.get", "GET", lambda w: f"/task/{w.hot_task()}/"),
+    Scenario("task.search", "GET", "/task/search/?q=budget+review&limit=20"),
+    Scenario("task.changes", "GET", "/task/changes/?since=0&limit=100"),
+    Scenario("task.stats", "GET", "/task/stats/"),
+    Scenario("task.export", "GET", "/task/export/?format=ndjson"),
+    Scenario("user.list", "GET", "/user/?limit=50", role="admin"),
+    # `UsersView.get` only serves admins reading their own profile.
+    Scenario("user.get", "GET", lambda w: f"/user/{w.admin_id}/", role="admin"),
+    Scenario(
+        "auth.login",
+        "POST",
+        "/auth/login/",
+        role=None,
+        body={"username": USER, "password": PASSWORD},
+    ),
+    Scenario(
+        "auth.sign_up",
+        "POST",
+        "/auth/sign-up/",
+        role=None,
+        body=lambda w: {
+            "username": f"bench-new-{w.unique()}",
+            "email": f"bench-new-{w.unique()}@example.com",
+            "password": PASSWORD,
+        },
+    ),
+    Scenario(
+        "category.create",
+        "POST",
+        "/category/",
+        role="admin",
+        body=lambda w: {"name": f"bench-new-{w.unique()}"},
+    ),
+    Scenario(
+        "task.create",
+        "POST",
+        "/task/",
+        body=lambda w: {
+            "title": "Benchmark task",
+            "description": "Created by the benchmark",
+            "category_id": w.category_id,
+        },
+    ),
+    Scenario(
+        "task.update",
+        "PUT",
+        lambda w: f"/task/{w.hot_task()}/",
+        body=lambda w: {"completed": w.unique() % 2 == 0},
+    ),
+    Scenario(
+        "task.batch",
+        "POST",
+        "/task/batch/",
+        body=lambda w: {
+            "operations": [
+                {"op": "update", "task_id": w.hot_task(), "data": {"title": "Batch"}}
+                for _ in range(10)
+            ]
+        },
+    ),
+    Scenario(
+        "user.update",
+        "PUT",
+        lambda w: f"/user/{w.user_id}/",
+        body=lambda w: {"email": f"bench-user-1-{w.unique()}@example.com"},
+    ),
+    Scenario(
+        "task.delete",
+        "DELETE",
+        lambda w: f"/task/{w.take(w.spare_tasks)}/",
+    ),
+    Scenario(
+        "category.delete",
+        "DELETE",
+        lambda w: f"/category/{w.take(w.spare_categories)}/",
+        role="admin",
+    ),
+    Scenario(
+        "user.delete",
+        "DELETE",
+        lambda w: f"/user/{w.take(w.spare_users)}/",
+        role="admin",
+    ),
+)
+
+
+def select_scenarios(names):
+    """
+    Return the scenarios whose name starts with one of `names`.
+
+    Args:
+        names (list): Scenario names or prefixes (`task.`), or None for all.
+
+    Returns:
+        list: The matching scenarios, in benchmark order.
+    """
+    if not names:
+        return list(SCENARIOS)
+    return [s for s in SCENARIOS if any(s.name.startswith(n) for n in names)]
@@ -0,0 +1,206 @@
+"""
+Seed a database with users, categories and tasks for the API benchmarks.
+
+Rows are written with multi-row INSERTs in batches and stamped with change
+versions, so every endpoint (including `/task/changes/`) sees a dataset
+shaped like one built through the API. Seeding is skipped when the
+database already holds a benchmark dataset, so a large file database can
+be reused across runs.
+
+Usage:
+    python -m benchmarks.seed --db-url sqlite:////tmp/bench.db --tasks 1000000
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, insert, select
+
+from app.extensions.db import db
+from app.extensions.hashing import hasher
+from app.modules.task.models import CategoryModel, TaskModel
+from app.modules.task.sync import reserve_versions
+from app.modules.user.models import UserModel
+
+PASSWORD = "bench-password"
+ADMIN = "bench-admin"
+# The regular user the benchmarks authenticate as.
+USER = "bench-user-1"
+SPARE_PREFIX = "bench-spare-"
+BATCH_SIZE = 5000
+
+WORDS = (
+    "report budget meeting invoice review deploy backup release design "
+    "refactor migrate groceries dentist laundry garden training workshop "
+    "interview contract payment renewal roadmap presentation"
+).split()
+
+
+def _insert(model, rows):
+    # Versions are reserved per batch, exactly like the importer does.
+    for start in range(0, len(rows), BATCH_SIZE):
+        batch = rows[start : start + BATCH_SIZE]
+        first = reserve_versions(db.session, len(batch))
+        for offset, row in enumerate(batch):
+            row["version"] = first + offset
+        db.session.execute(insert(model), batch)
+        db.session.commit()
+
+
+def _text(rng, words):
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def is_seeded():
+    """Return True if the database already holds a benchmark dataset."""
+    return (
+        db.session.execute(
+            select(UserModel.id).where(UserModel.username == ADMIN)
+        ).first()
+        is not None
+    )
+
+
+def seed(users, categories, tasks, spares, seed=0):
+    """
+    Fill the database of the current app context.
+
+    Regular users share the tasks round-robin. `spares` rows of every kind
+    are created on top of that for the benchmarks that delete: users and
+    categories without tasks, and extra tasks owned by `USER`.
+
+    Args:
+        users (int): Number of regular users.
+        categories (int): Number of categories tasks are spread over.
+        tasks (int): Number of tasks.
+        spares (int): Number of deletable users, categories and tasks.
+        seed (int): Seed of the random titles, dates and flags.
+
+    Returns:
+        float: Seconds spent seeding.
+    """
+    started = time.perf_counter()
+    rng = random.Random(seed)
+    password = hasher.hash(PASSWORD)
+    now = datetime.utcnow()
+
+    db.session.execute(
+        insert(UserModel),
+        [
+            dict(
+                username=ADMIN,
+                email=f"{ADMIN}@example.com",
+                password=password,
+                registered_on=now,
+                role="admin",
+            )
+        ]
+        + [
+            dict(
+                username=f"bench-user-{i}",
+                email=f"bench-user-{i}@example.com",
+                password=password,
+                registered_on=now,
+                role="user",
+            )
+            for i in range(1, users + 1)
+        ]
+        + [
+            dict(
+                username=f"{SPARE_PREFIX}{i}",
+                email=f"{SPARE_PREFIX}{i}@example.com",
+                password=password,
+                registered_on=now,
+                role="user",
+            )
+            for i in range(spares)
+        ],
+    )
+    db.session.commit()
+
+    _insert(
+        CategoryModel,
+        [dict(name=f"bench-category-{i}") for i in range(categories)]
+        + [dict(name=f"{SPARE_PREFIX}{i}") for i in range(spares)],
+    )
+
+    user_ids = db.session.scalars(
+        select(UserModel.id)
+        .where(UserModel.username.like("bench-user-%"))
+        .order_by(UserModel.id)
+    ).all()
+    category_ids = db.session.scalars(
+        select(CategoryModel.id)
+        .where(CategoryModel.name.like("bench-category-%"))
+        .order_by(CategoryModel.id)
+    ).all()
+
+    def task(user_id):
+        due = rng.random()
+        return dict(
+            title=_text(rng, 3),
+            description=_text(rng, 12),
+            due_date=now + timedelta(days=rng.uniform(-30, 60)) if due < 0.8 else None,
+            completed=rng.random() < 0.3,
+            user_id=user_id,
+            category_id=rng.choice(category_ids),
+        )
+
+    for start in range(0, tasks + spares, BATCH_SIZE):
+        stop = min(start + BATCH_SIZE, tasks + spares)
+        _insert(
+            TaskModel,
+            [
+                task(user_ids[i % len(user_ids)] if i < tasks else user_ids[0])
+                for i in range(start, stop)
+            ],
+        )
+
+    return time.perf_counter() - started
+
+
+def counts():
+    """Return the number of users, categories and tasks in the database."""
+    return {
+        model.__tablename__: db.session.scalar(select(func.count()).select_from(model))
+        for model in (UserModel, CategoryModel, TaskModel)
+    }
+
+
+def add_arguments(parser):
+    """Add the dataset size options shared by the benchmark commands."""
+    parser.add_argument("--db-url")
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--categories", type=int, default=20)
+    parser.add_argument("--spares", type=int, default=2000)
+
+
+def ensure_seeded(args):
+    """Seed the current app's database from parsed `add_arguments` options."""
+    db.create_all()
+    if is_seeded():
+        print(f"Reusing dataset: {counts()}")
+        return
+    elapsed = seed(args.users, args.categories, args.tasks, args.spares)
+    print(f"Seeded {counts()} in {elapsed:.1f}s")
+
+
+def main():
+    from app import create_app
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_arguments(parser)
+    args = parser.parse_args()
+    if args.db_url is None:
+        parser.error("--db-url is required")
+
+    app = create_app(db_url=args.db_url)
+    with app.app_context():
+        ensure_seeded(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Cold start time: importing the app, `create_app` and the first requests.
+
+Every run starts a fresh interpreter, so nothing is shared between runs,
+and reports the median of each phase. An extra run with `-X importtime`
+lists the modules that are slowest to import.
+
+Usage:
+    python -m benchmarks.startup [--runs 10] [--top 15] [--output startup.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SNIPPET = """
+import json, time
+started = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+app = create_app("sqlite://")
+created = time.perf_counter()
+client = app.test_client()
+client.get("/health/")
+first_request = time.perf_counter()
+client.get("/swagger/")
+docs = time.perf_counter()
+print(json.dumps({
+    "import": imported - started,
+    "create_app": created - imported,
+    "first_request": first_request - created,
+    "first_swagger": docs - first_request,
+}))
+"""
+
+PHASES = ("import", "create_app", "first_request", "first_swagger")
+
+
+def measure(env):
+    output = subprocess.run(
+        [sys.executable, "-c", SNIPPET],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def import_times(env):
+    """
+    Import `app` under `-X importtime`.
+
+    Returns:
+        list: `(module, self_us, cumulative_us)` for every imported module.
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    env.setdefault("JWT_SECRET_KEY", "startup-benchmark")
+
+    runs = [measure(env) for _ in range(args.runs)]
+    medians = {
+        phase: statistics.median(r[phase] for r in runs) * 1000 for phase in PHASES
+    }
+    for phase, ms in medians.items():
+        print(f"{phase:<14} {ms:>9.1f} ms")
+    print(f"{'total':<14} {sum(medians.values()):>9.1f} ms")
+
+    modules = import_times(env)
+    top_level = {}
+    for name, _, cumulative in modules:
+        if "." not in name:
+            top_level[name] = cumulative
+    total_us = top_level.get("app", 0)
+    print(f"\nimport app: {total_us / 1000:.1f} ms; slowest packages (cumulative):")
+    slowest = sorted(top_level.items(), key=lambda item: -item[1])[: args.top]
+    for name, cumulative in slowest:
+        print(f"  {name:<28} {cumulative / 1000:>8.1f} ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "benchmark": "startup",
+                    "runs": args.runs,
+                    "median_ms": medians,
+                    "import_ms": {name: us / 1000 for name, us in slowest},
+                },
+                f,
+                indent=2,
+            )
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
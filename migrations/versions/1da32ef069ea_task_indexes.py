@@ -0,0 +1,28 @@
+"""task indexes
+
+Revision ID: 1da32ef069ea
+Revises: b55366ad9aad
+Create Date: 2026-10-18 04:16:35.196840
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1da32ef069ea'
+down_revision = 'b55366ad9aad'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.create_index('ix_tasks_category_id', ['category_id'], unique=False)
+        batch_op.create_index('ix_tasks_user_id_completed_due_date', ['user_id', 'completed', 'due_date'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_tasks_user_id_completed_due_date')
+        batch_op.drop_index('ix_tasks_category_id')
@@ -0,0 +1,145 @@
+"""cascade task deletes and purge jobs
+
+Revision ID: 2ad831144c4a
+Revises: 38723d357b04
+Create Date: 2026-10-18 05:12:40.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2ad831144c4a'
+down_revision = '38723d357b04'
+branch_labels = None
+depends_on = None
+
+
+# The foreign keys of `tasks` were created unnamed; on SQLite batch mode
+# needs a naming convention to find them, on PostgreSQL they got the
+# default `<table>_<column>_fkey` names.
+NAMING_CONVENTION = {"fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s"}
+SQLITE_FOREIGN_KEYS = {
+    "user_id": "fk_tasks_user_id_users",
+    "category_id": "fk_tasks_category_id_categories",
+}
+POSTGRES_FOREIGN_KEYS = {
+    "user_id": "tasks_user_id_fkey",
+    "category_id": "tasks_category_id_fkey",
+}
+REFERRED_TABLES = {"user_id": "users", "category_id": "categories"}
+
+# Batch mode rebuilds `tasks` on SQLite, which drops its triggers.
+SQLITE_SEARCH_TRIGGERS = [
+    "CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER tasks_fts_update "
+    "AFTER UPDATE OF title, description ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO tasks_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')",
+]
+
+
+def _replace_foreign_keys(ondelete):
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        names = SQLITE_FOREIGN_KEYS
+        batch = op.batch_alter_table("tasks", naming_convention=NAMING_CONVENTION)
+    else:
+        names = POSTGRES_FOREIGN_KEYS
+        batch = op.batch_alter_table("tasks")
+
+    with batch as batch_op:
+        for column, name in names.items():
+            batch_op.drop_constraint(name, type_="foreignkey")
+            batch_op.create_foreign_key(
+                name, REFERRED_TABLES[column], [column], ["id"], ondelete=ondelete
+            )
+
+    if dialect == "sqlite":
+        for statement in SQLITE_SEARCH_TRIGGERS:
+            op.execute(statement)
+
+
+def _delete_orphaned_tasks():
+    # Foreign keys were not enforced on SQLite so far; drop the tasks they
+    # would now reject before the table is rebuilt with them. Like
+    # `purge.delete_tasks`, every deleted task gets a tombstone with a new
+    # change version, so syncing clients learn about the deletion.
+    bind = op.get_bind()
+    orphans = bind.execute(
+        sa.text(
+            "SELECT id, user_id FROM tasks "
+            "WHERE user_id NOT IN (SELECT id FROM users) "
+            "OR category_id NOT IN (SELECT id FROM categories) ORDER BY id"
+        )
+    ).all()
+    if not orphans:
+        return
+
+    bind.execute(
+        sa.text(
+            "INSERT INTO change_counter (id, value) SELECT 1, 0 "
+            "WHERE NOT EXISTS (SELECT 1 FROM change_counter WHERE id = 1)"
+        )
+    )
+    base = bind.execute(
+        sa.text("SELECT value FROM change_counter WHERE id = 1")
+    ).scalar()
+    bind.execute(
+        sa.text(
+            "INSERT INTO tombstones (entity, entity_id, user_id, version) "
+            "VALUES ('task', :entity_id, :user_id, :version)"
+        ),
+        [
+            {"entity_id": task_id, "user_id": user_id, "version": base + i}
+            for i, (task_id, user_id) in enumerate(orphans, start=1)
+        ],
+    )
+    bind.execute(
+        sa.text("UPDATE change_counter SET value = :value WHERE id = 1"),
+        {"value": base + len(orphans)},
+    )
+    bind.execute(
+        sa.text("DELETE FROM tasks WHERE id IN :ids").bindparams(
+            sa.bindparam("ids", expanding=True)
+        ),
+        {"ids": [task_id for task_id, _ in orphans]},
+    )
+
+
+def upgrade():
+    _delete_orphaned_tasks()
+    _replace_foreign_keys("CASCADE")
+
+    op.create_table('purge_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('entity', sa.String(length=20), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.Column('deleted', sa.Integer(), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('purge_jobs', schema=None) as batch_op:
+        batch_op.create_index('ix_purge_jobs_entity_entity_id', ['entity', 'entity_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('purge_jobs', schema=None) as batch_op:
+        batch_op.drop_index('ix_purge_jobs_entity_entity_id')
+
+    op.drop_table('purge_jobs')
+    _replace_foreign_keys(None)
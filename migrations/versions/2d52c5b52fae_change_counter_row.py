@@ -0,0 +1,30 @@
+"""change counter row
+
+Revision ID: 2d52c5b52fae
+Revises: 78cfc81dc35f
+Create Date: 2026-10-18 05:41:40.788199
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2d52c5b52fae'
+down_revision = '78cfc81dc35f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Databases migrated before b541878d7a9b inserted the counter row only
+    # got it on their first write; writes no longer create it.
+    op.execute(
+        "INSERT INTO change_counter (id, value) "
+        "SELECT 1, 0 WHERE NOT EXISTS (SELECT 1 FROM change_counter WHERE id = 1)"
+    )
+
+
+def downgrade():
+    # The row is needed by every revision since b541878d7a9b.
+    pass
@@ -0,0 +1,32 @@
+"""task stats summary
+
+Revision ID: 38723d357b04
+Revises: 732fa4d06023
+Create Date: 2026-10-18 04:41:35.054063
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '38723d357b04'
+down_revision = '732fa4d06023'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('task_stats',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('category_id', sa.Integer(), nullable=True),
+    sa.Column('completed', sa.Boolean(), nullable=False),
+    sa.Column('bucket', sa.String(length=20), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('task_stats')
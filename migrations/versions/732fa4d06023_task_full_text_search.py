@@ -0,0 +1,64 @@
+"""task full-text search
+
+Revision ID: 732fa4d06023
+Revises: b541878d7a9b
+Create Date: 2026-10-18 04:39:11.359319
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '732fa4d06023'
+down_revision = 'b541878d7a9b'
+branch_labels = None
+depends_on = None
+
+
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE tasks_fts USING fts5("
+    "title, description, content='tasks', content_rowid='id', "
+    "tokenize='porter unicode61')",
+    "CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER tasks_fts_update "
+    "AFTER UPDATE OF title, description ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO tasks_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')",
+]
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER tasks_fts_update",
+    "DROP TRIGGER tasks_fts_delete",
+    "DROP TRIGGER tasks_fts_insert",
+    "DROP TABLE tasks_fts",
+]
+POSTGRES_UPGRADE = [
+    "CREATE INDEX ix_tasks_search ON tasks USING gin (("
+    "setweight(to_tsvector('english', coalesce(tasks.title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(tasks.description, '')), 'B')))",
+]
+POSTGRES_DOWNGRADE = [
+    "DROP INDEX ix_tasks_search",
+]
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    statements = {"sqlite": SQLITE_UPGRADE, "postgresql": POSTGRES_UPGRADE}
+    for statement in statements.get(dialect, []):
+        op.execute(statement)
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    statements = {"sqlite": SQLITE_DOWNGRADE, "postgresql": POSTGRES_DOWNGRADE}
+    for statement in statements.get(dialect, []):
+        op.execute(statement)
@@ -0,0 +1,64 @@
+"""version legacy tasks and categories
+
+Revision ID: 78cfc81dc35f
+Revises: 3b9658299062
+Create Date: 2026-10-18 05:26:37.846221
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '78cfc81dc35f'
+down_revision = '3b9658299062'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Rows created before b541878d7a9b were left at version 0, which no
+    # sync ever returns (`version > since` with since >= 0). Give each one
+    # its own version above every version handed out so far: tasks at
+    # `base + id`, categories after the highest task, and move the change
+    # counter past both.
+    bind = op.get_bind()
+    base = bind.execute(
+        sa.text("SELECT value FROM change_counter WHERE id = 1")
+    ).scalar()
+    counter_exists = base is not None
+    base = base or 0
+    max_task = bind.execute(sa.text("SELECT COALESCE(MAX(id), 0) FROM tasks")).scalar()
+    max_category = bind.execute(
+        sa.text("SELECT COALESCE(MAX(id), 0) FROM categories")
+    ).scalar()
+
+    op.execute(
+        sa.text("UPDATE tasks SET version = :base + id WHERE version = 0").bindparams(
+            base=base
+        )
+    )
+    op.execute(
+        sa.text(
+            "UPDATE categories SET version = :base + id WHERE version = 0"
+        ).bindparams(base=base + max_task)
+    )
+
+    value = base + max_task + max_category
+    if counter_exists:
+        op.execute(
+            sa.text("UPDATE change_counter SET value = :value WHERE id = 1").bindparams(
+                value=value
+            )
+        )
+    elif value:
+        op.execute(
+            sa.text(
+                "INSERT INTO change_counter (id, value) VALUES (1, :value)"
+            ).bindparams(value=value)
+        )
+
+
+def downgrade():
+    # The versions are valid data; nothing to undo.
+    pass
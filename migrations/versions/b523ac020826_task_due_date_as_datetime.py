@@ -0,0 +1,68 @@
+"""task due_date as datetime
+
+Revision ID: b523ac020826
+Revises: 1da32ef069ea
+Create Date: 2026-10-18 04:17:07.827724
+
+"""
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b523ac020826'
+down_revision = '1da32ef069ea'
+branch_labels = None
+depends_on = None
+
+
+tasks = sa.table(
+    'tasks',
+    sa.column('id', sa.Integer()),
+    sa.column('due_date', sa.DateTime()),
+)
+
+
+def _parse_due_date(value):
+    # due_date used to be free-form text; keep whatever parses as ISO 8601
+    # and drop the rest rather than failing the migration.
+    try:
+        parsed = datetime.fromisoformat(value.strip())
+    except (AttributeError, ValueError):
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def upgrade():
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text('SELECT id, due_date FROM tasks WHERE due_date IS NOT NULL')
+    ).all()
+    bind.execute(sa.text('UPDATE tasks SET due_date = NULL'))
+
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.alter_column('due_date',
+               existing_type=sa.Text(),
+               type_=sa.DateTime(),
+               existing_nullable=True,
+               postgresql_using='due_date::timestamp')
+
+    for task_id, value in rows:
+        due_date = _parse_due_date(value)
+        if due_date is not None:
+            bind.execute(
+                tasks.update().where(tasks.c.id == task_id).values(due_date=due_date)
+            )
+
+
+def downgrade():
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.alter_column('due_date',
+               existing_type=sa.DateTime(),
+               type_=sa.Text(),
+               existing_nullable=True,
+               postgresql_using='due_date::text')
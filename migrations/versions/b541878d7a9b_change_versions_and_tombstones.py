@@ -0,0 +1,64 @@
+"""change versions and tombstones
+
+Revision ID: b541878d7a9b
+Revises: 2efd9f3ea33f
+Create Date: 2026-10-18 04:36:18.775483
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b541878d7a9b'
+down_revision = '2efd9f3ea33f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    change_counter = op.create_table('change_counter',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('value', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # The single counter row; writes only ever update it.
+    op.bulk_insert(change_counter, [{'id': 1, 'value': 0}])
+    op.create_table('tombstones',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('entity', sa.String(length=20), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('tombstones', schema=None) as batch_op:
+        batch_op.create_index('ix_tombstones_user_id_version', ['user_id', 'version'], unique=False)
+        batch_op.create_index('ix_tombstones_version', ['version'], unique=False)
+
+    with op.batch_alter_table('categories', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.BigInteger(), server_default='0', nullable=False))
+        batch_op.create_index(batch_op.f('ix_categories_version'), ['version'], unique=False)
+
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.BigInteger(), server_default='0', nullable=False))
+        batch_op.create_index('ix_tasks_user_id_version', ['user_id', 'version'], unique=False)
+        batch_op.create_index('ix_tasks_version', ['version'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_tasks_version')
+        batch_op.drop_index('ix_tasks_user_id_version')
+        batch_op.drop_column('version')
+
+    with op.batch_alter_table('categories', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_categories_version'))
+        batch_op.drop_column('version')
+
+    with op.batch_alter_table('tombstones', schema=None) as batch_op:
+        batch_op.drop_index('ix_tombstones_version')
+        batch_op.drop_index('ix_tombstones_user_id_version')
+
+    op.drop_table('tombstones')
+    op.drop_table('change_counter')
@@ -0,0 +1,71 @@
+import os
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret-key-that-is-long-enough")
+
+from app import create_app
+from app.extensions.db import db
+from app.modules.cli.utils import create_admin
+
+PASSWORD = "password"
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = create_app(f"sqlite:///{tmp_path / 'test.db'}")
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all()
+        create_admin("admin", "admin@example.com", PASSWORD)
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def login(client, username):
+    response = client.post(
+        "/auth/login/", json={"username": username, "password": PASSWORD}
+    )
+    return {"Authorization": f"Bearer {response.json['access_token']}"}
+
+
+@pytest.fixture
+def admin_headers(client):
+    return login(client, "admin")
+
+
+@pytest.fixture
+def user_headers(client):
+    client.post(
+        "/auth/sign-up/",
+        json={"username": "user", "email": "user@example.com", "password": PASSWORD},
+    )
+    return login(client, "user")
+
+
+@pytest.fixture
+def count_statements(app):
+    """Context manager collecting the SQL statements run inside it."""
+
+    @contextmanager
+    def count():
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+    return count
@@ -0,0 +1,96 @@
+import fakeredis
+import pytest
+
+from app.extensions.cache import MemoryBackend, RedisBackend
+from app.extensions.cache.cache import Cache
+
+PREFIX = "test:"
+
+
+def memory_backend():
+    return MemoryBackend()
+
+
+def redis_backend():
+    return RedisBackend(fakeredis.FakeRedis(), key_prefix=PREFIX)
+
+
+@pytest.fixture(params=[memory_backend, redis_backend], ids=["memory", "redis"])
+def cache(request):
+    cache = Cache()
+    cache.key_prefix = PREFIX
+    cache.backend = request.param()
+    return cache
+
+
+class Loader:
+    """Counts how often the cache had to load a value."""
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+def test_get_or_set_loads_once(cache):
+    load = Loader({"items": [1, 2], "next_cursor": None})
+
+    assert cache.get_or_set(("tasks",), "page", load) == load.value
+    assert cache.get_or_set(("tasks",), "page", load) == load.value
+    assert load.calls == 1
+    assert cache.get(("tasks",), "other") is None
+
+
+def test_invalidate_bumps_only_its_namespace(cache):
+    cache.set(("tasks",), "page", "tasks")
+    cache.set(("categories",), "page", "categories")
+    cache.set(("tasks", "categories"), "page", "both")
+
+    cache.invalidate("tasks")
+
+    assert cache.get(("tasks",), "page") is None
+    assert cache.get(("tasks", "categories"), "page") is None
+    assert cache.get(("categories",), "page") == "categories"
+
+    load = Loader("reloaded")
+    assert cache.get_or_set(("tasks",), "page", load) == "reloaded"
+    assert load.calls == 1
+
+
+def test_clear_drops_every_entry(cache):
+    cache.set(("tasks",), "page", "tasks")
+
+    cache.clear()
+
+    assert cache.get(("tasks",), "page") is None
+
+
+def test_redis_clear_keeps_other_prefixes():
+    client = fakeredis.FakeRedis()
+    client.set("other:key", "1")
+    backend = RedisBackend(client, key_prefix=PREFIX)
+    backend.set(f"{PREFIX}key", "value")
+
+    backend.clear()
+
+    assert backend.get_many([f"{PREFIX}key"]) == [None]
+    assert client.get("other:key") == b"1"
+
+
+def test_backends_agree():
+    def run(backend):
+        seen = [backend.get_many(["a", "b"])]
+        backend.set("a", {"nested": [1, "two", None]})
+        backend.set("b", 3.5, timeout=60)
+        seen.append(backend.get_many(["a", "b", "c"]))
+        seen.append([backend.incr("n", initial=10), backend.incr("n", initial=10)])
+        backend.clear()
+        seen.append(backend.get_many(["a", "n"]))
+        return seen
+
+    memory = MemoryBackend()
+    redis = RedisBackend(fakeredis.FakeRedis(), key_prefix="")
+    assert run(memory) == run(redis)
@@ -0,0 +1,23 @@
+import pytest
+
+from app.extensions.db import db
+from app.modules.job.queue import HANDLERS, claim, complete, enqueue, job_handler
+
+
+@pytest.fixture
+def limited_job():
+    job_handler("test-limited", concurrency=1)(lambda job: None)
+    yield "test-limited"
+    del HANDLERS["test-limited"]
+
+
+def test_claim_honours_concurrency_across_workers(app, limited_job):
+    first = enqueue(db.session, limited_job).id
+    second = enqueue(db.session, limited_job).id
+    db.session.commit()
+
+    assert claim(db.session, "worker-a", 60) == first
+    assert claim(db.session, "worker-b", 60) is None
+
+    complete(db.session, first, "worker-a", None)
+    assert claim(db.session, "worker-b", 60) == second
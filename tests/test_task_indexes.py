@@ -0,0 +1,57 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from flask_migrate import upgrade
+from sqlalchemy import select, text
+
+from app import create_app
+from app.extensions.db import db
+from app.modules.task.models import TaskModel
+from app.modules.task.queries import filter_tasks
+
+MIGRATIONS = Path(__file__).resolve().parent.parent / "migrations"
+
+
+@pytest.fixture
+def migrated_app(tmp_path):
+    # The indexes must come from the migrations, not only from `create_all`.
+    app = create_app(f"sqlite:///{tmp_path / 'migrated.db'}")
+    with app.app_context():
+        upgrade(directory=str(MIGRATIONS))
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+def query_plan(statement):
+    compiled = statement.compile(
+        dialect=db.engine.dialect, compile_kwargs={"literal_binds": True}
+    )
+    rows = db.session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    return "\n".join(row[-1] for row in rows)
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"completed": False},
+        {"completed": True, "due_after": datetime(2024, 1, 1)},
+    ],
+    ids=["open", "completed-due-after"],
+)
+def test_user_task_list_uses_the_owner_index(migrated_app, filters):
+    statement = filter_tasks(select(TaskModel), "user", 1, **filters).order_by(
+        TaskModel.due_date
+    )
+
+    plan = query_plan(statement)
+    assert "ix_tasks_user_id_completed_due_date" in plan
+    # The index also returns the rows in due date order.
+    assert "TEMP B-TREE" not in plan
+
+
+def test_category_lookup_uses_the_category_index(migrated_app):
+    statement = select(TaskModel.id).where(TaskModel.category_id == 1)
+
+    assert "ix_tasks_category_id" in query_plan(statement)
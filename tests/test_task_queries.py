@@ -0,0 +1,36 @@
+import pytest
+from sqlalchemy import select
+
+from app.extensions.db import db
+from app.modules.task.models import CategoryModel
+
+
+@pytest.fixture
+def tasks(client, admin_headers, user_headers):
+    for i in range(5):
+        client.post("/category/", json={"name": f"category-{i}"}, headers=admin_headers)
+    category_ids = db.session.scalars(select(CategoryModel.id)).all()
+    for i in range(60):
+        response = client.post(
+            "/task/",
+            json={"title": f"task-{i}", "category_id": category_ids[i % 5]},
+            headers=user_headers,
+        )
+        assert response.status_code == 201
+
+
+@pytest.mark.parametrize("sort", ["id", "title"])
+def test_task_list_statements_do_not_grow_with_page_size(
+    client, user_headers, tasks, count_statements, sort
+):
+    counts = {}
+    for limit in (1, 50):
+        with count_statements() as statements:
+            response = client.get(
+                f"/task/?limit={limit}&sort={sort}", headers=user_headers
+            )
+        assert response.status_code == 200
+        assert len(response.json["items"]) == limit
+        counts[limit] = len(statements)
+
+    assert counts[1] == counts[50]
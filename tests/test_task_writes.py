@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.modules.task.sync import reserved_version_cte
+from app.modules.task.writes import _delete_with_tombstone
+
+
+@pytest.fixture
+def task_id(client, admin_headers, user_headers):
+    client.post("/category/", json={"name": "category"}, headers=admin_headers)
+    response = client.post(
+        "/task/", json={"title": "task", "category_id": 1}, headers=user_headers
+    )
+    assert response.status_code == 201
+    return 1
+
+
+def test_task_writes_skip_the_row_load(client, user_headers, task_id, count_statements):
+    # SQLite cannot embed the version reservation in the write, so it stays
+    # a separate counter UPDATE ... RETURNING; the task is never loaded.
+    with count_statements() as statements:
+        response = client.put(
+            f"/task/{task_id}/", json={"title": "renamed"}, headers=user_headers
+        )
+    assert response.status_code == 200
+    assert len(statements) == 2
+
+    with count_statements() as statements:
+        response = client.delete(f"/task/{task_id}/", headers=user_headers)
+    assert response.status_code == 200
+    # Counter, DELETE ... RETURNING and the tombstone.
+    assert len(statements) == 3
+
+
+def test_postgres_reserves_the_version_in_the_write():
+    assert reserved_version_cte(sqlite.dialect()) is None
+
+    reserved = reserved_version_cte(postgresql.dialect())
+    sql = str(
+        _delete_with_tombstone(reserved, 1, "user", 2).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert sql.startswith("WITH reserved_version AS")
+    assert "DELETE FROM tasks" in sql
+    assert "INSERT INTO tombstones" in sql